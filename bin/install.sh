@@ -5,3 +5,6 @@ set -e
 APP_PATH=$(dirname "$(realpath "$0")")/..
 
 pip install -r $APP_PATH/server/requirements.txt --user --break-system-packages
+
+# 대시보드 CSS 와 정적 파일 압축본(.gz/.br) 생성
+python3 $APP_PATH/server/build_static.py
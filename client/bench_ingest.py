@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""모니터 프로토콜 수신 처리량 벤치마크
+
+record_dsm_*.dump 파일의 프레임을 loopback TCP 로 최대 속도로 재생하고
+기존 blocking sock.recv() 방식(before), asyncio StreamReader 방식(stream),
+재사용 버퍼 + sock_recv_into 방식(after, client.FrameReader)의
+frames/sec, recv 1회당 프레임 수, 이벤트 루프 최대 정지 시간을 비교한다.
+
+    python3 bench_ingest.py ../server/simulator/record_dsm_ex_server_20250815a.dump
+"""
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import struct
+import time
+from pathlib import Path
+
+from client import HEAD_LEN, HEADER_STRUCT, open_frame_reader
+
+DEFAULT_DUMP = Path(__file__).parent.parent / 'server' / 'simulator' / 'record_dsm_ex_server_20250815a.dump'
+
+def load_dump_frames(path):
+    """dump 파일에서 모니터 프로토콜 프레임(헤더 포함) 목록 읽기
+
+    dump 레코드: [len(4, BE)] [timestamp ms(4, BE)] [cmd, seq, len(2, BE), data]
+    """
+    data = Path(path).read_bytes()
+    frames = []
+    pos = 0
+    while pos + 8 <= len(data):
+        rec_len, ts = struct.unpack_from('>II', data, pos)
+        if pos + 4 + rec_len > len(data):
+            break
+        if ts != 0:
+            frames.append(data[pos + 8:pos + 4 + rec_len])
+        pos += 4 + rec_len
+    return frames
+
+def start_sender(frames, repeat, burst, delay):
+    """프레임을 repeat 회 전송하는 loopback 송신 프로세스 시작, (port, process) 반환
+
+    delay 가 0 보다 크면 burst 개 프레임마다 delay 초 쉬어 실제 링크처럼 데이터가
+    띄엄띄엄 도착하게 한다 (blocking recv 의 이벤트 루프 정지 확인용).
+    """
+    if delay > 0:
+        chunks = [b''.join(frames[i:i + burst]) for i in range(0, len(frames), burst)]
+    else:
+        chunks = [b''.join(frames)]
+    srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    srv.bind(('127.0.0.1', 0))
+    srv.listen(1)
+    port = srv.getsockname()[1]
+
+    def run():
+        conn, _ = srv.accept()
+        try:
+            for _ in range(repeat):
+                for chunk in chunks:
+                    conn.sendall(chunk)
+                    if delay > 0:
+                        time.sleep(delay)
+        finally:
+            conn.close()
+
+    proc = multiprocessing.get_context('fork').Process(target=run, daemon=True)
+    proc.start()
+    srv.close()
+    return port, proc
+
+async def loop_monitor(stats, interval=0.001):
+    """이벤트 루프가 얼마나 오래 멈췄는지 측정"""
+    last = time.perf_counter()
+    while True:
+        await asyncio.sleep(interval)
+        now = time.perf_counter()
+        stats['max_stall'] = max(stats['max_stall'], now - last - interval)
+        last = now
+
+async def ingest_blocking(port):
+    """기존 client.py 방식: 코루틴 안에서 sock.recv() 호출, bytes += 로 프레임 조립"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+    sock.connect(('127.0.0.1', port))
+    frames = 0
+    try:
+        while True:
+            header = sock.recv(4, socket.MSG_WAITALL)  # 원본은 recv(4): 최대 속도에서 짧게 읽혀 중단됨
+            if len(header) < 4:
+                break
+            cmd, seq, pkt_len = struct.unpack('BBH', header)
+            data_len = socket.ntohs(pkt_len)
+            packet_data = header
+            while data_len > 0:
+                chunk = sock.recv(min(4 * 1024, data_len))
+                if len(chunk) == 0:
+                    return frames
+                packet_data += chunk
+                data_len -= len(chunk)
+            frames += 1
+            await asyncio.sleep(0)  # websocket.send() 자리
+    finally:
+        sock.close()
+    return frames, None
+
+async def ingest_stream(port):
+    """asyncio.open_connection + readexactly 방식: 헤더와 페이로드를 프레임마다 따로 읽음"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    frames = 0
+    try:
+        while True:
+            try:
+                header = await reader.readexactly(HEAD_LEN)
+                cmd, seq, pkt_len = HEADER_STRUCT.unpack(header)
+                if pkt_len:
+                    await reader.readexactly(pkt_len)
+            except asyncio.IncompleteReadError:
+                break
+            frames += 1
+            await asyncio.sleep(0)  # websocket.send() 자리
+    finally:
+        writer.close()
+    return frames, None
+
+async def ingest_recv_into(port):
+    """재사용 버퍼 + sock_recv_into 방식 (client.FrameReader), recv 1회에 여러 프레임 처리"""
+    frame_reader = await open_frame_reader('127.0.0.1', port)
+    frames = 0
+    reads = 0
+    try:
+        while True:
+            batch = await frame_reader.read_frames()
+            if not batch:
+                break
+            reads += 1
+            for cmd, seq, packet_data in batch:
+                frames += 1
+                await asyncio.sleep(0)  # websocket.send() 자리
+    finally:
+        frame_reader.sock.close()
+    return frames, reads
+
+async def run_case(name, ingest, frames, args):
+    port, proc = start_sender(frames, args.repeat, args.burst, args.delay / 1000)
+    stats = {'max_stall': 0.0}
+    monitor = asyncio.create_task(loop_monitor(stats))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    frames, reads = await ingest(port)
+    elapsed = time.perf_counter() - start
+    monitor.cancel()
+    proc.join()
+    per_read = f"{frames / reads:6.1f}" if reads else "     -"
+    print(f"{name:<10} frames={frames:>8} time={elapsed:7.3f}s "
+          f"rate={frames / elapsed:>10.0f} frames/s  frames/recv={per_read}  "
+          f"max loop stall={stats['max_stall'] * 1000:8.1f} ms")
+
+async def main():
+    parser = argparse.ArgumentParser(description='monitor protocol ingest benchmark')
+    parser.add_argument('dump', nargs='?', default=str(DEFAULT_DUMP), help='record_dsm_*.dump file')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='replay count')
+    parser.add_argument('--burst', type=int, default=100, help='frames per burst when --delay is set')
+    parser.add_argument('--delay', type=float, default=0, help='pause between bursts (ms)')
+    args = parser.parse_args()
+
+    frames = load_dump_frames(args.dump)
+    print(f"{args.dump}: {len(frames)} frames, {sum(map(len, frames))} bytes x {args.repeat}")
+
+    await run_case('before', ingest_blocking, frames, args)
+    await run_case('stream', ingest_stream, frames, args)
+    await run_case('after', ingest_recv_into, frames, args)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""MAVLink 디코딩 마이크로벤치마크
+
+record_dsm_*.dump 파일의 평문 프레임(cmd 0x00/0x01/0x04/0x05)을 기존 바이트 단위
+parse_char 방식(before)과 방향별 MavlinkDecoder 일괄 디코딩(after)으로 처리하여
+messages/sec 를 비교한다.
+
+    python3 bench_mavlink.py ../server/simulator/record_dsm_*.dump
+"""
+import argparse
+import time
+
+from pymavlink import mavutil
+
+from bench_ingest import DEFAULT_DUMP, load_dump_frames
+from mavlink_decoder import MavlinkDecoder
+
+PLAINTEXT_SOURCE = {0x00: 'fcc', 0x04: 'fcc', 0x01: 'gcs', 0x05: 'gcs'}
+
+def plaintext_payloads(frames):
+    """(source, 헤더를 제외한 페이로드) 목록"""
+    return [(PLAINTEXT_SOURCE[f[0]], f[4:]) for f in frames if f[0] in PLAINTEXT_SOURCE and len(f) > 4]
+
+def decode_per_byte(payloads):
+    """기존 client.py 방식: 전역 MAVLink 객체 하나에 바이트마다 parse_char 호출"""
+    mav = mavutil.mavlink.MAVLink(None)
+    count = 0
+    errors = 0
+    for source, payload in payloads:
+        for byte_val in payload:
+            try:
+                msg = mav.parse_char(bytes([byte_val]))
+            except Exception:
+                errors += 1  # 원본에서는 이 예외로 monitor_client() 가 재시작됨
+                continue
+            if msg and not isinstance(msg, mavutil.mavlink.MAVLink_unknown):
+                count += 1
+    return count, errors
+
+def decode_batch(payloads):
+    """방향별 MavlinkDecoder 로 페이로드 단위 디코딩"""
+    decoders = {'fcc': MavlinkDecoder(), 'gcs': MavlinkDecoder()}
+    count = 0
+    for source, payload in payloads:
+        count += len(decoders[source].decode(payload))
+    return count, sum(d.errors for d in decoders.values())
+
+def run_case(name, decode, payloads):
+    start = time.perf_counter()
+    count, errors = decode(payloads)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<8} messages={count:>7} errors={errors:>7} time={elapsed:7.3f}s "
+          f"rate={count / elapsed:>10.0f} messages/s")
+
+def main():
+    parser = argparse.ArgumentParser(description='MAVLink decoding micro benchmark')
+    parser.add_argument('dumps', nargs='*', default=[str(DEFAULT_DUMP)], help='record_dsm_*.dump files')
+    args = parser.parse_args()
+
+    for dump in args.dumps:
+        payloads = plaintext_payloads(load_dump_frames(dump))
+        print(f"{dump}: {len(payloads)} plaintext frames, {sum(len(p) for _, p in payloads)} bytes")
+        run_case('before', decode_per_byte, payloads)
+        run_case('after', decode_batch, payloads)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""중계 파이프라인 부하 벤치마크 (load_gen.py -> client.py -> server.py -> 헤드리스 뷰어)
+
+load_gen.py 부하 생성기, client.py, server.py 를 각각 프로세스로 실행하고 뷰어 수마다
+헤드리스 웹소켓 뷰어(대시보드 대신 메시지 수를 세고 timestamp 로 지연 시간을 잰다)를 연결한 뒤
+프레임 속도를 단계별로 올리며 단계마다 다음을 측정한다.
+
+    frames/s    load_gen 이 실제로 보낸 프레임 수 (client.py 가 따라오지 못하면 TCP 가 막혀 목표보다 작아짐)
+    delivered   뷰어가 받은 평문/암호문 패킷 메시지 수 / load_gen 이 보낸 평문/암호문 프레임 수 (가장 적게 받은 뷰어)
+    relay CPU   server.py 프로세스 CPU 사용률 (/proc/<pid>/stat, 100% = 코어 1개, --workers 이면 워커 합계), client CPU 도 함께
+    latency     웹소켓 메시지 첫 메시지의 timestamp(client.py 수신 시각) -> 뷰어 수신 시각 p50/p99
+    dropped     server.py 송신 큐(ClientQueue)가 뷰어에게 보내지 못하고 버린 메시지 수 (/stats)
+
+목표 속도와 delivered 가 95% 이상, 버림 없음, p99 <= --max-latency-ms 이면 유지 가능(sustainable)으로 본다.
+timestamp 는 client.py 가 프레임을 읽은 시각이라 client.py 앞 TCP 버퍼에 밀린 시간은 지연 시간에 들어가지 않으므로
+client.py 가 따라오지 못하는 것은 delivered 로 판단한다 (--topics 로 일부 토픽만 구독하면 delivered 는 보고만 함).
+실패한 단계 뒤에는 밀린 데이터가 다음 단계에 섞이지 않도록 client.py 를 다시 시작한다.
+--ingest 이면 client.py 없이 server.py 가 load_gen 에 직접 연결하고 (INGEST_TARGETS, ingest.py) 실패 뒤에는 server.py 를 다시 시작한다.
+처음 실패할 때까지 속도를 2배씩 올리고 마지막 성공과 실패 사이를 --refine 회 이분 탐색하여
+뷰어 수별 최대 유지 가능 frames/s 와 그때의 relay CPU, 지연 시간을 보고한다.
+
+    python3 bench_relay.py
+    python3 bench_relay.py --viewers 1,10,50 --start-rate 500 --duration 5 --wire-format binary
+    python3 bench_relay.py --viewers 50 --workers 4
+    python3 bench_relay.py --viewers 1,10 --ingest
+    python3 bench_relay.py --relay-mode passthrough --size dump:../server/simulator/record_dsm_ex_server_20250815a.dump --json result.json
+
+부하 생성기, client.py, server.py, 뷰어가 모두 한 호스트에서 돌므로 코어가 적으면 서로 CPU 를 나눠 쓴다.
+"""
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import re
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+import websockets
+
+from load_gen import DEFAULT_MIX, DEFAULT_SIZE, make_generator
+
+SERVER_DIR = Path(__file__).resolve().parent.parent / 'server'
+sys.path.insert(0, str(SERVER_DIR))
+
+from latency import LatencyHistogram, now  # noqa: E402
+
+CLIENT_SCRIPT = Path(__file__).resolve().parent / 'client.py'
+VIEWERS_PER_PROCESS = 25   # 뷰어 프로세스 1개에 연결하는 뷰어 수
+SUSTAIN_RATIO = 0.95       # 목표 대비 실제 전송 속도, 보낸 패킷 대비 뷰어 수신 패킷 하한
+READY_TIMEOUT = 15         # 프로세스/연결 준비 대기 시간 (초)
+LINGER = 0.5               # 측정 구간이 끝난 뒤 뷰어 연결을 유지하는 시간 (초, /stats 를 읽는 동안)
+
+# 뷰어가 받는 메시지 (client.py/server.py 와 같은 정의)
+# server.py 는 토픽별로 묶어 보내므로 웹소켓 메시지 1개의 메시지들은 모두 같은 토픽이다.
+# - text: {"topic": ...} 로 시작하는 JSON 메시지를 '\n' 으로 연결한 배치, 패킷/상태 메시지에 "timestamp": <epoch 초>
+# - binary: 패킷 [kind=0x01, cmd, seq, source, packet_type, link, length(4), timestamp(8)] 또는
+#           배치 [kind=0x02, reserved, count(2)] + 레코드마다 [length(4)] [패킷]
+TIMESTAMP_PATTERN = re.compile(r'"timestamp": ?([0-9.]+)')
+TOPIC_PREFIX = '{"topic": "'
+PACKET_TOPICS = ("plaintext", "ciphertext")
+WIRE_KIND_PACKET = 0x01
+WIRE_KIND_BATCH = 0x02
+WIRE_BATCH_HEADER_SIZE = 8  # 배치 헤더(4) + 첫 레코드 길이(4)
+WIRE_PACKET_TYPES = (1, 2)  # plaintext, ciphertext
+WIRE_TIMESTAMP = struct.Struct('>d')
+WIRE_TIMESTAMP_OFFSET = 10  # 패킷 헤더 안 timestamp 위치
+WIRE_BATCH_COUNT = struct.Struct('>H')
+
+def free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def process_cpu_seconds(pid):
+    """프로세스의 누적 CPU 시간 (user + system, 초), /proc 가 없으면 None"""
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            fields = f.read().rpartition(')')[2].split()
+    except OSError:
+        return None
+    # ')' 뒤 필드: state(0) ... utime(11) stime(12)
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+def process_tree_cpu_seconds(pid):
+    """프로세스와 자식 프로세스(server.py WORKERS 모드의 워커)의 누적 CPU 시간 (초)"""
+    total = process_cpu_seconds(pid)
+    if total is None:
+        return None
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children') as f:
+            children = [int(child) for child in f.read().split()]
+    except OSError:
+        children = []
+    for child in children:
+        total += process_tree_cpu_seconds(child) or 0.0
+    return total
+
+def percent(start, end, elapsed):
+    if start is None or end is None or elapsed <= 0:
+        return None
+    return round((end - start) / elapsed * 100, 1)
+
+def message_sample(data):
+    """웹소켓 메시지 1개 -> (메시지 수, 평문/암호문 패킷 메시지 수, 첫 timestamp 또는 None)"""
+    if isinstance(data, str):
+        count = data.count('\n') + 1
+        packets = 0
+        if data.startswith(TOPIC_PREFIX):
+            topic = data[len(TOPIC_PREFIX):data.find('"', len(TOPIC_PREFIX))]
+            packets = count if topic.endswith(PACKET_TOPICS) else 0
+        match = TIMESTAMP_PATTERN.search(data)
+        return count, packets, float(match.group(1)) if match else None
+    if not data:
+        return 0, 0, None
+    offset, count = 0, 1
+    if data[0] == WIRE_KIND_BATCH:
+        count = WIRE_BATCH_COUNT.unpack_from(data, 2)[0]
+        if not count:
+            return 0, 0, None
+        offset = WIRE_BATCH_HEADER_SIZE
+    if data[offset] != WIRE_KIND_PACKET:
+        return count, 0, None
+    packets = count if data[offset + 4] in WIRE_PACKET_TYPES else 0
+    return count, packets, WIRE_TIMESTAMP.unpack_from(data, offset + WIRE_TIMESTAMP_OFFSET)[0]
+
+# ---------------------------------------------------------------------------
+# 헤드리스 뷰어 (별도 프로세스)
+
+class ViewerStats:
+    """뷰어 프로세스 1개의 측정 구간 집계"""
+
+    def __init__(self, count):
+        self.messages = [0] * count   # 뷰어별 메시지 수
+        self.packets = [0] * count    # 뷰어별 평문/암호문 패킷 메시지 수
+        self.frames = 0               # 웹소켓 메시지 수
+        self.bytes = 0
+        self.latency = LatencyHistogram()
+        self.errors = 0
+
+async def viewer(index, url, topics, window, stats, connected):
+    """뷰어 1개: 연결하여 window (시작, 끝) 안에 받은 메시지를 센다"""
+    async with websockets.connect(url, max_size=None) as ws:
+        await ws.send(json.dumps({"type": "subscribe", "topics": topics}))
+        connected.set()
+        async for data in ws:
+            received = now()
+            start, end = window
+            if start is None or received < start or received >= end:
+                continue
+            count, packets, timestamp = message_sample(data)
+            stats.messages[index] += count
+            stats.packets[index] += packets
+            stats.frames += 1
+            stats.bytes += len(data)
+            if timestamp is not None:
+                stats.latency.add((received - timestamp) * 1000)
+
+async def run_viewer_group(url, count, topics, start_at, duration):
+    stats = ViewerStats(count)
+    window = [None, None]
+    events = [asyncio.Event() for _ in range(count)]
+    tasks = [asyncio.create_task(viewer(i, url, topics, window, stats, events[i])) for i in range(count)]
+    try:
+        # bench 가 모든 뷰어 연결을 확인한 뒤 측정 시작 시각을 정한다
+        while not start_at.value:
+            await asyncio.sleep(0.02)
+            for task in tasks:
+                if task.done() and task.exception():
+                    raise task.exception()
+        window[:] = [start_at.value, start_at.value + duration]
+        await asyncio.sleep(max(0.0, window[1] - now()) + LINGER)
+    except Exception as e:
+        print(f"viewer error: {e}", file=sys.stderr)
+        stats.errors += 1
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return stats
+
+def viewer_process(url, count, topics, start_at, duration, results):
+    results.put(asyncio.run(run_viewer_group(url, count, topics, start_at, duration)))
+
+# ---------------------------------------------------------------------------
+# 부하 생성기 (별도 프로세스, 목표 속도와 전송 수를 공유 메모리로 주고받음)
+
+def generator_process(args, ports, rate, frames, packets, connections):
+    generator = make_generator(0, args.mix, args.size, args.seed)
+
+    async def sync():
+        while True:
+            generator.rate = rate.value
+            frames.value = generator.frames
+            packets.value = generator.packets
+            connections.value = generator.connections
+            await asyncio.sleep(0.02)
+
+    async def run():
+        await asyncio.gather(generator.serve('127.0.0.1', 0, ports.put), sync())
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+# ---------------------------------------------------------------------------
+
+class Pipeline:
+    """load_gen -> client.py -> server.py 프로세스 묶음 (--ingest 이면 load_gen -> server.py)"""
+
+    def __init__(self, args):
+        self.args = args
+        self.ctx = multiprocessing.get_context('fork')
+        self.rate = self.ctx.Value('d', 0.0)
+        self.frames = self.ctx.Value('Q', 0)
+        self.packets = self.ctx.Value('Q', 0)
+        self.connections = self.ctx.Value('i', 0)
+        self.web_port = free_port()
+        self.log_dir = Path(tempfile.mkdtemp(prefix='bench_relay_'))
+        self.processes = []
+        self.generator = None
+        self.client = None
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.web_port}/ws"
+
+    def spawn(self, name, script, env):
+        log = open(self.log_dir / f"{name}.log", 'a')
+        process = subprocess.Popen([sys.executable, str(script)], cwd=script.parent, stdout=log,
+                                   stderr=subprocess.STDOUT, env={**os.environ, "PYTHONUNBUFFERED": "1", **env})
+        log.close()
+        self.processes.append(process)
+        return process
+
+    def start(self):
+        args = self.args
+        ports = self.ctx.Queue()
+        self.generator = self.ctx.Process(target=generator_process, daemon=True,
+                                          args=(args, ports, self.rate, self.frames, self.packets, self.connections))
+        self.generator.start()
+        self.generator_port = ports.get(timeout=READY_TIMEOUT)
+        self.start_server()
+        if not args.ingest:
+            self.start_client()
+
+    def producer_env(self):
+        """client.py 설정 (--ingest 이면 server.py 가 같은 설정으로 client 모듈을 실행)"""
+        return {"WIRE_FORMAT": self.args.wire_format, "RESTART_DELAY": "1", "RECORD_FILE": ""}
+
+    def start_server(self):
+        args = self.args
+        env = {
+            "HOST": "127.0.0.1", "WEB_PORT": str(self.web_port), "WEBSOCKET_PORT": str(self.web_port),
+            "RELAY_MODE": args.relay_mode, "LOG_LEVEL": "WARNING", "LATENCY_METRICS": "1",
+            "WORKERS": str(args.workers), "BUS_PATH": str(self.log_dir / 'bus.sock'),
+        }
+        if args.ingest:
+            env.update(self.producer_env(), INGEST_TARGETS=f"127.0.0.1:{self.generator_port}")
+        self.server = self.spawn("server", SERVER_DIR / 'server.py', env)
+        self.wait_for(lambda: self.server_stats() is not None, "server.py")
+        if args.ingest:
+            self.wait_for(self.producer_ready, "server.py ingest")
+
+    def start_client(self):
+        self.client = self.spawn("client", CLIENT_SCRIPT, {
+            "TARGETS": f"127.0.0.1:{self.generator_port}", "WEBSOCKET_SERVER": self.url, **self.producer_env(),
+        })
+        self.wait_for(self.producer_ready, "client.py")
+
+    def producer_ready(self):
+        stats = self.server_stats()
+        if self.args.ingest:
+            return self.connections.value == 1 and stats is not None
+        return (self.connections.value == 1 and stats is not None
+                and sum(c["producer"] for c in stats["clients"]) == 1)
+
+    def restart_producer(self):
+        """밀린 프레임을 버리기 위해 client.py (--ingest 이면 server.py) 재시작 (TCP 버퍼와 배치 대기열이 함께 사라짐)"""
+        self.rate.value = 0
+        process = self.server if self.args.ingest else self.client
+        self.processes.remove(process)
+        process.terminate()
+        process.wait()
+        self.wait_for(lambda: self.connections.value == 0, "load_gen disconnect")
+        if self.args.ingest:
+            self.start_server()
+        else:
+            self.start_client()
+
+    def wait_for(self, ready, name):
+        deadline = time.monotonic() + READY_TIMEOUT
+        while not ready():
+            for process in self.processes:
+                if process.poll() is not None:
+                    raise RuntimeError(f"{name} not ready: process exited, see {self.log_dir}")
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{name} not ready after {READY_TIMEOUT}s, see {self.log_dir}")
+            time.sleep(0.1)
+
+    def server_stats(self):
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{self.web_port}/stats", timeout=2) as response:
+                return json.loads(response.read())
+        except (OSError, ValueError):
+            return None
+
+    def viewer_clients(self):
+        stats = self.server_stats()
+        return None if stats is None else [c for c in stats["clients"] if not c["producer"]]
+
+    def sample(self):
+        """(시각, server CPU 초, client CPU 초, 보낸 프레임 수, 보낸 평문/암호문 수, 뷰어 송신 큐 버림 수)"""
+        viewers = self.viewer_clients() or []
+        client_cpu = process_cpu_seconds(self.client.pid) if self.client else None
+        return (time.monotonic(), process_tree_cpu_seconds(self.server.pid), client_cpu,
+                self.frames.value, self.packets.value, sum(c["dropped"] for c in viewers))
+
+    def step(self, rate, viewers):
+        """목표 rate 로 viewers 명에게 중계하는 단계 1개 측정"""
+        args = self.args
+        self.rate.value = rate
+        start_at = self.ctx.Value('d', 0.0)
+        results = self.ctx.Queue()
+        # 이전 단계 뷰어가 서버에서 모두 정리된 뒤 연결해야 버림 수 차이가 이번 뷰어만의 값이 된다
+        self.wait_for(lambda: self.viewer_clients() == [], "previous viewers")
+        groups = [min(VIEWERS_PER_PROCESS, viewers - i) for i in range(0, viewers, VIEWERS_PER_PROCESS)]
+        processes = [self.ctx.Process(target=viewer_process, daemon=True,
+                                      args=(self.url, count, args.topics, start_at, args.duration, results))
+                     for count in groups]
+        for process in processes:
+            process.start()
+        try:
+            self.wait_for(lambda: len(self.viewer_clients() or []) == viewers, "viewers")
+            time.sleep(args.warmup)
+
+            before = self.sample()
+            start_at.value = now()
+            time.sleep(args.duration)
+            after = self.sample()
+            stats = [results.get(timeout=READY_TIMEOUT) for _ in processes]
+        finally:
+            for process in processes:
+                process.join(timeout=READY_TIMEOUT)
+                if process.is_alive():
+                    process.terminate()
+
+        elapsed = after[0] - before[0]
+        latency = LatencyHistogram()
+        messages = []
+        packets = []
+        for s in stats:
+            latency.merge(s.latency)
+            messages += s.messages
+            packets += s.packets
+        sent = (after[3] - before[3]) / elapsed
+        sent_packets = after[4] - before[4]
+        delivered = min(packets) / sent_packets if sent_packets else None
+        dropped = after[5] - before[5]
+        summary = latency.summary()
+        result = {
+            "viewers": viewers,
+            "rate": rate,
+            "frames_per_sec": round(sent, 1),
+            "delivered": None if delivered is None else round(delivered, 3),
+            "relay_cpu": percent(before[1], after[1], elapsed),
+            "client_cpu": percent(before[2], after[2], elapsed),
+            "messages_per_sec": round(sum(messages) / len(messages) / elapsed, 1),
+            "min_messages_per_sec": round(min(messages) / elapsed, 1),
+            "websocket_messages_per_sec": round(sum(s.frames for s in stats) / viewers / elapsed, 1),
+            "mbytes_per_sec": round(sum(s.bytes for s in stats) / elapsed / 1e6, 2),
+            "latency_ms": summary,
+            "dropped": dropped,
+            "errors": sum(s.errors for s in stats),
+        }
+        result["ok"] = (sent >= rate * SUSTAIN_RATIO and dropped == 0 and not result["errors"]
+                        and min(messages) > 0 and summary["p99"] is not None
+                        and summary["p99"] <= args.max_latency_ms
+                        and ("*" not in args.topics or (delivered or 0) >= SUSTAIN_RATIO))
+        if not result["ok"]:
+            self.restart_producer()
+        return result
+
+    def close(self):
+        self.rate.value = 0
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if self.generator is not None:
+            self.generator.terminate()
+            self.generator.join()
+
+def format_value(value, unit=""):
+    return "n/a" if value is None else f"{value:g}{unit}"
+
+def print_step(result):
+    latency = result["latency_ms"]
+    print(f"  rate={result['rate']:>8.0f} sent={result['frames_per_sec']:>8.0f}/s "
+          f"delivered={format_value(result['delivered']):>6} "
+          f"relay_cpu={format_value(result['relay_cpu'], '%'):>7} client_cpu={format_value(result['client_cpu'], '%'):>7} "
+          f"viewer={result['messages_per_sec']:>8.0f} msg/s "
+          f"p50={format_value(latency['p50'], 'ms'):>9} p99={format_value(latency['p99'], 'ms'):>9} "
+          f"dropped={result['dropped']:>5} {'ok' if result['ok'] else 'FAIL'}", flush=True)
+
+def find_max_rate(pipeline, viewers, args):
+    """속도를 2배씩 올려 처음 실패하는 단계를 찾고 이분 탐색 -> (최대 유지 가능 단계 또는 None, 모든 단계)"""
+    steps = []
+    best = failed = None
+    rate = args.start_rate
+    while rate <= args.max_rate:
+        result = pipeline.step(rate, viewers)
+        print_step(result)
+        steps.append(result)
+        if not result["ok"]:
+            failed = result
+            break
+        best = result
+        rate *= 2
+    if best and failed:
+        for _ in range(args.refine):
+            rate = math.floor((best["rate"] + failed["rate"]) / 2)
+            if rate <= best["rate"]:
+                break
+            result = pipeline.step(rate, viewers)
+            print_step(result)
+            steps.append(result)
+            if result["ok"]:
+                best = result
+            else:
+                failed = result
+    return best, steps
+
+def main():
+    parser = argparse.ArgumentParser(description='Relay pipeline load benchmark with headless viewers')
+    parser.add_argument('--viewers', default='1,10,50', help='comma separated viewer counts')
+    parser.add_argument('--start-rate', type=float, default=250, help='first frames/sec step')
+    parser.add_argument('--max-rate', type=float, default=64000, help='highest frames/sec step')
+    parser.add_argument('--refine', type=int, default=2, help='bisection steps after the first failure')
+    parser.add_argument('--duration', type=float, default=5, help='measurement seconds per step')
+    parser.add_argument('--warmup', type=float, default=2, help='seconds before each measurement')
+    parser.add_argument('--max-latency-ms', type=float, default=500, help='p99 delivery latency limit')
+    parser.add_argument('--topics', default='*', help='comma separated topics the viewers subscribe to')
+    parser.add_argument('--wire-format', choices=['json', 'binary'], default='json', help='client.py WIRE_FORMAT')
+    parser.add_argument('--relay-mode', choices=['inspect', 'passthrough'], default='inspect',
+                        help='server.py RELAY_MODE')
+    parser.add_argument('--workers', type=int, default=1, help='server.py WORKERS (SO_REUSEPORT worker processes)')
+    parser.add_argument('--ingest', action='store_true',
+                        help='server.py connects to load_gen itself (INGEST_TARGETS) instead of client.py')
+    parser.add_argument('--size', default=DEFAULT_SIZE, help='load_gen payload size distribution')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='load_gen cmd weights')
+    parser.add_argument('--seed', type=int, default=1, help='load_gen random seed')
+    parser.add_argument('--json', help='write all steps and the summary to this file')
+    args = parser.parse_args()
+    args.topics = [topic.strip() for topic in args.topics.split(',') if topic.strip()]
+    try:
+        viewer_counts = [int(v) for v in args.viewers.split(',')]
+        make_generator(0, args.mix, args.size)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    if min(viewer_counts) < 1:
+        parser.error("viewer counts must be positive")
+
+    pipeline = Pipeline(args)
+    print(f"bench_relay: wire_format={args.wire_format} relay_mode={args.relay_mode} workers={args.workers} ingest={args.ingest} "
+          f"size={args.size} "
+          f"mix={args.mix} cpus={os.cpu_count()} logs={pipeline.log_dir}")
+    summary = []
+    steps = []
+    try:
+        pipeline.start()
+        for viewers in viewer_counts:
+            print(f"viewers={viewers}", flush=True)
+            best, viewer_steps = find_max_rate(pipeline, viewers, args)
+            steps += viewer_steps
+            summary.append({"viewers": viewers, "best": best})
+    except KeyboardInterrupt:
+        print("\nStopping bench_relay...")
+    finally:
+        pipeline.close()
+
+    print(f"\n{'viewers':>7} {'max frames/s':>12} {'relay CPU':>9} {'client CPU':>10} "
+          f"{'p50 ms':>8} {'p99 ms':>8} {'msg/s per viewer':>16}")
+    for entry in summary:
+        best = entry["best"]
+        if best is None:
+            print(f"{entry['viewers']:>7} {'< ' + format(args.start_rate, 'g'):>12}")
+            continue
+        print(f"{entry['viewers']:>7} {best['frames_per_sec']:>12.0f} {format_value(best['relay_cpu'], '%'):>9} "
+              f"{format_value(best['client_cpu'], '%'):>10} {format_value(best['latency_ms']['p50']):>8} "
+              f"{format_value(best['latency_ms']['p99']):>8} {best['messages_per_sec']:>16.0f}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({"config": {key: value for key, value in vars(args).items() if key != 'json'},
+                       "summary": summary, "steps": steps}, f, indent=2)
+        print(f"-> {args.json}")
+
+if __name__ == "__main__":
+    main()
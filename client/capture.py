@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""모니터 프로토콜 캡처 파일 기록/색인/읽기
+
+캡처 파일은 sim_mon_srv 가 재생하는 record_dsm_*.dump 와 같은 형식이다.
+
+    레코드: [len(4, BE) = 4 + 프레임 길이] [timestamp ms(4, BE)] [cmd, seq, len(2, BE), data]
+
+timestamp 는 기록 시작 기준 ms 이며, 0 인 레코드는 sim_mon_srv 처럼 건너뛴다.
+옆에 <dump>.idx 색인 파일을 두어 파일 전체를 읽지 않고 시간/프레임 번호로 찾아간다.
+
+    색인: [magic 'DSMI'] [version(1)] [색인한 dump 크기(8, BE)]
+          + 프레임마다 [offset(8, BE)] [timestamp ms(4, BE)] [cmd] [seq]
+"""
+import mmap
+import os
+import struct
+import time
+from bisect import bisect_left
+
+RECORD_HEADER = struct.Struct('>II')
+FRAME_HEADER = struct.Struct('>BBH')
+INDEX_MAGIC = b'DSMI'
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct('>4sBQ')
+INDEX_ENTRY = struct.Struct('>QIBB')
+FLUSH_INTERVAL = 1.0  # 기록 파일 flush 주기 (초)
+
+def index_path(path):
+    return f"{path}.idx"
+
+class DumpRecorder:
+    """수신 프레임을 캡처 파일과 색인 파일에 추가 기록 (append-only)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'ab')
+        self.offset = self.file.tell()
+        self.index = open(index_path(path), 'r+b' if os.path.exists(index_path(path)) else 'w+b')
+        last_ts = self._check_index()
+        # 기존 파일에 이어서 기록하면 timestamp 가 줄어들지 않도록 마지막 값부터 이어감
+        self.started = time.monotonic() - last_ts / 1000
+        self.last_flush = self.started
+        self.frames = 0
+
+    def _check_index(self):
+        """기존 색인이 dump 와 맞지 않으면 다시 만든 뒤 이어서 기록, 마지막 timestamp 반환"""
+        header = self.index.read(INDEX_HEADER.size)
+        valid = False
+        if len(header) == INDEX_HEADER.size:
+            magic, version, indexed = INDEX_HEADER.unpack(header)
+            valid = magic == INDEX_MAGIC and version == INDEX_VERSION and indexed == self.offset
+        if not valid:
+            self.index.close()
+            build_index(self.path)
+            self.index = open(index_path(self.path), 'r+b')
+        end = self.index.seek(0, os.SEEK_END)
+        if end < INDEX_HEADER.size + INDEX_ENTRY.size:
+            return 0
+        self.index.seek(end - INDEX_ENTRY.size)
+        last_ts = INDEX_ENTRY.unpack(self.index.read(INDEX_ENTRY.size))[1]
+        return last_ts
+
+    def write(self, frame):
+        """프레임(헤더 포함) 1개 기록"""
+        # timestamp 0 은 재생에서 건너뛰므로 최소 1 ms
+        ts = max(1, int((time.monotonic() - self.started) * 1000)) & 0xFFFFFFFF
+        self.file.write(RECORD_HEADER.pack(4 + len(frame), ts))
+        self.file.write(frame)
+        self.index.write(INDEX_ENTRY.pack(self.offset, ts, frame[0], frame[1]))
+        self.offset += RECORD_HEADER.size + len(frame)
+        self.frames += 1
+
+        now = time.monotonic()
+        if now - self.last_flush >= FLUSH_INTERVAL:
+            self.flush()
+            self.last_flush = now
+
+    def flush(self):
+        """dump 를 먼저 쓰고 색인 헤더의 dump 크기를 갱신"""
+        self.file.flush()
+        self.index.flush()
+        end = self.index.tell()
+        self.index.seek(0)
+        self.index.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.offset))
+        self.index.seek(end)
+        self.index.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+        self.index.close()
+
+def scan_records(data, pos=0, end=None):
+    """dump 데이터에서 pos 부터 end 전에 시작하는 레코드의 (offset, timestamp, cmd, seq) 추출
+
+    잘린 마지막 레코드는 제외한다. 다음 레코드 위치도 함께 반환한다.
+    """
+    entries = []
+    size = len(data)
+    end = size if end is None else min(end, size)
+    while pos < end and pos + RECORD_HEADER.size + FRAME_HEADER.size <= size:
+        rec_len, ts = RECORD_HEADER.unpack_from(data, pos)
+        if rec_len < 4 + FRAME_HEADER.size or pos + 4 + rec_len > size:
+            break
+        if ts != 0:
+            entries.append((pos, ts, data[pos + 8], data[pos + 9]))
+        pos += 4 + rec_len
+    return entries, pos
+
+def build_index(path):
+    """dump 파일을 한 번 훑어 색인 파일 생성, 프레임 수 반환"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            entries, indexed = [], 0
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                entries, indexed = scan_records(data)
+    with open(index_path(path), 'wb') as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, indexed))
+        f.write(b''.join(INDEX_ENTRY.pack(*entry) for entry in entries))
+    return len(entries)
+
+class DumpReader:
+    """캡처 파일을 mmap 하고 색인으로 임의 위치의 프레임을 읽는다"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.data)
+        self.entries = self._load_index()
+        self.timestamps = [entry[1] for entry in self.entries]
+
+    def _load_index(self):
+        """색인 읽기. 없거나 오래되었으면 (기록 중 추가된 부분까지) 다시 만든다"""
+        try:
+            with open(index_path(self.path), 'rb') as f:
+                raw = f.read()
+            magic, version, indexed = INDEX_HEADER.unpack_from(raw)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION or indexed > len(self.data):
+                raise ValueError(index_path(self.path))
+        except (OSError, ValueError, struct.error):
+            build_index(self.path)
+            return self._load_index()
+        count = (len(raw) - INDEX_HEADER.size) // INDEX_ENTRY.size
+        entries = list(INDEX_ENTRY.iter_unpack(raw[INDEX_HEADER.size:INDEX_HEADER.size + count * INDEX_ENTRY.size]))
+        # 헤더의 dump 크기는 flush 시점 기준: 그 뒤에 쓰인 색인 항목은 버리고 dump 에서 다시 읽음
+        while entries and entries[-1][0] >= indexed:
+            entries.pop()
+        entries += scan_records(self.data, indexed)[0]
+        return entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def frame(self, i):
+        """i 번째 프레임 (timestamp, cmd, seq, 헤더 포함 memoryview)"""
+        offset, ts, cmd, seq = self.entries[i]
+        rec_len = RECORD_HEADER.unpack_from(self.data, offset)[0]
+        return ts, cmd, seq, self.view[offset + 8:offset + 4 + rec_len]
+
+    def find_time(self, ms):
+        """timestamp 가 ms 이상인 첫 프레임 번호"""
+        return bisect_left(self.timestamps, ms)
+
+    def find_seq(self, seq, start=0):
+        """start 번째 프레임부터 seq 가 같은 첫 프레임 번호 (seq 는 8 bit 이므로 반복됨), 없으면 -1"""
+        for i in range(start, len(self.entries)):
+            if self.entries[i][3] == seq:
+                return i
+        return -1
+
+    def close(self):
+        self.entries = []
+        self.view.release()
+        self.data.close()
+        self.file.close()
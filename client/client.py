@@ -7,22 +7,96 @@ import websockets
 import json
 import time
 from dotenv import load_dotenv
-from pymavlink import mavutil
-from pymavlink.dialects.v10.ardupilotmega import MAVLink_unknown
+from mavlink_decoder import MavlinkDecoder, message_json
+from dptm_mon import CMD_TABLE
+from dsm_state import StateTracker, parse_state
+from capture import DumpRecorder
 
 load_dotenv()
 
 TARGET_ADDR = os.getenv('TARGET_ADDR', '127.0.0.1')
 TARGET_PORT = int(os.getenv('TARGET_PORT', 14445))
+TARGETS = os.getenv('TARGETS', '')  # 여러 모니터 대상 "host:port,host:port,..." (순서대로 link 0, 1, ...), 비어 있으면 TARGET_ADDR:TARGET_PORT
 WEBSOCKET_SERVER = os.getenv('WEBSOCKET_SERVER', 'ws://127.0.0.1:8000/ws')
 RESTART_DELAY = int(os.getenv('RESTART_DELAY', 3))  # 재시작 대기 시간 (초)
+RESTART_DELAY_MAX = int(os.getenv('RESTART_DELAY_MAX', 30))  # 연결 실패가 반복될 때 늘어나는 대기 시간 상한 (초)
+WIRE_FORMAT = os.getenv('WIRE_FORMAT', 'json')  # 패킷 전송 형식: json | binary
+BATCH_MAX_COUNT = int(os.getenv('BATCH_MAX_COUNT', 64))  # 웹소켓 메시지 1개에 묶을 최대 메시지 수 (1 = 배치 안 함)
+BATCH_MAX_BYTES = int(os.getenv('BATCH_MAX_BYTES', 32 * 1024))  # 배치 최대 크기 (bytes)
+BATCH_MAX_DELAY = float(os.getenv('BATCH_MAX_DELAY_MS', 20)) / 1000  # 배치 최대 대기 시간 (초)
+RECORD_FILE = os.getenv('RECORD_FILE', '')  # 수신 프레임 기록 파일 (dump 형식 + .idx, 비어 있으면 기록 안 함)
 
 BUFF_LEN = 32 * 1024
-BLOCK_LEN = 4 * 1024
 
-mav = mavutil.mavlink.MAVLink(None)
-mav.srcSystem = 1
-mav.srcComponent = 1
+# 모니터 프로토콜 헤더 (dptm_tls_mon.h: cmd, seq, big-endian len)
+HEAD_LEN = 4
+HEADER_STRUCT = struct.Struct('>BBH')
+
+# 바이너리 패킷 메시지 (WIRE_FORMAT=binary, 웹소켓 binary frame)
+# [kind, cmd, seq, source, packet_type, link, length(4), timestamp(8, float64 초, 수신 시각)] + 원본 패킷
+# length 는 모니터 헤더(4)를 포함한 원본 패킷 길이라 페이로드 최대 길이(65535)보다 클 수 있으므로 4 bytes
+# server.py 와 대시보드 JS(decodeBinaryPacket)에 같은 정의가 있다.
+WIRE_KIND_PACKET = 0x01
+WIRE_HEADER_STRUCT = struct.Struct('>BBBBBBId')
+WIRE_SOURCES = {"unknown": 0, "fcc": 1, "gcs": 2, "dsm": 3}
+WIRE_PACKET_TYPES = {"unknown": 0, "plaintext": 1, "ciphertext": 2, "state": 3}
+MAX_LINKS = 256  # link 번호는 바이너리 헤더의 1 byte
+
+# MAVLink 메시지 목록 (message_json() 결과를 다시 인코딩하지 않고 배열에 이어 붙임)
+# (source, cmd, seq, JSON 객체들, source, link, timestamp)
+MAVLINK_MESSAGE_FORMAT = ('{"topic": "%s.mavlink", "type": "packet", "cmd": %d, "seq": %d, "data": [%s], '
+                          '"packet_type": "mavlink", "source": "%s", "link": %d, "timestamp": %.6f}')
+
+# 메시지의 timestamp: 프레임 수신 시각 (epoch 초). 단조 시계(time.monotonic)를 시작 시점의 epoch 에 맞춰
+# 시스템 시간이 바뀌어도 거꾸로 가지 않고, 서버/대시보드가 구간별 지연 시간을 계산할 수 있다.
+CLOCK_OFFSET = time.time() - time.monotonic()
+
+# 배치 메시지 (BATCH_MAX_COUNT > 1, server.py 와 대시보드 JS 에 같은 정의가 있다)
+# - text: JSON 메시지들을 '\n' 으로 연결 (json.dumps 결과에는 줄바꿈이 없음), 각 줄은 {"topic": ...} 로 시작
+# - binary: [kind=0x02, reserved, count(2)] + 레코드마다 [length(4)] [바이너리 패킷 메시지]
+WIRE_KIND_BATCH = 0x02
+WIRE_BATCH_HEADER_STRUCT = struct.Struct('>BBH')
+WIRE_BATCH_LENGTH_STRUCT = struct.Struct('>I')
+
+# 연결 직후 server.py 에 producer 임을 알리는 메시지 (보내지 않으면 대시보드로 보고 데이터를 중계하지 않음)
+PRODUCER_HELLO = json.dumps({"type": "producer"})
+
+class Target:
+    """모니터 대상 1개 (주소, link 번호, 방향별 MAVLink 파서 상태)"""
+
+    def __init__(self, link, host, port):
+        self.link = link
+        self.host = host
+        self.port = port
+        # 방향(FCC -> GCS, GCS -> FCC)별 MAVLink 파서 상태
+        self.decoders = {
+            "fcc": MavlinkDecoder(),
+            "gcs": MavlinkDecoder(),
+        }
+        self.pings = 0  # 받은 PING(cmd 8) 수, 중계하지 않음
+        self.last_ping = None
+        self.state = StateTracker()  # DSM 상태(cmd 16) 변경분 계산
+
+    def __str__(self):
+        return f"{self.host}:{self.port}"
+
+def parse_targets(value):
+    """TARGETS 문자열 -> [Target] (순서대로 link 0, 1, ...)"""
+    targets = []
+    for item in value.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, port = item.rpartition(':')
+        if not host or not port.isdigit():
+            raise ValueError(f"invalid target '{item}' (expected host:port)")
+        targets.append(Target(len(targets), host, int(port)))
+    if len(targets) > MAX_LINKS:
+        raise ValueError(f"too many targets: {len(targets)} (max {MAX_LINKS})")
+    return targets
+
+# TARGETS 가 없을 때 (replay.py 등 단일 대상) 사용하는 link 0
+default_target = Target(0, TARGET_ADDR, TARGET_PORT)
 
 def format_packet_data(data):
     """패킷 데이터를 출력용으로 포맷팅"""
@@ -35,6 +109,25 @@ def format_packet_data(data):
     #  print([f'{b:02x}' for b in data])
     return [f'{b:02x}' for b in data]
 
+def encode_binary_batch(messages):
+    """바이너리 패킷 메시지 여러 개를 배치 메시지 1개로 인코딩"""
+    parts = [WIRE_BATCH_HEADER_STRUCT.pack(WIRE_KIND_BATCH, 0, len(messages))]
+    for message in messages:
+        parts.append(WIRE_BATCH_LENGTH_STRUCT.pack(len(message)))
+        parts.append(message)
+    return b''.join(parts)
+
+def ingest_time():
+    """프레임 수신 timestamp (epoch 초, 단조 증가)"""
+    return time.monotonic() + CLOCK_OFFSET
+
+def encode_binary_packet(cmd, seq, source, packet_type, packet_data, link=0, timestamp=None):
+    """패킷을 바이너리 메시지로 인코딩 (고정 헤더 + 원본 패킷)"""
+    header = WIRE_HEADER_STRUCT.pack(WIRE_KIND_PACKET, cmd, seq,
+                                     WIRE_SOURCES[source], WIRE_PACKET_TYPES[packet_type], link,
+                                     len(packet_data), ingest_time() if timestamp is None else timestamp)
+    return header + packet_data
+
 async def send_to_websocket(websocket, message):
     """웹소켓으로 메시지 전송"""
     try:
@@ -45,128 +138,374 @@ async def send_to_websocket(websocket, message):
         print(f"WebSocket send error: {e}")
         raise  # 예외를 다시 발생시켜 상위에서 처리하도록 함
 
-async def monitor_client():
-    """모니터링 클라이언트 메인 함수"""
-    websocket = None
+async def drain_websocket(websocket):
+    """서버가 보내는 메시지를 읽어 버림, 연결이 닫히면 반환
+
+    읽지 않으면 수신 큐가 차서 websockets 가 소켓 읽기를 멈추고 ping 응답(pong)도 처리하지 못해
+    keepalive 시간이 지나면 연결이 끊긴다.
+    """
+    try:
+        async for _ in websocket:
+            pass
+    except websockets.ConnectionClosed:
+        pass
+
+class SharedWebsocket:
+    """여러 대상 task 가 함께 쓰는 웹소켓 연결
+
+    run() 이 연결을 유지하고 끊기면 backoff 후 다시 연결한다. 연결이 없는 동안 보내는 메시지는 버리므로
+    웹소켓 서버 문제로 대상 task 가 재시작되지 않는다. websocket.send() 와 같은 send() 를 제공한다.
+    """
+
+    def __init__(self, url):
+        self.url = url
+        self.websocket = None
+        self.connected = asyncio.Event()
+        self.generation = 0  # 연결 번호 (다시 연결할 때마다 증가, StateTracker 가 전체 상태를 다시 보내는 기준)
+        self.dropped = 0  # 연결이 없어 버린 메시지 수
+
+    async def run(self):
+        delay = RESTART_DELAY
+        while True:
+            try:
+                print(f"Connecting to WebSocket server: {self.url}")
+                self.websocket = await websockets.connect(self.url)
+                await self.websocket.send(PRODUCER_HELLO)
+                print("WebSocket connected")
+                delay = RESTART_DELAY
+                self.generation += 1
+                self.connected.set()
+                await drain_websocket(self.websocket)
+                print("WebSocket connection closed")
+            except (OSError, websockets.WebSocketException) as e:
+                print(f"WebSocket error: {e}")
+            self.connected.clear()
+            self.websocket = None
+            print(f"Reconnecting WebSocket in {delay} seconds... (dropped {self.dropped} messages)")
+            await asyncio.sleep(delay)
+            delay = min(max(delay * 2, 1), RESTART_DELAY_MAX)
+
+    async def send(self, message):
+        websocket = self.websocket
+        if websocket is None:
+            self.dropped += 1
+            return
+        try:
+            await websocket.send(message)
+        except websockets.ConnectionClosed:
+            self.dropped += 1
+
+    async def close(self):
+        if self.websocket:
+            await self.websocket.close()
+
+class MessageBatcher:
+    """웹소켓 송신 배치
+
+    text/binary 메시지를 따로 모아 개수(max_count), 크기(max_bytes), 첫 메시지 이후 대기 시간(max_delay)
+    중 하나에 도달하면 배치 메시지 1개로 보낸다. 모인 메시지가 1개이면 원래 메시지 그대로 보낸다.
+    websocket.send() 와 같은 send() 를 제공하므로 handle_frame() 에 웹소켓 대신 넘길 수 있다.
+    """
+
+    def __init__(self, websocket, max_count=BATCH_MAX_COUNT, max_bytes=BATCH_MAX_BYTES, max_delay=BATCH_MAX_DELAY):
+        self.websocket = websocket
+        self.connected = getattr(websocket, 'connected', None)
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.text = []
+        self.text_bytes = 0
+        self.binary = []
+        self.binary_bytes = 0
+        self.timer = None
+        self.flush_task = None
+        self.messages = 0  # 받은 메시지 수
+        self.sends = 0     # 실제 웹소켓 전송 수
+
+    @property
+    def generation(self):
+        """감싼 웹소켓의 연결 번호 (SharedWebsocket.generation)"""
+        return getattr(self.websocket, 'generation', 0)
+
+    async def send(self, message):
+        self.messages += 1
+        if isinstance(message, str):
+            self.text.append(message)
+            self.text_bytes += len(message) + 1
+            if len(self.text) >= self.max_count or self.text_bytes >= self.max_bytes:
+                await self._flush_text()
+        else:
+            self.binary.append(message)
+            self.binary_bytes += len(message) + WIRE_BATCH_LENGTH_STRUCT.size
+            if len(self.binary) >= self.max_count or self.binary_bytes >= self.max_bytes:
+                await self._flush_binary()
+        if (self.text or self.binary) and self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(self.max_delay, self._on_timer)
+
+    def _on_timer(self):
+        self.timer = None
+        self.flush_task = asyncio.ensure_future(self.flush())
+
+    async def _flush_text(self):
+        messages = self.text
+        self.text = []
+        self.text_bytes = 0
+        if messages:
+            self.sends += 1
+            await self.websocket.send(messages[0] if len(messages) == 1 else '\n'.join(messages))
+
+    async def _flush_binary(self):
+        messages = self.binary
+        self.binary = []
+        self.binary_bytes = 0
+        if messages:
+            self.sends += 1
+            await self.websocket.send(messages[0] if len(messages) == 1 else encode_binary_batch(messages))
+
+    async def flush(self):
+        """모인 메시지를 모두 전송"""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        await self._flush_text()
+        await self._flush_binary()
+
+class FrameReader:
+    """재사용 수신 버퍼 기반 모니터 프로토콜 프레임 수신기
 
+    미리 할당한 bytearray 에 sock_recv_into 로 최대 BUFF_LEN 만큼 한 번에 읽고,
+    버퍼 안의 완성된 프레임들을 복사 없이 memoryview 슬라이스로 돌려준다.
+    반환된 슬라이스는 다음 read_frames() 호출 전까지만 유효하다.
+    """
+
+    def __init__(self, sock, size=BUFF_LEN):
+        self.sock = sock
+        self.loop = asyncio.get_running_loop()
+        self.buf = bytearray(size)
+        self.view = memoryview(self.buf)
+        self.start = 0  # 처리하지 않은 데이터 시작 위치
+        self.end = 0    # 수신된 데이터 끝 위치
+        self.need = HEAD_LEN  # 다음 프레임 완성에 필요한 바이트 수
+
+    def _compact(self):
+        """남은 미완성 프레임을 버퍼 앞으로 옮기고, 프레임이 버퍼보다 크면 버퍼 확장"""
+        remain = self.end - self.start
+        if self.need > len(self.buf):
+            size = len(self.buf)
+            while size < self.need:
+                size *= 2
+            buf = bytearray(size)
+            buf[:remain] = self.view[self.start:self.end]
+            self.buf = buf
+            self.view = memoryview(buf)
+        elif self.start:
+            self.view[:remain] = self.view[self.start:self.end]
+        self.start = 0
+        self.end = remain
+
+    async def read_frames(self):
+        """완성된 프레임 목록 [(cmd, seq, 헤더 포함 memoryview)] 반환, 연결 종료 시 빈 목록"""
+        if self.start:
+            self._compact()
+        while True:
+            if self.need > len(self.buf) - self.start:
+                self._compact()
+            n = await self.loop.sock_recv_into(self.sock, self.view[self.end:])
+            if n == 0:
+                return []
+            self.end += n
+
+            frames = []
+            pos = self.start
+            while self.end - pos >= HEAD_LEN:
+                cmd, seq, pkt_len = HEADER_STRUCT.unpack_from(self.buf, pos)
+                frame_end = pos + HEAD_LEN + pkt_len
+                if frame_end > self.end:
+                    break
+                frames.append((cmd, seq, self.view[pos:frame_end]))
+                pos = frame_end
+            self.start = pos
+            self.need = HEAD_LEN + pkt_len if self.end - pos >= HEAD_LEN else HEAD_LEN
+            if frames:
+                return frames
+
+async def open_frame_reader(host, port):
+    """모니터 서버에 비동기 연결하고 FrameReader 반환"""
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+    sock.setblocking(False)
     try:
-        # 웹소켓 서버 연결
-        print(f"Connecting to WebSocket server: {WEBSOCKET_SERVER}")
-        websocket = await websockets.connect(WEBSOCKET_SERVER)
-        print("WebSocket connected")
+        await loop.sock_connect(sock, (host, port))
+    except BaseException:
+        sock.close()
+        raise
+    return FrameReader(sock)
+
+async def handle_frame(websocket, cmd, seq, packet_data, target=default_target, timestamp=None):
+    """수신한 프레임 1개를 분류하여 웹소켓으로 전송 (target.link 를 붙이고 target 의 MAVLink 파서 사용)
+
+    packet_data 는 FrameReader 버퍼의 memoryview 이므로 이 함수 안에서만 사용한다.
+    timestamp 는 프레임 수신 시각 (ingest_time(), 없으면 지금)이며 모든 메시지에 붙인다.
+    text 메시지에서는 마지막 키여야 한다 (server.py text_timestamp() 가 json.loads 없이 끝부분에서 읽음).
+    """
+    if timestamp is None:
+        timestamp = ingest_time()
+    info = CMD_TABLE[cmd]
+    source = info.source
+    packet_type = info.packet_type
+
+    if packet_type == "ping":
+        # 모니터 연결 확인용 프레임: 기록만 하고 중계하지 않음
+        target.pings += 1
+        target.last_ping = time.monotonic()
+        return
 
-        # TCP 소켓 생성 및 연결
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
-        print(f"Connecting to {TARGET_ADDR}:{TARGET_PORT}...", end="")
-        sock.connect((TARGET_ADDR, TARGET_PORT))
-        print("ok.")
+    if packet_type == "state":
+        await handle_state(websocket, seq, packet_data, target, timestamp)
+        return
 
+    # 패킷 출력 및 웹소켓 전송
+    if WIRE_FORMAT == "binary":
+        await websocket.send(encode_binary_packet(cmd, seq, source, packet_type, packet_data, target.link, timestamp))
+        formatted_data = None
+    else:
+        formatted_data = format_packet_data(packet_data)
+
+    if formatted_data is not None:
         await send_to_websocket(websocket, {
+            "topic": info.topic,
+            "type": "packet",
+            "cmd": cmd,
+            "seq": seq,
+            "length": len(packet_data),
+            "data": formatted_data,
+            "packet_type": packet_type,
+            "source": source,
+            "link": target.link,
+            "timestamp": timestamp
+        })
+
+    # 평문 페이로드 -> MAVLink JSON 메시지
+    if info.mavlink and len(packet_data) > 4:
+        mavlink_data = packet_data[4:]  # 헤더(4 bytes) 제거
+        messages = [message_json(msg) for msg in target.decoders[source].decode(mavlink_data)]
+        if messages:
+            await websocket.send(MAVLINK_MESSAGE_FORMAT % (source, cmd, seq, ', '.join(messages), source, target.link,
+                                                              timestamp))
+
+async def handle_state(websocket, seq, packet_data, target, timestamp):
+    """DSM 상태 프레임 -> 바뀐 필드만 담은 state 메시지 (바뀐 필드가 없으면 보내지 않음)
+
+    full 이 true 이면 fields 가 전체 상태이고, false 이면 이전 상태에 덮어쓸 변경분이다.
+    """
+    state = parse_state(packet_data[4:])
+    if state is None:
+        print(f"[link {target.link}] Invalid state payload ({len(packet_data) - HEAD_LEN} bytes)")
+        return
+    full, fields = target.state.update(state, time.monotonic(), getattr(websocket, 'generation', 0))
+    if not fields:
+        return
+    await send_to_websocket(websocket, {
+        "topic": "state",
+        "type": "state",
+        "seq": seq,
+        "full": full,
+        "fields": fields,
+        "link": target.link,
+        "timestamp": timestamp
+    })
+
+async def monitor_client(target, websocket, recorder=None):
+    """대상 1개에 연결하여 연결이 끊길 때까지 프레임 중계
+
+    연결하지 못하면 예외를 발생시키고, 연결된 뒤 끊기면 반환한다.
+    """
+    # TCP 연결 (논블로킹 소켓, 이벤트 루프를 블로킹하지 않음)
+    print(f"[link {target.link}] Connecting to {target}...")
+    frame_reader = await open_frame_reader(target.host, target.port)
+    print(f"[link {target.link}] Connected to {target}")
+    target.state.reset()
+
+    try:
+        await send_to_websocket(websocket, {
+            "topic": "status",
             "type": "status",
-            "message": f"Connected to {TARGET_ADDR}:{TARGET_PORT}"
+            "link": target.link,
+            "message": f"Connected to {target}"
         })
 
         while True:
-            #asyncio.sleep(0.1)
-            # 헤더 읽기 (4 bytes)
-            header = sock.recv(4)
-            if len(header) < 4:
-                print(f"recv: head error....ret={len(header)}")
+            frames = await frame_reader.read_frames()
+            if not frames:
+                print(f"[link {target.link}] recv: connection closed")
                 break
 
-            cmd, seq, pkt_len = struct.unpack('BBH', header)
-            pkt_len = socket.ntohs(pkt_len)
-            #print(f"read head cmd={cmd} seq={seq} pkt_len={pkt_len}")
-
-            # 패킷 데이터 읽기
-            data_len = pkt_len
-            packet_data = header
-
-            while data_len > 0:
-                read_len = min(BLOCK_LEN, data_len)
-                chunk = sock.recv(read_len)
-                if len(chunk) == 0:
-                    print(f"recv: data error....len={read_len}")
-                    return
-                packet_data += chunk
-                data_len -= len(chunk)
-
-            # 패킷 출력 및 웹소켓 전송
-            formatted_data = format_packet_data(packet_data)
-            #print(f"Packet received (len={len(packet_data)}):")
-            #  print(formatted_data)
-
-            packet_type = "unknown"
-            source = "unknown"
-            if cmd == 0x01 or cmd == 0x05:
-                packet_type = "plaintext"
-                source = "gcs"
-            if cmd == 0x03 or cmd == 0x07:
-                packet_type = "ciphertext"
-                source = "gcs"
-            if cmd == 0x02 or cmd == 0x06:
-                packet_type = "ciphertext"
-                source = "fcc"
-            if cmd == 0x00 or cmd == 0x04:
-                packet_type = "plaintext"
-                source = "fcc"
-            if cmd == 16:
-                packet_type = "state"
-                source = "dsm"
-                formatted_data = str(packet_data[4:])
-
-            await send_to_websocket(websocket, {
-                "type": "packet",
-                "cmd": cmd,
-                "seq": seq,
-                "length": len(packet_data),
-                "data": formatted_data,
-                "packet_type": packet_type,
-                "source": source
-            })
-
-            # convert packet_data to mavlink json messages
-            if (cmd == 0x00 or cmd == 0x04 or cmd == 0x01 or cmd == 0x05) and len(packet_data) > 4:
-                mavlink_data = packet_data[4:]  # 헤더(4 bytes) 제거
-                messages = []
-
-                for byte_val in mavlink_data:
-                    msg = mav.parse_char(bytes([byte_val]))
-                    if msg and not isinstance(msg, MAVLink_unknown):
-                        messages.append(msg.to_json())
-
-                if messages:
-                    await send_to_websocket(websocket, {
-                        "type": "packet",
-                        "cmd": cmd,
-                        "seq": seq,
-                        "data": messages,
-                        "packet_type": "mavlink",
-                        "source": source
-                    })
-                    #print(f"Parsed {len(messages)} MAVLink messages")
+            # 같은 recv 로 읽은 프레임은 같은 수신 시각
+            timestamp = ingest_time()
+            for cmd, seq, packet_data in frames:
+                if recorder:
+                    recorder.write(packet_data)
+                await handle_frame(websocket, cmd, seq, packet_data, target, timestamp)
 
-
-    except KeyboardInterrupt:
-        print("\nStopping client...")
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"[link {target.link}] Error: {e}")
     finally:
-        if websocket:
-            await websocket.close()
+        frame_reader.sock.close()
 
-async def main():
-    """메인 함수 - 클라이언트 재시작 로직 포함"""
+    await send_to_websocket(websocket, {
+        "topic": "status",
+        "type": "status",
+        "link": target.link,
+        "message": f"Disconnected from {target}"
+    })
+
+async def monitor_target(target, websocket, recorder=None):
+    """대상 1개의 재연결 루프 - 대상마다 backoff 가 따로 있어 다른 대상에 영향을 주지 않음"""
+    delay = RESTART_DELAY
     while True:
+        # 웹소켓 서버에 연결된 뒤에 대상에 연결 (연결 중 웹소켓이 끊기면 그동안의 메시지는 버림)
+        await websocket.connected.wait()
         try:
-            await monitor_client()
-        except KeyboardInterrupt:
-            print("\nStopping client...")
-            break
+            await monitor_client(target, websocket, recorder)
+            delay = RESTART_DELAY
         except Exception as e:
-            print(f"Client error: {e}")
-            print(f"Restarting client in {RESTART_DELAY} seconds...")
-            await asyncio.sleep(RESTART_DELAY)
+            print(f"[link {target.link}] Client error: {e}")
+        print(f"[link {target.link}] Restarting in {delay} seconds...")
+        await asyncio.sleep(delay)
+        delay = min(max(delay * 2, 1), RESTART_DELAY_MAX)
+
+def record_path(path, link, count):
+    """대상이 여러 개이면 link 별 기록 파일 (capture.dump -> capture.link1.dump)"""
+    if count == 1:
+        return path
+    base, ext = os.path.splitext(path)
+    return f"{base}.link{link}{ext}"
+
+async def main():
+    """메인 함수 - 대상별 reader task 와 공유 웹소켓 연결 실행"""
+    targets = parse_targets(TARGETS) if TARGETS else [default_target]
+    websocket = SharedWebsocket(WEBSOCKET_SERVER)
+    sender = MessageBatcher(websocket) if BATCH_MAX_COUNT > 1 else websocket
+
+    # 재연결해도 같은 파일에 이어서 기록
+    recorders = {}
+    if RECORD_FILE:
+        for target in targets:
+            path = record_path(RECORD_FILE, target.link, len(targets))
+            recorders[target.link] = DumpRecorder(path)
+            print(f"[link {target.link}] Recording frames to {path}")
+    try:
+        await asyncio.gather(websocket.run(),
+                             *(monitor_target(target, sender, recorders.get(target.link)) for target in targets))
+    finally:
+        for recorder in recorders.values():
+            recorder.close()
+        if sender is not websocket:
+            await sender.flush()
+        await websocket.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nStopping client...")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""모니터 프로토콜 cmd 정의 (server/simulator/dptm_tls_mon.h)
+
+헤더의 DPTM_MON_BIT_* / DPTM_MON_CMD_* 값을 옮기고, cmd 값(0-255)으로 바로 찾는
+분류 표 CMD_TABLE 을 한 번 만들어 둔다. 프레임마다 if 비교를 하지 않고 CMD_TABLE[cmd] 만 읽는다.
+"""
+from collections import namedtuple
+
+DPTM_MON_BIT_RECV = 0
+DPTM_MON_BIT_SEND = 1
+DPTM_MON_BIT_ENCRYPT = 2
+DPTM_MON_BIT_PACKET = 4
+DPTM_MON_BIT_PING = 8
+
+DPTM_MON_CMD_RECV = 0
+DPTM_MON_CMD_SEND = 1
+DPTM_MON_CMD_ENC_RECV = 2
+DPTM_MON_CMD_ENC_SEND = 3
+DPTM_MON_CMD_PKT_RECV = 4
+DPTM_MON_CMD_PKT_SEND = 5
+DPTM_MON_CMD_PKT_ENC_RECV = 6
+DPTM_MON_CMD_PKT_ENC_SEND = 7
+DPTM_MON_CMD_PING = 8
+DPTM_MON_CMD_STATE = 16
+DPTM_MON_CMD_TYPE_MAX = DPTM_MON_CMD_STATE
+
+# name: mon_print.c 의 출력 이름, topic: 웹소켓 토픽, mavlink: 페이로드를 MAVLink 로 디코딩할지 (평문)
+CmdInfo = namedtuple('CmdInfo', 'name source packet_type topic mavlink')
+
+def cmd_info(cmd):
+    """cmd 값 -> CmdInfo (송신(SEND) 비트: GCS -> FCC, 암호화(ENCRYPT) 비트: 암호문)"""
+    if cmd == DPTM_MON_CMD_STATE:
+        return CmdInfo("STATE", "dsm", "state", "state", False)
+    if cmd == DPTM_MON_CMD_PING:
+        return CmdInfo("PING", "dsm", "ping", "dsm.ping", False)
+    if cmd > DPTM_MON_CMD_PKT_ENC_SEND:
+        name = f"RSVED{cmd:02d}" if cmd < DPTM_MON_CMD_TYPE_MAX else "UNKNOWN"
+        return CmdInfo(name, "unknown", "unknown", "unknown.unknown", False)
+    send = cmd & DPTM_MON_BIT_SEND
+    encrypt = cmd & DPTM_MON_BIT_ENCRYPT
+    name = ("P-" if cmd & DPTM_MON_BIT_PACKET else "") + ("SND" if send else "RCV") + ("-S" if encrypt else "")
+    source = "gcs" if send else "fcc"
+    packet_type = "ciphertext" if encrypt else "plaintext"
+    return CmdInfo(name, source, packet_type, f"{source}.{packet_type}", not encrypt)
+
+CMD_TABLE = tuple(cmd_info(cmd) for cmd in range(256))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""DSM 상태 (cmd 16) 파싱과 변경분(delta) 계산
+
+DSM 은 값이 바뀌지 않아도 상태 전체를 JSON 텍스트로 주기적으로 보낸다.
+
+    {  "state":"connected",  "tls_ver":"TLSv1.2", "kem":"mlkem1024", "sig":"mldsa87",
+       "ciphersuite":"KEMPQC-SIGPQC-AES128-GCM-SHA256", "tx_packets":3, "rx_packets":144, "tx_bytes":146, "rx_bytes":9900 }
+
+parse_state() 로 한 번 디코딩하여 필드 dict (text 필드는 str, 카운터는 int) 로 만들고,
+StateTracker 가 link 마다 이전 값과 비교하여 바뀐 필드와 카운터의 초당 증가량(<카운터>_rate)을 계산한다.
+"""
+import json
+
+TEXT_FIELDS = ("state", "tls_ver", "kem", "sig", "ciphersuite")
+COUNTER_FIELDS = ("tx_packets", "rx_packets", "tx_bytes", "rx_bytes")
+STATE_FIELDS = TEXT_FIELDS + COUNTER_FIELDS
+RATE_FIELDS = tuple(f"{field}_rate" for field in COUNTER_FIELDS)
+
+def _counter(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+def parse_state(payload):
+    """cmd 16 페이로드 -> 필드 dict, JSON 객체가 아니면 None"""
+    text = bytes(payload).decode('utf-8', 'replace').strip('\x00 \r\n')
+    try:
+        raw = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(raw, dict):
+        return None
+    state = {field: str(raw.get(field, "")) for field in TEXT_FIELDS}
+    for field in COUNTER_FIELDS:
+        state[field] = _counter(raw.get(field))
+    return state
+
+class StateTracker:
+    """link 1개에서 마지막으로 보낸 상태 필드와 카운터 기준값"""
+
+    def __init__(self):
+        self.sent = {}          # 마지막으로 보낸 필드 값 (비어 있으면 다음에 전체를 보냄)
+        self.counters = None    # (수신 시각, 상태) - 증가량 계산 기준
+        self.generation = None  # 웹소켓 연결 번호 (SharedWebsocket.generation)
+
+    def reset(self):
+        """다음 update() 가 전체 필드를 돌려주도록 초기화 (대상 재연결 시)"""
+        self.sent = {}
+
+    def update(self, state, now, generation=0):
+        """새 상태 -> (full, 바뀐 필드 dict)
+
+        now 는 time.monotonic() 수신 시각이다. 웹소켓이 다시 연결되면 (generation 이 바뀌면)
+        서버가 재시작되었을 수 있으므로 전체 필드를 보낸다 (full=True).
+        """
+        if generation != self.generation:
+            self.generation = generation
+            self.sent = {}
+        fields = dict(state)
+        if self.counters is not None:
+            then, previous = self.counters
+            elapsed = now - then
+            if elapsed > 0:
+                for field, rate_field in zip(COUNTER_FIELDS, RATE_FIELDS):
+                    # 카운터가 줄었으면 (DSM 재시작) 0
+                    fields[rate_field] = round(max(state[field] - previous[field], 0) / elapsed, 1)
+        self.counters = (now, state)
+
+        full = not self.sent
+        changed = fields if full else {key: value for key, value in fields.items() if self.sent.get(key) != value}
+        self.sent.update(changed)
+        return full, changed
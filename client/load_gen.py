@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""합성 DSM 모니터 프로토콜 부하 생성기
+
+sim_mon_srv 는 녹화 파일을 원래 시간 간격대로 재생하므로 실제 링크 이상의 부하를 줄 수 없다.
+load_gen.py 는 sim_mon_srv 처럼 TCP 포트에서 대기하다가 client.py 가 연결하면
+dptm_tls_mon.h 프레임([cmd][seq][len(2, BE)][data])을 지정한 속도로 만들어 보낸다.
+
+    python3 load_gen.py --port 14445 --rate 5000
+    python3 load_gen.py --rate 2000 --size uniform:64-1024 --mix plain=4,cipher=4,state=1,ping=1
+    python3 load_gen.py --size dump:../server/simulator/record_dsm_ex_server_20250815a.dump
+
+--size  페이로드 길이 분포: fixed:N | uniform:MIN-MAX | dump:<파일> (녹화 파일의 평문/암호문 길이에서 뽑음)
+--mix   cmd 종류별 가중치: plain (cmd 0/1), cipher (cmd 2/3), state (cmd 16), ping (cmd 8)
+
+평문은 pymavlink 로 만든 MAVLink 메시지(FCC: HEARTBEAT/ATTITUDE/GLOBAL_POSITION_INT/VFR_HUD,
+GCS: HEARTBEAT/COMMAND_LONG/RC_CHANNELS_OVERRIDE)를 길이만큼 이어 붙이고, 암호문은 임의 바이트다.
+평문/암호문/PING 프레임은 미리 만든 풀에서 순서대로 꺼내 보내므로 초당 수만 프레임도 생성 비용이 작다.
+상태 프레임은 보낸 프레임/바이트 수를 카운터로 하는 DSM 과 같은 JSON 텍스트를 보낼 때마다 만든다.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import struct
+import time
+
+from pymavlink import mavutil
+
+from capture import DumpReader
+from dptm_mon import (CMD_TABLE, DPTM_MON_CMD_ENC_RECV, DPTM_MON_CMD_ENC_SEND, DPTM_MON_CMD_PING,
+                      DPTM_MON_CMD_RECV, DPTM_MON_CMD_SEND, DPTM_MON_CMD_STATE)
+
+# 모니터 프로토콜 헤더 (client.py 와 같은 정의: cmd, seq, big-endian len)
+HEADER_STRUCT = struct.Struct('>BBH')
+MAX_PAYLOAD = 0xFFFF
+
+MIX_CMDS = {
+    "plain": (DPTM_MON_CMD_RECV, DPTM_MON_CMD_SEND),
+    "cipher": (DPTM_MON_CMD_ENC_RECV, DPTM_MON_CMD_ENC_SEND),
+    "state": (DPTM_MON_CMD_STATE,),
+    "ping": (DPTM_MON_CMD_PING,),
+}
+DEFAULT_MIX = "plain=45,cipher=45,state=1,ping=9"
+DEFAULT_SIZE = "uniform:32-512"
+POOL_SIZE = 4096      # 미리 만들어 두는 프레임 수
+TICK = 0.002          # 전송 주기 (초)
+MAX_BURST = 0.1       # 밀린 전송량 상한 (초): 수신 측이 늦으면 따라잡지 않고 실제 전송 속도가 떨어진다
+
+def parse_mix(value):
+    """"plain=45,cipher=45,state=1,ping=9" -> {종류: 비율} (합 1)"""
+    weights = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        name = name.strip()
+        if name not in MIX_CMDS:
+            raise ValueError(f"unknown mix entry: {name} (expected {', '.join(MIX_CMDS)})")
+        weights[name] = float(weight or 1)
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError(f"mix weights must be positive: {value}")
+    return {name: weight / total for name, weight in weights.items() if weight > 0}
+
+class SizeDistribution:
+    """페이로드 길이 분포 (fixed:N | uniform:MIN-MAX | dump:<파일>)"""
+
+    def __init__(self, spec, rng):
+        self.rng = rng
+        kind, _, arg = spec.partition(':')
+        self.samples = None  # dump: packet_type -> 길이 목록
+        if kind == "fixed":
+            self.low = self.high = int(arg)
+        elif kind == "uniform":
+            low, _, high = arg.partition('-')
+            self.low, self.high = int(low), int(high or low)
+        elif kind == "dump":
+            self.samples = dump_payload_sizes(arg)
+            if not any(self.samples.values()):
+                raise ValueError(f"no plaintext/ciphertext frames in {arg}")
+        else:
+            raise ValueError(f"unknown size distribution: {spec} (expected fixed:N, uniform:MIN-MAX or dump:FILE)")
+        if self.samples is None and not 0 <= self.low <= self.high <= MAX_PAYLOAD:
+            raise ValueError(f"payload size must be within 0-{MAX_PAYLOAD}: {spec}")
+
+    def sample(self, packet_type):
+        if self.samples is not None:
+            sizes = self.samples.get(packet_type) or [size for values in self.samples.values() for size in values]
+            return self.rng.choice(sizes)
+        return self.rng.randint(self.low, self.high)
+
+def dump_payload_sizes(path):
+    """녹화 파일의 평문/암호문 페이로드 길이 {packet_type: [길이, ...]}"""
+    sizes = {"plaintext": [], "ciphertext": []}
+    reader = DumpReader(path)
+    try:
+        for i in range(len(reader)):
+            _, cmd, _, frame = reader.frame(i)
+            packet_type = CMD_TABLE[cmd].packet_type
+            if packet_type in sizes:
+                sizes[packet_type].append(len(frame) - HEADER_STRUCT.size)
+            frame.release()  # mmap 을 닫기 전에 memoryview 해제
+    finally:
+        reader.close()
+    return sizes
+
+class MavlinkContent:
+    """방향별 MAVLink 메시지 생성 (client.py 의 MavlinkDecoder 가 디코딩하는 평문 페이로드)"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.boot_ms = 0
+        # FCC (system 1) -> GCS, GCS (system 255) -> FCC, 방향마다 sequence 가 따로 증가
+        self.mav = {"fcc": mavutil.mavlink.MAVLink(None, srcSystem=1, srcComponent=1),
+                    "gcs": mavutil.mavlink.MAVLink(None, srcSystem=255, srcComponent=190)}
+
+    def message(self, source):
+        rng = self.rng
+        mav = self.mav[source]
+        self.boot_ms += 20
+        if source == "fcc":
+            kind = rng.randrange(4)
+            if kind == 0:
+                msg = mav.heartbeat_encode(2, 3, 81, 0, 4, 3)
+            elif kind == 1:
+                msg = mav.attitude_encode(self.boot_ms, rng.uniform(-0.5, 0.5), rng.uniform(-0.5, 0.5),
+                                          rng.uniform(-3.1, 3.1), rng.uniform(-1, 1), rng.uniform(-1, 1),
+                                          rng.uniform(-1, 1))
+            elif kind == 2:
+                msg = mav.global_position_int_encode(self.boot_ms, 375000000 + rng.randrange(100000),
+                                                     1270000000 + rng.randrange(100000), rng.randrange(100000),
+                                                     rng.randrange(50000), rng.randrange(-500, 500),
+                                                     rng.randrange(-500, 500), rng.randrange(-100, 100),
+                                                     rng.randrange(36000))
+            else:
+                msg = mav.vfr_hud_encode(rng.uniform(0, 20), rng.uniform(0, 20), rng.randrange(360),
+                                         rng.randrange(100), rng.uniform(0, 100), rng.uniform(-2, 2))
+        else:
+            kind = rng.randrange(3)
+            if kind == 0:
+                msg = mav.heartbeat_encode(6, 8, 0, 0, 0, 3)
+            elif kind == 1:
+                msg = mav.command_long_encode(1, 1, 400, 0, 1, 0, 0, 0, 0, 0, 0)
+            else:
+                msg = mav.rc_channels_override_encode(1, 1, *(1000 + rng.randrange(1000) for _ in range(8)))
+        return msg.pack(mav)
+
+    def payload(self, source, size):
+        """size 를 넘지 않게 메시지를 이어 붙인 페이로드 (최소 1개)"""
+        parts = [self.message(source)]
+        length = len(parts[0])
+        while True:
+            packet = self.message(source)
+            if length + len(packet) > size:
+                break
+            parts.append(packet)
+            length += len(packet)
+        return b''.join(parts)
+
+def encode_frame(cmd, seq, payload=b''):
+    return HEADER_STRUCT.pack(cmd, seq & 0xFF, len(payload)) + payload
+
+def build_pool(mix, sizes, rng, count=POOL_SIZE):
+    """평문/암호문/PING 프레임 풀 (상태는 LoadGenerator 가 보낼 때 만든다)"""
+    kinds = [name for name in mix if name != "state"]
+    if not kinds:
+        return []
+    weights = [mix[name] for name in kinds]
+    content = MavlinkContent(rng)
+    pool = []
+    for seq in range(count):
+        kind = rng.choices(kinds, weights)[0]
+        cmd = rng.choice(MIX_CMDS[kind])
+        info = CMD_TABLE[cmd]
+        if kind == "plain":
+            payload = content.payload(info.source, sizes.sample(info.packet_type))
+        elif kind == "cipher":
+            payload = rng.randbytes(sizes.sample(info.packet_type))
+        else:
+            payload = b''
+        pool.append(encode_frame(cmd, seq, payload))
+    return pool
+
+class LoadGenerator:
+    """연결마다 rate 프레임/초로 풀의 프레임을 보내는 모니터 프로토콜 서버
+
+    rate 는 실행 중에 바꿀 수 있다 (bench_relay.py 가 단계별로 올림).
+    frames/bytes 는 모든 연결에서 보낸 누적 프레임 수/바이트 수, packets 는 그중 평문/암호문 프레임 수
+    (client.py 가 프레임마다 패킷 메시지 1개를 중계하므로 뷰어가 받아야 하는 패킷 메시지 수)다.
+    """
+
+    def __init__(self, rate, mix, sizes, rng):
+        self.rate = rate
+        self.state_share = mix.get("state", 0.0)
+        self.pool = build_pool(mix, sizes, rng)
+        # 풀 앞에서부터의 평문/암호문 프레임 누적 수 (take() 에서 구간 개수를 뺄셈 1번으로 계산)
+        self.pool_packets = list(itertools.accumulate(
+            (CMD_TABLE[frame[0]].packet_type in ("plaintext", "ciphertext") for frame in self.pool), initial=0))
+        self.frames = 0
+        self.packets = 0
+        self.bytes = 0
+        self.connections = 0
+
+    def state_frame(self, seq):
+        """DSM 상태 JSON (카운터는 지금까지 보낸 프레임/바이트 수)"""
+        state = {"state": "connected", "tls_ver": "TLSv1.3", "kem": "mlkem1024", "sig": "mldsa87",
+                 "ciphersuite": "KEMPQC-SIGPQC-AES128-GCM-SHA256",
+                 "tx_packets": self.frames // 2, "rx_packets": self.frames - self.frames // 2,
+                 "tx_bytes": self.bytes // 2, "rx_bytes": self.bytes - self.bytes // 2}
+        return encode_frame(DPTM_MON_CMD_STATE, seq, json.dumps(state).encode())
+
+    def take(self, index, count):
+        """풀에서 index 부터 count 개 프레임 (끝에 닿으면 처음부터) -> (프레임 목록, 다음 index, 평문/암호문 수)"""
+        pool = self.pool
+        frames = []
+        packets = 0
+        while count > 0:
+            chunk = pool[index:index + count]
+            frames += chunk
+            count -= len(chunk)
+            packets += self.pool_packets[index + len(chunk)] - self.pool_packets[index]
+            index = (index + len(chunk)) % len(pool)
+        return frames, index, packets
+
+    async def handle(self, reader, writer):
+        peer = writer.get_extra_info('peername')
+        self.connections += 1
+        print(f"load_gen: client connected {peer}")
+        index = 0
+        state_seq = 0
+        credit = 0.0
+        state_credit = 0.0
+        last = time.monotonic()
+        try:
+            while True:
+                await asyncio.sleep(TICK)
+                if reader.at_eof() or writer.is_closing():
+                    break  # 보낼 프레임이 없을 때 (rate 0) 도 연결 종료를 알아챔
+                now = time.monotonic()
+                elapsed = now - last
+                last = now
+                rate = self.rate
+                credit = min(credit + elapsed * rate * (1 - self.state_share), rate * MAX_BURST + 1)
+                state_credit = min(state_credit + elapsed * rate * self.state_share, rate * MAX_BURST + 1)
+                count = int(credit) if self.pool else 0
+                credit -= count
+                frames, index, packets = self.take(index, count)
+                for _ in range(int(state_credit)):
+                    frames.append(self.state_frame(state_seq))
+                    state_seq += 1
+                state_credit -= int(state_credit)
+                if not frames:
+                    continue
+                data = b''.join(frames)
+                writer.write(data)
+                # 수신 측이 따라오지 못하면 여기서 기다리며 그동안의 credit 은 MAX_BURST 까지만 쌓인다
+                await writer.drain()
+                self.frames += len(frames)
+                self.packets += packets
+                self.bytes += len(data)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+            print(f"load_gen: client disconnected {peer}")
+
+    async def serve(self, host, port, started=None):
+        """연결을 받아 프레임 전송, started(port) 는 대기를 시작한 뒤 한 번 호출"""
+        server = await asyncio.start_server(self.handle, host, port)
+        if started:
+            started(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+def make_generator(rate, mix, size, seed=None):
+    rng = random.Random(seed)
+    return LoadGenerator(rate, parse_mix(mix), SizeDistribution(size, rng), rng)
+
+async def report(generator, interval):
+    frames, sent_bytes = generator.frames, generator.bytes
+    while True:
+        await asyncio.sleep(interval)
+        if generator.connections:
+            print(f"load_gen: {(generator.frames - frames) / interval:.0f} frames/s "
+                  f"{(generator.bytes - sent_bytes) / interval / 1024:.0f} KiB/s "
+                  f"(target {generator.rate:.0f} frames/s, connections {generator.connections})")
+        frames, sent_bytes = generator.frames, generator.bytes
+
+async def run(args, generator):
+    sizes = [len(frame) for frame in generator.pool]
+    print(f"load_gen: {len(generator.pool)} pooled frames, mean {sum(sizes) / max(len(sizes), 1):.0f} bytes, "
+          f"mix {args.mix}, size {args.size}")
+    await asyncio.gather(
+        generator.serve(args.host, args.port, lambda port: print(f"load_gen: listening on {args.host}:{port}")),
+        report(generator, args.interval))
+
+def main():
+    parser = argparse.ArgumentParser(description='Synthetic DSM monitor protocol load generator')
+    parser.add_argument('--host', default='127.0.0.1', help='listen address')
+    parser.add_argument('--port', type=int, default=14445, help='listen port (client.py TARGET_PORT)')
+    parser.add_argument('--rate', type=float, default=1000, help='frames/sec per connection')
+    parser.add_argument('--size', default=DEFAULT_SIZE, help='fixed:N | uniform:MIN-MAX | dump:FILE')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='cmd weights (plain, cipher, state, ping)')
+    parser.add_argument('--seed', type=int, help='random seed for reproducible frames')
+    parser.add_argument('--interval', type=float, default=5, help='rate report interval (seconds)')
+    args = parser.parse_args()
+    try:
+        generator = make_generator(args.rate, args.mix, args.size, args.seed)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    try:
+        asyncio.run(run(args, generator))
+    except KeyboardInterrupt:
+        print("\nStopping load_gen...")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""MAVLink 일괄 디코더
+
+평문 프레임 페이로드(IP/UDP 패킷 안의 MAVLink 메시지)를 바이트 단위 parse_char 호출 없이
+한 번에 처리한다. MAVLink v1(0xFE)/v2(0xFD) 시작 바이트를 bytes.find 로 찾고 헤더의 길이로
+메시지 경계를 계산한 뒤 MAVLink.decode() 로 CRC 를 검증하여 메시지를 만든다.
+message_types() 는 같은 검증만 하고 메시지 객체 없이 종류 이름만 돌려준다 (오프라인 집계용).
+
+message_json() 은 msg.to_json() 과 같은 JSON 을 메시지 종류별로 미리 만든 직렬화 함수로 만든다.
+"""
+import json
+import math
+from json.encoder import encode_basestring_ascii
+
+from pymavlink import mavutil
+
+MARKER_V1 = 0xFE
+MARKER_V2 = 0xFD
+HEADER_LEN_V1 = 6
+HEADER_LEN_V2 = 10
+CRC_LEN = 2
+SIGNATURE_LEN = 13
+IFLAG_SIGNED = 0x01
+MAX_FRAME_LEN = HEADER_LEN_V2 + 255 + CRC_LEN + SIGNATURE_LEN
+FLOAT_TYPES = ("float", "double")
+
+class MavlinkDecoder:
+    """방향(FCC/GCS)별 MAVLink 파서 상태
+
+    프레임 경계에서 잘린 메시지는 다음 decode() 호출까지 보관한다.
+    """
+
+    def __init__(self):
+        self.mav = mavutil.mavlink.MAVLink(None)
+        self.mav.srcSystem = 1
+        self.mav.srcComponent = 1
+        self.pending = b''
+        self.errors = 0
+
+    def decode(self, data):
+        """페이로드에서 CRC 가 검증된 MAVLink 메시지 목록 반환"""
+        return self._scan(data, self._decode_message)
+
+    def message_types(self, data):
+        """페이로드에서 CRC 가 검증된 MAVLink 메시지의 종류 이름 목록 반환
+
+        decode() 와 같은 메시지를 인정하지만 메시지 객체를 만들지 않는다 (개수 집계용).
+        """
+        return self._scan(data, self._message_type)
+
+    def _decode_message(self, msgbuf):
+        """메시지 1개 디코딩, 인정할 수 없으면 None"""
+        try:
+            msg = self.mav.decode(bytearray(msgbuf))
+        except Exception:
+            # 시작 바이트와 같은 값의 일반 데이터 (IP 주소 등)
+            self.errors += 1
+            return None
+        if isinstance(msg, mavutil.mavlink.MAVLink_unknown):
+            # 모르는 메시지 ID 는 CRC 를 검증할 수 없으므로 메시지로 인정하지 않음
+            return None
+        return msg
+
+    def _message_type(self, msgbuf):
+        """MAVLink.decode() 와 같은 메시지 ID / CRC 검증 후 종류 이름, 인정할 수 없으면 None"""
+        if msgbuf[0] == MARKER_V2:
+            msg_id = msgbuf[7] | msgbuf[8] << 8 | msgbuf[9] << 16
+            crc_end = len(msgbuf) - CRC_LEN - (SIGNATURE_LEN if msgbuf[2] & IFLAG_SIGNED else 0)
+        else:
+            msg_id = msgbuf[5]
+            crc_end = len(msgbuf) - CRC_LEN
+        msgtype = mavutil.mavlink.mavlink_map.get(msg_id)
+        if msgtype is None:
+            return None
+        crc = mavutil.mavlink.x25crc(msgbuf[1:crc_end] + bytes((msgtype.crc_extra,))).crc
+        if crc != msgbuf[crc_end] | msgbuf[crc_end + 1] << 8:
+            self.errors += 1
+            return None
+        return msgtype.msgname
+
+    def _scan(self, data, accept):
+        """시작 바이트와 헤더의 길이로 메시지 경계를 찾아 accept(메시지 bytes) 결과 목록 반환"""
+        buf = self.pending + data if self.pending else bytes(data)
+        self.pending = b''
+        end = len(buf)
+        messages = []
+        partial = -1  # 버퍼 끝을 넘어가는 (잘렸을 수 있는) 첫 메시지 후보 위치
+        pos = 0
+        while pos < end:
+            v1 = buf.find(MARKER_V1, pos)
+            v2 = buf.find(MARKER_V2, pos)
+            if v1 < 0 and v2 < 0:
+                break
+            pos = v2 if v1 < 0 or 0 <= v2 < v1 else v1
+
+            if pos + 3 > end:
+                if partial < 0:
+                    partial = pos
+                break
+            if buf[pos] == MARKER_V2:
+                msg_end = pos + HEADER_LEN_V2 + buf[pos + 1] + CRC_LEN
+                if buf[pos + 2] & IFLAG_SIGNED:
+                    msg_end += SIGNATURE_LEN
+            else:
+                msg_end = pos + HEADER_LEN_V1 + buf[pos + 1] + CRC_LEN
+            if msg_end > end:
+                if partial < 0:
+                    partial = pos
+                pos += 1
+                continue
+
+            msg = accept(buf[pos:msg_end])
+            if msg is None:
+                # 다음 바이트부터 다시 탐색
+                pos += 1
+                continue
+            # 유효한 메시지가 뒤에 있으면 앞의 잘린 후보는 잘못된 시작 바이트
+            partial = -1
+            pos = msg_end
+            messages.append(msg)
+
+        if partial >= 0 and end - partial < MAX_FRAME_LEN:
+            self.pending = buf[partial:]
+        return messages
+
+def _json_text(value):
+    """char 필드 -> JSON 문자열 (MAVLink_message.format_attr() 와 같은 처리)"""
+    if isinstance(value, bytes):
+        value = value.decode(errors="backslashreplace").rstrip("\x00")
+    return encode_basestring_ascii(value)
+
+def compile_serializer(msgtype):
+    """메시지 클래스의 JSON 직렬화 함수 생성
+
+    필드 순서, 배열/문자열/실수 처리 방법을 한 번만 정해 아래와 같은 함수를 만든다.
+    메시지마다 to_dict() 처럼 필드 목록을 순회하며 getattr/isinstance 를 호출하지 않는다.
+
+        def serialize(m):
+            v1 = m.x
+            if not -_INF < v1 < _INF: v1 = _dumps(v1)
+            return '{"mavpackettype": "...", "seq": %d, "x": %s}' % (m.seq, v1)
+    """
+    names = msgtype.fieldnames
+    # array_lengths 는 전송(ordered_fieldnames) 순서
+    array_lengths = dict(zip(msgtype.ordered_fieldnames, msgtype.array_lengths))
+    template = ['{"mavpackettype": %s' % encode_basestring_ascii(msgtype.msgname).replace('%', '%%')]
+    lines = []
+    args = []
+    for i, (name, field_type) in enumerate(zip(names, msgtype.fieldtypes)):
+        template.append(', %s: ' % encode_basestring_ascii(name).replace('%', '%%'))
+        if field_type == "char":
+            template.append('%s')
+            args.append(f"_text(m.{name})")
+        elif array_lengths[name]:
+            template.append('%s')
+            args.append(f"_dumps(m.{name})")
+        elif field_type in FLOAT_TYPES:
+            # 유한한 실수는 str() 이 json.dumps() 와 같고, NaN/Infinity 만 json.dumps() 로 변환
+            lines.append(f"    v{i} = m.{name}")
+            lines.append(f"    if not -_INF < v{i} < _INF: v{i} = _dumps(v{i})")
+            template.append('%s')
+            args.append(f"v{i}")
+        else:
+            template.append('%d')
+            args.append(f"m.{name}")
+    template.append('}')
+    source = "def serialize(m):\n" + "".join(line + "\n" for line in lines)
+    source += f"    return {''.join(template)!r} % ({''.join(arg + ', ' for arg in args)})\n"
+    namespace = {"_text": _json_text, "_dumps": json.dumps, "_INF": math.inf}
+    exec(compile(source, f"<mavlink serializer {msgtype.msgname}>", "exec"), namespace)
+    return namespace["serialize"]
+
+# 메시지 클래스(= 메시지 ID) -> compile_serializer() 결과
+# (msg.id 는 LOG_ENTRY 등의 "id" 필드와 이름이 겹치므로 클래스로 찾는다)
+_serializers = {}
+
+def message_json(msg):
+    """msg.to_json() 과 같은 JSON 문자열 (메시지 종류별 직렬화 함수는 처음 한 번만 생성)"""
+    msgtype = type(msg)
+    serializer = _serializers.get(msgtype)
+    if serializer is None:
+        serializer = _serializers[msgtype] = compile_serializer(msgtype)
+    return serializer(msg)
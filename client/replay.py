@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""캡처 파일 재생 (sim_mon_srv 없이 웹소켓 서버로 직접 전송)
+
+dump 파일을 mmap 하고 색인으로 시작 위치를 찾아 client.py 와 같은 방식(handle_frame)으로
+웹소켓 서버에 보낸다. 기록 시간 간격을 지키는 1x/10x 등의 배속 재생과 최대 속도 재생을 지원한다.
+
+    python3 replay.py ../server/simulator/record_dsm_ex_server_20250815a.dump --speed 10
+    python3 replay.py capture.dump --start-ms 60000 --speed max
+"""
+import argparse
+import asyncio
+import time
+
+import websockets
+
+from capture import DumpReader, build_index
+from client import (WEBSOCKET_SERVER, BATCH_MAX_COUNT, MAX_LINKS, PRODUCER_HELLO, MessageBatcher, Target,
+                    drain_websocket, handle_frame)
+
+def parse_speed(value):
+    """'1', '10', '10x', 'max' -> 배속 (0 = 최대 속도)"""
+    value = value.lower()
+    if value == 'max':
+        return 0.0
+    speed = float(value[:-1] if value.endswith('x') else value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be positive or 'max'")
+    return speed
+
+async def replay(reader, websocket, start=0, end=None, speed=1.0, target=None):
+    """start 번째부터 end 번째 전까지 프레임을 speed 배속으로 전송, 보낸 프레임 수 반환"""
+    target = target or Target(0, reader.path, 0)
+    end = len(reader) if end is None else min(end, len(reader))
+    if start >= end:
+        return 0
+    sender = MessageBatcher(websocket) if BATCH_MAX_COUNT > 1 else websocket
+    base_ts = reader.frame(start)[0]
+    started = time.monotonic()
+    for i in range(start, end):
+        ts, cmd, seq, frame = reader.frame(i)
+        if speed > 0:
+            delay = (ts - base_ts) / 1000 / speed - (time.monotonic() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await handle_frame(sender, cmd, seq, frame, target)
+        frame.release()
+    if sender is not websocket:
+        await sender.flush()
+    return end - start
+
+def parse_link(value):
+    link = int(value)
+    if not 0 <= link < MAX_LINKS:
+        raise argparse.ArgumentTypeError(f"link must be 0..{MAX_LINKS - 1}")
+    return link
+
+def start_frame(reader, args):
+    """--start-frame / --start-ms / --start-seq 에 해당하는 프레임 번호"""
+    start = args.start_frame
+    if args.start_ms is not None:
+        start = max(start, reader.find_time(args.start_ms))
+    if args.start_seq is not None:
+        start = reader.find_seq(args.start_seq, start)
+        if start < 0:
+            start = len(reader)
+    return start
+
+async def main():
+    parser = argparse.ArgumentParser(description='Replay a monitor capture file into the websocket server')
+    parser.add_argument('dump', help='record_dsm_*.dump / recorded capture file')
+    parser.add_argument('--server', default=WEBSOCKET_SERVER, help='websocket server url')
+    parser.add_argument('--speed', type=parse_speed, default=1.0, help="1, 10, ... or 'max'")
+    parser.add_argument('--start-frame', type=int, default=0, help='first frame number')
+    parser.add_argument('--start-ms', type=int, help='first frame at or after this timestamp (ms)')
+    parser.add_argument('--start-seq', type=int, help='first frame with this seq (from the start position)')
+    parser.add_argument('--count', type=int, help='number of frames to replay')
+    parser.add_argument('--link', type=parse_link, default=0, help='link id to tag frames with (client.py TARGETS order)')
+    parser.add_argument('--build-index', action='store_true', help='only (re)build the .idx file')
+    args = parser.parse_args()
+
+    if args.build_index:
+        print(f"{args.dump}: indexed {build_index(args.dump)} frames")
+        return
+
+    reader = DumpReader(args.dump)
+    try:
+        start = start_frame(reader, args)
+        end = None if args.count is None else start + args.count
+        print(f"{args.dump}: {len(reader)} frames, replaying from frame {start} "
+              f"at {'max' if args.speed == 0 else f'{args.speed:g}x'} speed to {args.server}")
+        async with websockets.connect(args.server) as websocket:
+            await websocket.send(PRODUCER_HELLO)
+            drain = asyncio.create_task(drain_websocket(websocket))
+            began = time.perf_counter()
+            sent = await replay(reader, websocket, start, end, args.speed, Target(args.link, args.dump, 0))
+            elapsed = time.perf_counter() - began
+            drain.cancel()
+        print(f"replayed {sent} frames in {elapsed:.2f}s ({sent / max(elapsed, 1e-9):.0f} frames/s)")
+    finally:
+        reader.close()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nStopping replay...")
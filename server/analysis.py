@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""패킷 바이트 통계 (엔트로피, 카이제곱)
+
+대시보드 JS 의 calculateEntropy / calculateChiSquare / calculateReducedChiSquare 와
+같은 값을 NumPy(np.bincount)로 계산한다.
+
+짧은 MAVLink 패킷 하나의 엔트로피는 작고 흔들리므로, 방향/패킷 종류별로 최근 N 바이트
+슬라이딩 윈도우 히스토그램도 유지하여 윈도우 엔트로피와 균등 분포 카이제곱 검정 p-value 를 낸다.
+"""
+import math
+from collections import deque
+
+import numpy as np
+
+BYTE_DOF = 255  # 256-bin 균등 분포 카이제곱 검정 자유도
+
+def byte_counts(data):
+    """0~255 바이트 값별 빈도 (길이 256 배열)"""
+    return np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+
+def entropy(counts, n=None):
+    """Shannon 엔트로피 (bits/byte)"""
+    if n is None:
+        n = int(counts.sum())
+    if n == 0:
+        return 0.0
+    p = counts[counts > 0] / n
+    return float(-(p * np.log2(p)).sum())
+
+def chi_square(counts, n=None):
+    """균등 분포 대비 카이제곱 통계량"""
+    if n is None:
+        n = int(counts.sum())
+    if n == 0:
+        return 0.0
+    expected = n / 256
+    diff = counts - expected
+    return float((diff * diff).sum() / expected)
+
+def reduced_chi_square(counts):
+    """0x00 바이트를 제외한 카이제곱 / 바이트 수 (calculateReducedChiSquare)"""
+    n = int(counts.sum()) - int(counts[0])
+    if n == 0:
+        return 0.0
+    reduced = counts.copy()
+    reduced[0] = 0
+    return chi_square(reduced, n) / n
+
+def chi_square_p_value(chi_square_value, dof=BYTE_DOF):
+    """카이제곱 상위 꼬리 확률 P(X >= x) (Wilson-Hilferty 정규 근사, dof 가 클 때 정확)"""
+    if chi_square_value <= 0:
+        return 1.0
+    z = ((chi_square_value / dof) ** (1 / 3) - (1 - 2 / (9 * dof))) / math.sqrt(2 / (9 * dof))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+class WindowHistogram:
+    """최근 window 바이트의 256-bin 히스토그램
+
+    새 패킷 바이트는 더하고 윈도우를 벗어난 바이트만 빼므로 갱신 비용은 O(패킷 길이)다.
+    """
+
+    def __init__(self, window=4096):
+        self.window = window
+        self.counts = np.zeros(256, dtype=np.int64)
+        self.chunks = deque()  # 윈도우 안의 바이트 (오래된 순)
+        self.size = 0
+
+    def add(self, data):
+        chunk = np.frombuffer(data, dtype=np.uint8)
+        if len(chunk) >= self.window:
+            chunk = chunk[len(chunk) - self.window:]
+            self.counts = np.bincount(chunk, minlength=256)
+            self.chunks = deque([chunk])
+            self.size = len(chunk)
+            return
+        self.counts += np.bincount(chunk, minlength=256)
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+
+        excess = self.size - self.window
+        while excess > 0:
+            oldest = self.chunks[0]
+            if len(oldest) <= excess:
+                self.chunks.popleft()
+                expired = oldest
+            else:
+                self.chunks[0] = oldest[excess:]
+                expired = oldest[:excess]
+            self.counts -= np.bincount(expired, minlength=256)
+            self.size -= len(expired)
+            excess -= len(expired)
+
+    def metrics(self):
+        """윈도우 (entropy, chi_square, p_value)"""
+        value_chi_square = chi_square(self.counts, self.size)
+        return entropy(self.counts, self.size), value_chi_square, chi_square_p_value(value_chi_square)
+
+def packet_metrics_batch(counts):
+    """패킷별 빈도 행렬 (패킷 수 x 256) 에서 (entropy, chi_square, reduced_chi_square) 배열
+
+    packet_metrics() 와 같은 값을 패킷 루프 없이 한 번에 계산한다 (오프라인 분석용).
+    256 열 전체에 대한 연산은 정수 빈도의 합/제곱합/c*log2(c) 합 세 번으로 줄이고 나머지는 패킷별로 푼다.
+
+        entropy            = log2(n) - sum(c * log2(c)) / n
+        chi_square         = 256 * sum(c^2) / n - n
+        reduced_chi_square = 256 * (sum(c^2) - c0^2) / (n - c0)^2 - 1
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    n = counts.sum(axis=1)
+    square_sum = np.einsum('ij,ij->i', counts, counts).astype(np.float64)
+    c0 = counts[:, 0].astype(np.float64)
+    max_count = int(counts.max()) if counts.size else 0
+    values = np.arange(max_count + 1, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        count_log = np.where(values > 0, values * np.log2(values), 0.0)
+    count_log_sum = count_log[counts].sum(axis=1)
+
+    safe_n = np.where(n > 0, n, 1).astype(np.float64)
+    value_entropy = np.log2(safe_n) - count_log_sum / safe_n
+    value_chi_square = 256 * square_sum / safe_n - safe_n
+
+    # 0x00 을 제외한 카이제곱 / 바이트 수
+    reduced_n = n - counts[:, 0]
+    safe_reduced = np.where(reduced_n > 0, reduced_n, 1).astype(np.float64)
+    value_reduced = 256 * (square_sum - c0 * c0) / (safe_reduced * safe_reduced) - 1
+
+    empty = n == 0
+    value_chi_square[empty] = 0.0
+    value_reduced[reduced_n == 0] = 0.0
+    value_entropy[empty] = 0.0
+    return value_entropy, value_chi_square, value_reduced
+
+def packet_metrics(data):
+    """패킷 1개의 (entropy, chi_square, reduced_chi_square)"""
+    counts = byte_counts(data)
+    n = len(data)
+    return entropy(counts, n), chi_square(counts, n), reduced_chi_square(counts)
+
+class MetricTracker:
+    """(link, source, packet_type) 별 이동 평균(EMA) 상태
+
+    대시보드의 movingAverageWeight 평활화와 같은 방식:
+    smoothed = smoothed * (1 - weight) + value * weight
+
+    window 바이트 슬라이딩 윈도우 통계(window_*)도 함께 계산한다.
+    """
+
+    def __init__(self, weight=0.3, window=4096):
+        self.weight = weight
+        self.window = window
+        self.smoothed = {}
+        self.windows = {}
+
+    def update(self, source, packet_type, data, link=0):
+        """패킷 통계를 계산하고 평활화하여 metrics 메시지(dict) 반환 (link 별로 따로 평활화)"""
+        value_entropy, value_chi_square, value_reduced = packet_metrics(data)
+        key = (link, source, packet_type)
+        prev_entropy, prev_reduced = self.smoothed.get(key, (0.0, 0.0))
+        w = self.weight
+        smoothed_entropy = prev_entropy * (1.0 - w) + value_entropy * w
+        smoothed_reduced = prev_reduced * (1.0 - w) + value_reduced * w
+        self.smoothed[key] = (smoothed_entropy, smoothed_reduced)
+
+        histogram = self.windows.get(key)
+        if histogram is None:
+            histogram = self.windows[key] = WindowHistogram(self.window)
+        histogram.add(data)
+        window_entropy, window_chi_square, window_p_value = histogram.metrics()
+        return {
+            "type": "metrics",
+            "source": source,
+            "packet_type": packet_type,
+            "link": link,
+            "length": len(data),
+            "entropy": round(value_entropy, 4),
+            "chi_square": round(value_chi_square, 3),
+            "reduced_chi_square": round(value_reduced, 4),
+            "smoothed_entropy": round(smoothed_entropy, 4),
+            "smoothed_reduced_chi_square": round(smoothed_reduced, 4),
+            "window_bytes": histogram.size,
+            "window_entropy": round(window_entropy, 4),
+            "window_chi_square": round(window_chi_square, 3),
+            "window_p_value": round(window_p_value, 4),
+        }
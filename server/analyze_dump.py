@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""record_dsm_*.dump 오프라인 분석기
+
+sim_mon_srv 로 실시간 재생하지 않고 dump 파일을 mmap 으로 직접 읽어 분석한다.
+색인(.idx)을 numpy 배열로 읽어 레코드 경계 기준으로 나누고, 구간마다 레코드 루프 없이 numpy 로
+계산하여 프로세스 풀에서 처리한 결과를 열 단위 파일로 저장한다.
+
+    metrics.csv     패킷별 방향/종류, 길이, 엔트로피, 카이제곱, 0x00 제외 카이제곱
+    throughput.csv  초별 방향/종류별 프레임 수, 바이트 수
+    mavlink.csv     방향별 MAVLink 메시지 종류별 개수
+    states.csv      DSM 상태(cmd 16) 변화
+
+    python3 analyze_dump.py simulator/record_dsm_ex_server_20250815a.dump
+    python3 analyze_dump.py capture.dump --jobs 8 --format parquet --output out/
+
+MAVLink 파서 상태는 구간마다 새로 시작하므로 구간 경계에 걸친 메시지 몇 개는 세지 않을 수 있다.
+"""
+import argparse
+import csv
+import mmap
+import os
+import struct
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'client'))
+
+from analysis import packet_metrics_batch  # noqa: E402
+from capture import INDEX_HEADER, INDEX_MAGIC, INDEX_VERSION, build_index, index_path, scan_records  # noqa: E402
+from dptm_mon import CMD_TABLE  # noqa: E402
+from dsm_state import STATE_FIELDS, parse_state  # noqa: E402
+
+MIN_CHUNK_BYTES = 1 << 20  # 작업 구간 최소 크기
+
+# 색인 항목 (INDEX_ENTRY '>QIBB') 을 그대로 읽는 numpy 구조체
+INDEX_DTYPE = np.dtype([("offset", ">u8"), ("ts", ">u4"), ("cmd", "u1"), ("seq", "u1")])
+
+# cmd -> (source, packet_type) 번호, 패킷 지표/MAVLink 대상 여부 조회 배열
+PAIRS = sorted({(info.source, info.packet_type) for info in CMD_TABLE})
+CMD_PAIR = np.array([PAIRS.index((info.source, info.packet_type)) for info in CMD_TABLE], dtype=np.int64)
+CMD_PAYLOAD = np.array([info.packet_type in ("plaintext", "ciphertext") for info in CMD_TABLE])
+CMD_MAVLINK = np.array([info.mavlink for info in CMD_TABLE])
+CMD_STATE = np.array([info.packet_type == "state" for info in CMD_TABLE])
+
+def load_index(path):
+    """색인(.idx) 을 INDEX_DTYPE 배열로 읽어 (entries, 마지막 레코드 끝 위치) 반환
+
+    DumpReader._load_index() 와 같이 색인이 없거나 맞지 않으면 다시 만들고,
+    색인 이후에 기록된 부분은 dump 에서 직접 읽는다. 항목마다 튜플을 만들지 않는다.
+    """
+    size = os.path.getsize(path)
+    try:
+        with open(index_path(path), 'rb') as f:
+            raw = f.read()
+        magic, version, indexed = INDEX_HEADER.unpack_from(raw)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION or indexed > size:
+            raise ValueError(index_path(path))
+    except (OSError, ValueError, struct.error):
+        build_index(path)
+        return load_index(path)
+    count = (len(raw) - INDEX_HEADER.size) // INDEX_DTYPE.itemsize
+    entries = np.frombuffer(raw, dtype=INDEX_DTYPE, count=count, offset=INDEX_HEADER.size)
+    # 헤더의 dump 크기는 flush 시점 기준: 그 뒤에 쓰인 색인 항목은 버리고 dump 에서 다시 읽음
+    entries = entries[entries["offset"] < indexed]
+    end = indexed
+    if indexed < size:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            tail, end = scan_records(data, indexed)
+        entries = np.concatenate([entries, np.array(tail, dtype=INDEX_DTYPE)])
+    return entries, end
+
+def analyze_range(task):
+    """dump 의 [start, end) 구간 레코드 분석 (프로세스 풀 작업)
+
+    entries 는 구간 안 레코드의 색인 항목. 레코드 길이, 방향/종류, 바이트 빈도를 numpy 로 한 번에
+    계산하고 MAVLink 와 상태 레코드만 Python 에서 하나씩 처리한다.
+    """
+    # pymavlink 는 가져오는 데 오래 걸리므로 실제 분석할 때만 불러온다
+    from mavlink_decoder import MavlinkDecoder
+
+    path, entries, start, end = task
+    # ndarray 로 보아 슬라이스마다 memmap 하위 클래스 처리를 거치지 않음 (mmap 은 base 로 유지)
+    data = np.memmap(path, dtype=np.uint8, mode='r', offset=start, shape=(end - start,)).view(np.ndarray)
+    offsets = entries["offset"].astype(np.int64) - start
+    ts = entries["ts"].astype(np.int64)
+    cmds = entries["cmd"]
+
+    # 레코드 헤더의 길이(>I) -> 모니터 헤더를 포함한 프레임 [offset + 8, offset + 4 + rec_len)
+    header = data[offsets[:, None] + np.arange(4)].astype(np.int64)
+    frame_starts = offsets + 8
+    frame_lengths = (header[:, 0] << 24 | header[:, 1] << 16 | header[:, 2] << 8 | header[:, 3]) - 4
+
+    # 초별 방향/종류별 프레임 수, 바이트 수
+    pairs = CMD_PAIR[cmds]
+    keys, inverse = np.unique(ts // 1000 * len(PAIRS) + pairs, return_inverse=True)
+    frames = np.bincount(inverse, minlength=len(keys))
+    byte_counts = np.bincount(inverse, weights=frame_lengths, minlength=len(keys))
+    throughput = Counter()
+    for key, frame_count, byte_count in zip(keys.tolist(), frames.tolist(), byte_counts.tolist()):
+        counter_key = (key // len(PAIRS),) + PAIRS[key % len(PAIRS)]
+        throughput[counter_key] = frame_count
+        throughput[counter_key + ("bytes",)] = int(byte_count)
+
+    # 상태/MAVLink 레코드만 Python 루프: numpy 스칼라 대신 int 목록과 bytes 슬라이스 사용
+    raw = memoryview(data)
+    payload_starts = (frame_starts + 4).tolist()
+    frame_ends = (frame_starts + frame_lengths).tolist()
+    states = []
+    for i in np.flatnonzero(CMD_STATE[cmds]).tolist():
+        state = parse_state(bytes(raw[payload_starts[i]:frame_ends[i]]))
+        if state is not None:
+            states.append((int(ts[i]), state))
+
+    payload = np.flatnonzero(CMD_PAYLOAD[cmds])
+    mavlink = Counter()
+    decoders = {"fcc": MavlinkDecoder(), "gcs": MavlinkDecoder()}
+    mavlink_rows = payload[CMD_MAVLINK[cmds[payload]] & (frame_lengths[payload] > 4)]
+    for i, cmd in zip(mavlink_rows.tolist(), cmds[mavlink_rows].tolist()):
+        source = CMD_TABLE[cmd].source
+        for message_type in decoders[source].message_types(bytes(raw[payload_starts[i]:frame_ends[i]])):
+            mavlink[(source, message_type)] += 1
+
+    # 패킷별 빈도를 한 번의 bincount 로 계산 (패킷 번호 * 256 + 바이트 값)
+    lengths = frame_lengths[payload]
+    packet_ids = np.repeat(np.arange(len(lengths)), lengths)
+    first = np.cumsum(lengths) - lengths
+    positions = np.arange(len(packet_ids)) + np.repeat(frame_starts[payload] - first, lengths)
+    counts = np.bincount(packet_ids * 256 + data[positions], minlength=len(lengths) * 256).reshape(len(lengths), 256)
+    value_entropy, value_chi_square, value_reduced = packet_metrics_batch(counts)
+
+    return {
+        "metrics": {
+            "ts_ms": entries["ts"][payload].astype(np.uint32),
+            "seq": entries["seq"][payload],
+            "cmd": cmds[payload],
+            "length": lengths,
+            "entropy": value_entropy,
+            "chi_square": value_chi_square,
+            "reduced_chi_square": value_reduced,
+        },
+        "throughput": throughput,
+        "mavlink": mavlink,
+        "states": states,
+    }
+
+def make_tasks(path, jobs):
+    """색인으로 레코드 경계에 맞춘 (path, entries, start, end) 작업 목록"""
+    entries, size = load_index(path)
+    if not len(entries):
+        return []
+    offsets = entries["offset"].astype(np.int64)
+    chunk_bytes = max(MIN_CHUNK_BYTES, size // (jobs * 4) + 1)
+    tasks = []
+    i = 0
+    while i < len(offsets):
+        # start 에서 chunk_bytes 이상 떨어진 첫 레코드가 다음 구간의 시작
+        start = int(offsets[i])
+        j = int(np.searchsorted(offsets, start + chunk_bytes))
+        end = int(offsets[j]) if j < len(offsets) else size
+        tasks.append((str(path), entries[i:j], start, end))
+        i = j
+    return tasks
+
+def merge_results(results):
+    """구간 결과를 파일 순서대로 합쳐 열 단위 표(dict of columns) 로 만든다"""
+    metrics = {}
+    for key in results[0]["metrics"]:
+        metrics[key] = np.concatenate([r["metrics"][key] for r in results])
+    cmds = metrics["cmd"]
+    metrics["source"] = np.array([CMD_TABLE[c].source for c in cmds.tolist()], dtype=object)
+    metrics["packet_type"] = np.array([CMD_TABLE[c].packet_type for c in cmds.tolist()], dtype=object)
+
+    throughput_counts = Counter()
+    mavlink_counts = Counter()
+    for r in results:
+        throughput_counts.update(r["throughput"])
+        mavlink_counts.update(r["mavlink"])
+    keys = sorted(k for k in throughput_counts if len(k) == 3)
+    throughput = {
+        "second": [k[0] for k in keys],
+        "source": [k[1] for k in keys],
+        "packet_type": [k[2] for k in keys],
+        "frames": [throughput_counts[k] for k in keys],
+        "bytes": [throughput_counts[k + ("bytes",)] for k in keys],
+    }
+    mavlink_keys = sorted(mavlink_counts, key=lambda k: (k[0], -mavlink_counts[k], k[1]))
+    mavlink = {
+        "source": [k[0] for k in mavlink_keys],
+        "message": [k[1] for k in mavlink_keys],
+        "count": [mavlink_counts[k] for k in mavlink_keys],
+    }
+
+    # 상태 값이 바뀐 레코드만 (구간 경계를 넘어 순서대로 비교)
+    states = {"ts_ms": [], "previous": [], **{field: [] for field in STATE_FIELDS}}
+    previous = None
+    for r in results:
+        for ts, state in r["states"]:
+            if state["state"] == previous:
+                continue
+            states["ts_ms"].append(ts)
+            states["previous"].append(previous)
+            for field in STATE_FIELDS:
+                states[field].append(state[field])
+            previous = state["state"]
+
+    columns = ["ts_ms", "seq", "cmd", "source", "packet_type", "length", "entropy", "chi_square", "reduced_chi_square"]
+    return {
+        "metrics": {key: metrics[key] for key in columns if key in metrics},
+        "throughput": throughput,
+        "mavlink": mavlink,
+        "states": states,
+    }
+
+def write_table(path, columns, fmt):
+    """열 단위 dict 를 CSV 또는 Parquet 으로 저장"""
+    if fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.table({name: list(values) if isinstance(values, np.ndarray) and values.dtype == object else values
+                          for name, values in columns.items()})
+        pq.write_table(table, path)
+        return
+    names = list(columns)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        # 실수 열은 numpy 로 한 번에 반올림 (값마다 round() 호출하지 않음)
+        writer.writerows(zip(*(
+            (np.round(values, 6) if values.dtype.kind == 'f' else values).tolist()
+            if isinstance(values, np.ndarray) else values
+            for values in columns.values())))
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline analysis of record_dsm_*.dump files')
+    parser.add_argument('dump', help='dump file')
+    parser.add_argument('--output', help='output directory (default: <dump>_analysis)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='worker processes')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv', help='output format')
+    args = parser.parse_args()
+
+    if args.format == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error("--format parquet requires pyarrow (pip install pyarrow)")
+
+    started = time.perf_counter()
+    tasks = make_tasks(args.dump, args.jobs)
+    if not tasks:
+        print(f"{args.dump}: no records")
+        return
+    if args.jobs > 1 and len(tasks) > 1:
+        import multiprocessing
+        with multiprocessing.Pool(min(args.jobs, len(tasks))) as pool:
+            results = pool.map(analyze_range, tasks)
+    else:
+        results = [analyze_range(task) for task in tasks]
+    tables = merge_results(results)
+
+    output = Path(args.output or f"{args.dump}_analysis")
+    output.mkdir(parents=True, exist_ok=True)
+    suffix = 'parquet' if args.format == 'parquet' else 'csv'
+    for name, columns in tables.items():
+        write_table(output / f"{name}.{suffix}", columns, args.format)
+    elapsed = time.perf_counter() - started
+
+    metrics = tables["metrics"]
+    print(f"{args.dump}: {len(tasks)} chunks, {len(metrics['cmd'])} packets, "
+          f"{sum(tables['mavlink']['count'])} MAVLink messages, {len(tables['states']['ts_ms'])} state changes "
+          f"in {elapsed:.2f}s -> {output}/")
+    for source in ("fcc", "gcs"):
+        for packet_type in ("plaintext", "ciphertext"):
+            mask = (metrics["source"] == source) & (metrics["packet_type"] == packet_type)
+            if mask.any():
+                print(f"  {source}.{packet_type:<10} packets={int(mask.sum()):>6} "
+                      f"bytes={int(metrics['length'][mask].sum()):>8} "
+                      f"entropy={metrics['entropy'][mask].mean():.3f} "
+                      f"reduced_chi_square={metrics['reduced_chi_square'][mask].mean():.3f}")
+
+if __name__ == "__main__":
+    main()
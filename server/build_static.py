@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""정적 파일 빌드: 대시보드 CSS 생성과 압축본(.gz/.br) 만들기
+
+브라우저에서 Tailwind 런타임(JIT)이 매번 CSS 를 만드는 대신, server.py INDEX_HTML 이 쓰는 class 만 골라
+static/tailwind.min.css 를 만든다. 값은 Tailwind v3 기본 테마와 기존 tailwind.config 의 색상/글꼴을 따른다.
+
+    python3 build_static.py          # CSS 생성 + static/ 압축본 생성
+    python3 build_static.py --check  # CSS 가 INDEX_HTML 과 맞는지만 확인 (다르면 종료 코드 1)
+
+class 속성에 UTILITIES 에 없는 class 가 있으면 실패한다 (규칙을 추가하거나 PLAIN_CLASSES 에 넣는다).
+JS 에서 classList 로 붙이는 class 는 페이지 전체에서 UTILITIES 이름과 같은 단어를 찾아 포함한다.
+.br 는 brotli 패키지가 있을 때만 만든다 (pip install brotli).
+"""
+import argparse
+import mimetypes
+import re
+import sys
+from pathlib import Path
+
+from static_assets import ENCODING_SUFFIXES, brotli, compress, compressible
+
+STATIC_DIR = Path(__file__).resolve().parent / 'static'
+CSS_FILE = STATIC_DIR / 'tailwind.min.css'
+
+# 기존 tailwind.config (theme.extend)
+THEME_COLORS = {
+    'light-bg': '#f8fafc',
+    'light-text': '#1e293b',
+    'light-card': '#ffffff',
+    'light-border': '#e2e8f0',
+    'light-accent': '#3b82f6',
+    'light-success': '#059669',
+    'light-warning': '#d97706',
+    'light-error': '#dc2626',
+}
+FONT_FAMILIES = {
+    'sans': 'ui-sans-serif, system-ui, sans-serif, "Apple Color Emoji", "Segoe UI Emoji"',
+    'mono': '"Courier New", monospace',
+}
+
+# Tailwind 기본 색상 (사용하는 것만)
+COLORS = {
+    'transparent': 'transparent',
+    'white': '#fff',
+    'black': '#000',
+    'gray-50': '#f9fafb', 'gray-100': '#f3f4f6', 'gray-200': '#e5e7eb', 'gray-300': '#d1d5db',
+    'gray-400': '#9ca3af', 'gray-500': '#6b7280', 'gray-600': '#4b5563', 'gray-700': '#374151',
+    'gray-800': '#1f2937', 'gray-900': '#111827',
+    **THEME_COLORS,
+}
+SPACING = {'0': '0px', 'px': '1px', '0.5': '0.125rem', '1.5': '0.375rem', '2.5': '0.625rem', '3.5': '0.875rem',
+           **{str(n): f'{n * 0.25:g}rem' for n in (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 14, 16, 20, 24, 28, 32,
+                                                   36, 40, 44, 48, 52, 56, 60, 64, 72, 80, 96)}}
+FONT_SIZES = {'xs': ('0.75rem', '1rem'), 'sm': ('0.875rem', '1.25rem'), 'base': ('1rem', '1.5rem'),
+              'lg': ('1.125rem', '1.75rem'), 'xl': ('1.25rem', '1.75rem'), '2xl': ('1.5rem', '2rem'),
+              '3xl': ('1.875rem', '2.25rem')}
+RADII = {'none': '0px', 'sm': '0.125rem', '': '0.25rem', 'md': '0.375rem', 'lg': '0.5rem', 'xl': '0.75rem',
+         'full': '9999px'}
+SHADOWS = {'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
+           '': '0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)',
+           'md': '0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+           'none': '0 0 #0000'}
+EASING = 'cubic-bezier(0.4, 0, 0.2, 1)'
+
+# Tailwind 가 아닌 class (JS/D3 선택자용, CSS 없음)
+PLAIN_CLASSES = {'tab-content'}
+
+# Tailwind v3 preflight 요약 (사용하는 요소만)
+PREFLIGHT = (
+    '*,::before,::after{box-sizing:border-box;border-width:0;border-style:solid;border-color:#e5e7eb}'
+    f'html{{line-height:1.5;-webkit-text-size-adjust:100%;tab-size:4;font-family:{FONT_FAMILIES["sans"]}}}'
+    'body{margin:0;line-height:inherit}'
+    'h1,h2,h3,h4,h5,h6{font-size:inherit;font-weight:inherit}'
+    'h1,h2,h3,h4,h5,h6,p,pre{margin:0}'
+    'button,input,select,textarea{font-family:inherit;font-size:100%;font-weight:inherit;line-height:inherit;'
+    'color:inherit;margin:0;padding:0}'
+    'button,select{text-transform:none}'
+    'button{-webkit-appearance:button;background-color:transparent;background-image:none;cursor:pointer}'
+    'img,svg,video,canvas{display:block;vertical-align:middle}'
+    'img,video{max-width:100%;height:auto}'
+    '[hidden]{display:none}'
+)
+
+def name(prefix, key):
+    return f'{prefix}-{key}' if key else prefix
+
+def utility_rules():
+    """(class 이름, CSS 선언, 자식 선택자) 목록 - Tailwind 플러그인 순서 (뒤의 규칙이 우선)"""
+    rules = []
+
+    def add(cls, decls, child=''):
+        rules.append((cls, decls, child))
+
+    for value in ('none', 'auto'):
+        add(f'pointer-events-{value}', f'pointer-events:{value}')
+    for value in ('static', 'fixed', 'absolute', 'relative', 'sticky'):
+        add(value, f'position:{value}')
+    for side in ('top', 'right', 'bottom', 'left'):
+        for key, size in SPACING.items():
+            add(f'{side}-{key}', f'{side}:{size}')
+    for z in (0, 10, 20, 30, 40, 50):
+        add(f'z-{z}', f'z-index:{z}')
+    for n in range(1, 13):
+        add(f'col-span-{n}', f'grid-column:span {n} / span {n}')
+    add('col-span-full', 'grid-column:1 / -1')
+    for prefix, props in (('m', ('margin',)), ('mx', ('margin-left', 'margin-right')),
+                          ('my', ('margin-top', 'margin-bottom')), ('mt', ('margin-top',)),
+                          ('mr', ('margin-right',)), ('mb', ('margin-bottom',)), ('ml', ('margin-left',))):
+        for key, size in SPACING.items():
+            add(f'{prefix}-{key}', ';'.join(f'{prop}:{size}' for prop in props))
+    for value in ('block', 'inline-block', 'inline', 'flex', 'inline-flex', 'grid'):
+        add(value, f'display:{value}')
+    add('hidden', 'display:none')
+    for prefix, prop in (('h', 'height'), ('w', 'width')):
+        for key, size in SPACING.items():
+            add(f'{prefix}-{key}', f'{prop}:{size}')
+        add(f'{prefix}-full', f'{prop}:100%')
+        add(f'{prefix}-auto', f'{prop}:auto')
+    add('h-screen', 'height:100vh')
+    add('flex-1', 'flex:1 1 0%')
+    add('flex-auto', 'flex:1 1 auto')
+    add('flex-none', 'flex:none')
+    add('shrink-0', 'flex-shrink:0')
+    add('grow', 'flex-grow:1')
+    add('cursor-pointer', 'cursor:pointer')
+    add('cursor-default', 'cursor:default')
+    for n in range(1, 13):
+        add(f'grid-cols-{n}', f'grid-template-columns:repeat({n}, minmax(0, 1fr))')
+    add('flex-row', 'flex-direction:row')
+    add('flex-col', 'flex-direction:column')
+    add('flex-wrap', 'flex-wrap:wrap')
+    for key, value in (('start', 'flex-start'), ('end', 'flex-end'), ('center', 'center'), ('stretch', 'stretch')):
+        add(f'items-{key}', f'align-items:{value}')
+    for key, value in (('start', 'flex-start'), ('end', 'flex-end'), ('center', 'center'),
+                       ('between', 'space-between')):
+        add(f'justify-{key}', f'justify-content:{value}')
+    for key, size in SPACING.items():
+        add(f'gap-{key}', f'gap:{size}')
+    for key, size in SPACING.items():
+        add(f'space-x-{key}', f'margin-right:0;margin-left:{size}', ' > :not([hidden]) ~ :not([hidden])')
+        add(f'space-y-{key}', f'margin-bottom:0;margin-top:{size}', ' > :not([hidden]) ~ :not([hidden])')
+    for axis in ('', '-x', '-y'):
+        for value in ('auto', 'hidden', 'scroll', 'visible'):
+            add(f'overflow{axis}-{value}', f'overflow{axis}:{value}')
+    for value in ('normal', 'nowrap', 'pre', 'pre-line', 'pre-wrap'):
+        add(f'whitespace-{value}', f'white-space:{value}')
+    add('truncate', 'overflow:hidden;text-overflow:ellipsis;white-space:nowrap')
+    for key, size in RADII.items():
+        add(name('rounded', key), f'border-radius:{size}')
+    for side, corners in (('t', ('top-left', 'top-right')), ('r', ('top-right', 'bottom-right')),
+                          ('b', ('bottom-right', 'bottom-left')), ('l', ('top-left', 'bottom-left'))):
+        for key, size in RADII.items():
+            add(name(f'rounded-{side}', key), ';'.join(f'border-{corner}-radius:{size}' for corner in corners))
+    for width in ('0', '', '2', '4'):
+        add(name('border', width), f'border-width:{width or 1}px')
+    for side, prop in (('t', 'top'), ('r', 'right'), ('b', 'bottom'), ('l', 'left')):
+        for width in ('0', '', '2', '4'):
+            add(name(f'border-{side}', width), f'border-{prop}-width:{width or 1}px')
+    for key, color in COLORS.items():
+        add(f'border-{key}', f'border-color:{color}')
+    for key, color in COLORS.items():
+        add(f'bg-{key}', f'background-color:{color}')
+    for prefix, props in (('p', ('padding',)), ('px', ('padding-left', 'padding-right')),
+                          ('py', ('padding-top', 'padding-bottom')), ('pt', ('padding-top',)),
+                          ('pr', ('padding-right',)), ('pb', ('padding-bottom',)), ('pl', ('padding-left',))):
+        for key, size in SPACING.items():
+            add(f'{prefix}-{key}', ';'.join(f'{prop}:{size}' for prop in props))
+    for value in ('left', 'center', 'right'):
+        add(f'text-{value}', f'text-align:{value}')
+    for key, family in FONT_FAMILIES.items():
+        add(f'font-{key}', f'font-family:{family}')
+    for key, (size, line_height) in FONT_SIZES.items():
+        add(f'text-{key}', f'font-size:{size};line-height:{line_height}')
+    for key, weight in (('normal', 400), ('medium', 500), ('semibold', 600), ('bold', 700)):
+        add(f'font-{key}', f'font-weight:{weight}')
+    for key, color in COLORS.items():
+        add(f'text-{key}', f'color:{color}')
+    for value in (0, 5, 10, 20, 25, 30, 40, 50, 60, 70, 75, 80, 90, 95, 100):
+        add(f'opacity-{value}', f'opacity:{value / 100:g}')
+    for key, shadow in SHADOWS.items():
+        add(name('shadow', key), f'box-shadow:{shadow}')
+    add('transition', 'transition-property:color, background-color, border-color, text-decoration-color, fill, '
+        f'stroke, opacity, box-shadow, transform, filter;transition-timing-function:{EASING};'
+        'transition-duration:150ms')
+    add('transition-colors', 'transition-property:color, background-color, border-color, text-decoration-color, '
+        f'fill, stroke;transition-timing-function:{EASING};transition-duration:150ms')
+    for ms in (75, 100, 150, 200, 300, 500, 700, 1000):
+        add(f'duration-{ms}', f'transition-duration:{ms}ms')
+    return rules
+
+UTILITIES = utility_rules()
+UTILITY_NAMES = {cls for cls, _, _ in UTILITIES}
+VARIANTS = {'hover': ':hover', 'focus': ':focus'}
+ARBITRARY = re.compile(r'^(h|w|top|right|bottom|left)-\[([^\]\s]+)\]$')
+ARBITRARY_PROPS = {'h': 'height', 'w': 'width', 'top': 'top', 'right': 'right', 'bottom': 'bottom', 'left': 'left'}
+
+def escape(cls):
+    """class 이름 -> CSS 선택자"""
+    return '.' + re.sub(r'([:\[\].%/])', r'\\\1', cls)
+
+def split_variant(cls):
+    variant, _, base = cls.rpartition(':')
+    return (variant, base) if variant in VARIANTS else ('', cls)
+
+def is_known(cls):
+    _, base = split_variant(cls)
+    return base in UTILITY_NAMES or ARBITRARY.match(base) is not None
+
+def page_classes(html):
+    """(class 속성에 쓴 class, 알 수 없는 class, JS 문자열에서 찾은 utility class)"""
+    used = set()
+    for match in re.finditer(r'class="([^"]*)"', html):
+        used.update(match.group(1).split())
+    unknown = sorted(cls for cls in used if cls not in PLAIN_CLASSES and not is_known(cls))
+    # classList.add('hidden') 처럼 JS 에서 붙이는 class
+    scripted = {token for token in re.findall(r"[\w:\[\]\-./%]+", html) if is_known(token)}
+    return used, unknown, scripted
+
+def build_css(classes):
+    """class 목록 -> 최소화한 CSS (preflight + Tailwind 순서의 utility, variant 는 뒤에)"""
+    rules = [PREFLIGHT]
+    arbitrary = sorted(cls for cls in classes if ARBITRARY.match(split_variant(cls)[1]))
+    for variant in ('',) + tuple(VARIANTS):
+        wanted = {split_variant(cls)[1] for cls in classes if split_variant(cls)[0] == variant}
+        prefix = f'{variant}:' if variant else ''
+        pseudo = VARIANTS.get(variant, '')
+        for cls, decls, child in UTILITIES:
+            if cls in wanted:
+                rules.append(f'{escape(prefix + cls)}{pseudo}{child}{{{decls}}}')
+        for cls in arbitrary:
+            item_variant, base = split_variant(cls)
+            if item_variant == variant:
+                key, value = ARBITRARY.match(base).groups()
+                rules.append(f'{escape(cls)}{pseudo}{{{ARBITRARY_PROPS[key]}:{value}}}')
+    return '\n'.join(rules) + '\n'
+
+def write_compressed(directory):
+    """압축할 만한 정적 파일마다 .gz (와 brotli 가 있으면 .br) 생성, (파일, 원본, 압축본 크기) 목록 반환"""
+    results = []
+    for path in sorted(directory.iterdir()):
+        if not path.is_file() or path.suffix in ('.gz', '.br'):
+            continue
+        body = path.read_bytes()
+        content_type = mimetypes.guess_type(path.name)[0] or ''
+        if not compressible(content_type, body):
+            continue
+        sizes = {}
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            if encoding == "br" and brotli is None:
+                continue
+            data = compress(body, encoding)
+            path.with_name(path.name + suffix).write_bytes(data)
+            sizes[encoding] = len(data)
+        results.append((path.name, len(body), sizes))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Build dashboard CSS and precompressed static files')
+    parser.add_argument('--check', action='store_true', help='only check that tailwind.min.css is up to date')
+    args = parser.parse_args()
+
+    from server import INDEX_HTML
+
+    used, unknown, scripted = page_classes(INDEX_HTML)
+    if unknown:
+        print(f"unknown classes (add a rule to UTILITIES or PLAIN_CLASSES): {' '.join(unknown)}")
+        sys.exit(1)
+    css = build_css((used - PLAIN_CLASSES) | scripted)
+
+    if args.check:
+        current = CSS_FILE.read_text(encoding='utf-8') if CSS_FILE.exists() else ''
+        if current != css:
+            print(f"{CSS_FILE.name} is out of date: run python3 build_static.py")
+            sys.exit(1)
+        print(f"{CSS_FILE.name} is up to date")
+        return
+
+    CSS_FILE.write_text(css, encoding='utf-8', newline='\n')
+    print(f"{CSS_FILE.name}: {len(used | scripted)} classes, {len(css)} bytes")
+    for filename, size, sizes in write_compressed(STATIC_DIR):
+        parts = ' '.join(f"{encoding}={compressed}" for encoding, compressed in sizes.items())
+        print(f"  {filename:<20} {size:>8} -> {parts}")
+    if brotli is None:
+        print("brotli not installed: .br files skipped (pip install brotli)")
+
+if __name__ == "__main__":
+    main()
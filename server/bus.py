@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""워커 프로세스 사이 pub/sub 버스 (Unix domain socket hub)
+
+WORKERS > 1 이면 server.py 가 워커 프로세스 N 개를 SO_REUSEPORT 로 같은 WEB_PORT 에 띄우고
+부모 프로세스는 BusHub 를 실행한다. producer(client.py) 는 워커 하나에만 연결되므로 그 워커가
+받은 웹소켓 메시지를 버스에 한 번 보내고, hub 가 다른 모든 워커에 전달하여 각 워커가 자기 대시보드에 중계한다.
+
+    레코드: [length(4, BE)] [kind(1)] [body]
+    kind    BUS_TEXT (producer text 메시지, UTF-8), BUS_BINARY (producer binary 메시지), BUS_STATS (워커 /stats JSON)
+
+느린 워커가 있어도 hub 와 다른 워커가 멈추지 않도록 쓰기 버퍼가 max_buffer 를 넘으면 그 워커에 보낼 레코드는 버린다.
+"""
+import asyncio
+import logging
+import os
+import struct
+
+BUS_RECORD_STRUCT = struct.Struct('>IB')
+BUS_TEXT = 1
+BUS_BINARY = 2
+BUS_STATS = 3
+BUS_MAX_BUFFER = 16 * 1024 * 1024  # 연결별 최대 쓰기 버퍼 (bytes)
+CONNECT_TIMEOUT = 10.0             # 워커가 hub 에 연결을 시도하는 시간 (초)
+
+logger = logging.getLogger("dsm-viz.bus")
+
+def encode_record(kind, body):
+    return BUS_RECORD_STRUCT.pack(len(body), kind) + body
+
+async def read_record(reader):
+    """레코드 1개 읽기 -> (kind, body), 연결이 끊기면 asyncio.IncompleteReadError"""
+    length, kind = BUS_RECORD_STRUCT.unpack(await reader.readexactly(BUS_RECORD_STRUCT.size))
+    return kind, await reader.readexactly(length)
+
+def write_record(writer, record, max_buffer):
+    """버퍼가 max_buffer 이하이면 쓰고 True, 넘으면 버리고 False (블로킹 없음)"""
+    if writer.transport.get_write_buffer_size() > max_buffer:
+        return False
+    writer.write(record)
+    return True
+
+class BusHub:
+    """워커에서 받은 레코드를 보낸 워커를 뺀 모든 워커에 전달"""
+
+    def __init__(self, path, max_buffer=BUS_MAX_BUFFER):
+        self.path = path
+        self.max_buffer = max_buffer
+        self.peers = set()
+        self.tasks = set()  # 연결별 _handle task
+        self.records = 0
+        self.dropped = 0
+        self.server = None
+
+    async def start(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)  # 이전 실행이 남긴 소켓 파일
+        self.server = await asyncio.start_unix_server(self._handle, self.path)
+
+    async def close(self):
+        if self.server:
+            self.server.close()
+        # 연결을 닫아 _handle 이 EOF 로 끝나게 한다 (이벤트 루프 종료 시 취소되지 않도록 기다림)
+        for writer in list(self.peers):
+            writer.close()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        if self.server:
+            await self.server.wait_closed()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def _handle(self, reader, writer):
+        task = asyncio.current_task()
+        self.tasks.add(task)
+        self.peers.add(writer)
+        try:
+            while True:
+                kind, body = await read_record(reader)
+                record = encode_record(kind, body)
+                self.records += 1
+                for peer in self.peers:
+                    if peer is not writer and not write_record(peer, record, self.max_buffer):
+                        self.dropped += 1
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.peers.discard(writer)
+            self.tasks.discard(task)
+            writer.close()
+
+class BusClient:
+    """워커의 hub 연결: publish() 로 보내고 받은 레코드는 on_record(kind, body) 로 전달"""
+
+    def __init__(self, path, on_record, max_buffer=BUS_MAX_BUFFER):
+        self.path = path
+        self.on_record = on_record
+        self.max_buffer = max_buffer
+        self.reader = None
+        self.writer = None
+        self.published = 0
+        self.received = 0
+        self.dropped = 0
+
+    async def connect(self, timeout=CONNECT_TIMEOUT):
+        """hub 가 소켓을 만들 때까지 재시도하며 연결"""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            try:
+                self.reader, self.writer = await asyncio.open_unix_connection(self.path)
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                if asyncio.get_running_loop().time() > deadline:
+                    raise
+                await asyncio.sleep(0.1)
+
+    def publish(self, kind, body):
+        if self.writer is None:
+            return
+        if write_record(self.writer, encode_record(kind, body), self.max_buffer):
+            self.published += 1
+        else:
+            self.dropped += 1
+
+    async def run(self):
+        """hub 연결이 끊길 때까지 받은 레코드 처리 (끊기면 반환: hub 프로세스가 종료됨)"""
+        try:
+            while True:
+                kind, body = await read_record(self.reader)
+                self.received += 1
+                try:
+                    self.on_record(kind, body)
+                except Exception as e:
+                    logger.warning("bus record error: kind=%d error=%s", kind, e)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.writer.close()
+            self.writer = None
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""WebSocket 클라이언트별 송신 큐
+
+브로드캐스트는 큐에 넣기만 하고 실제 전송은 클라이언트별 writer task 가 한다.
+느린 브라우저가 있어도 다른 클라이언트 전송과 producer 수신이 멈추지 않는다.
+
+넘침 정책:
+- drop-oldest: 원시 패킷 등. 큐가 가득 차면 가장 오래된 메시지를 버린다.
+- keep-latest: state/metrics 등. 큐가 high_water 미만이면 다른 메시지와 같이 순서대로 모두 보내고,
+  밀려 있을 때만 같은 키의 대기 중인 메시지를 최신 값으로 교체한다.
+
+latency(LatencyStats) 를 주면 put() 부터 전송 완료까지의 시간을 relay 구간으로 기록한다.
+"""
+import asyncio
+import json
+import time
+from collections import Counter, deque
+
+class ClientQueue:
+    """클라이언트 1개의 bounded 송신 큐와 writer task"""
+
+    def __init__(self, ws, maxsize=256, name="", latency=None, high_water=None):
+        self.ws = ws
+        self.name = name
+        self.maxsize = maxsize
+        self.high_water = maxsize // 2 if high_water is None else high_water  # 이 깊이부터 keep-latest 교체
+        self.packets = deque()  # 순서대로 보낼 메시지: (enqueue time, data, latest_key)
+        self.latest = {}        # keep-latest (밀려 있는 동안): key -> (enqueue time, data)
+        self.pending = Counter()  # packets 안의 latest_key 별 메시지 수
+        self.wakeup = asyncio.Event()
+        self.sent = 0
+        self.sent_bytes = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+        self.latency = latency
+        self.task = asyncio.create_task(self._writer())
+
+    def put(self, data, latest_key=None, latest_data=None):
+        """메시지 추가 (블로킹 없음). latest_key 가 있으면 큐가 밀려 있을 때 keep-latest 정책
+
+        latest_data 를 주면 교체할 때 data 대신 남긴다 (변경분 메시지 대신 전체 상태 등).
+        dict 이면 실제로 교체할 때만 JSON 으로 직렬화한다 (밀리지 않은 클라이언트에는 필요 없음).
+        """
+        if self.closed:
+            return
+        now = time.monotonic()
+        if latest_key is not None and self.depth() >= self.high_water:
+            if latest_data is None:
+                latest_data = data
+            elif isinstance(latest_data, dict):
+                latest_data = json.dumps(latest_data)
+            self._coalesce(latest_key, (now, latest_data))
+        else:
+            if len(self.packets) >= self.maxsize:
+                self._drop_oldest()
+            self.packets.append((now, data, latest_key))
+            if latest_key is not None:
+                self.pending[latest_key] += 1
+        self.wakeup.set()
+
+    def _coalesce(self, key, item):
+        """key 의 대기 중인 메시지를 item 으로 교체 (packets 에 남은 같은 키의 이전 메시지도 뺀다)"""
+        if self.pending[key]:
+            self.coalesced += self.pending.pop(key)
+            self.packets = deque(entry for entry in self.packets if entry[2] != key)
+        if key in self.latest:
+            self.coalesced += 1
+        self.latest[key] = item
+
+    def _drop_oldest(self):
+        """가장 오래된 메시지를 버림, keep-latest 메시지는 같은 키의 최신 값이 없으면 latest 로 옮긴다"""
+        queued, data, key = self.packets.popleft()
+        if key is None:
+            self.dropped += 1
+            return
+        self._sent_pending(key)
+        if key in self.latest:
+            self.coalesced += 1
+        else:
+            self.latest[key] = (queued, data)
+
+    def _sent_pending(self, key):
+        self.pending[key] -= 1
+        if not self.pending[key]:
+            del self.pending[key]
+
+    def depth(self):
+        return len(self.packets) + len(self.latest)
+
+    def lag(self):
+        """가장 오래 대기 중인 메시지의 대기 시간 (초)"""
+        oldest = [t for t, _ in self.latest.values()]
+        if self.packets:
+            oldest.append(self.packets[0][0])
+        return time.monotonic() - min(oldest) if oldest else 0.0
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "queued": self.depth(),
+            "lag_ms": round(self.lag() * 1000, 1),
+            "sent": self.sent,
+            "sent_bytes": self.sent_bytes,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+    async def _send(self, data, queued):
+        if isinstance(data, str):
+            await self.ws.send_str(data)
+        else:
+            await self.ws.send_bytes(data)
+        self.sent += 1
+        self.sent_bytes += len(data)
+        if self.latency is not None:
+            self.latency.observe("relay", (time.monotonic() - queued) * 1000)
+
+    async def _writer(self):
+        try:
+            while True:
+                await self.wakeup.wait()
+                self.wakeup.clear()
+                while self.latest or self.packets:
+                    if self.latest:
+                        latest, self.latest = self.latest, {}
+                        for queued, data in latest.values():
+                            await self._send(data, queued)
+                    while self.packets and not self.latest:
+                        queued, data, key = self.packets.popleft()
+                        if key is not None:
+                            self._sent_pending(key)
+                        await self._send(data, queued)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # 전송 실패: 연결 종료는 websocket_handler 에서 처리
+            self.closed = True
+            await self.ws.close()
+
+    def close(self):
+        self.closed = True
+        self.task.cancel()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""최근 데이터 링 버퍼 (늦게 접속한 대시보드용 스냅샷)
+
+토픽별 최근 패킷 N 개, metrics 키별 최근 통계 M 개, link 별 최신 DSM 상태를 보관한다.
+DSM 상태는 client.py 가 바뀐 필드만 보내므로 link 별 전체 상태에 합쳐 둔다 (중계는 변경분 그대로).
+deque(maxlen) 을 사용하므로 메모리 사용량은 설정값으로 제한된다.
+"""
+import json
+import time
+from collections import deque
+
+MAX_TOPICS = 32  # 보관할 최대 토픽 수 (임의 토픽으로 메모리가 늘어나지 않도록)
+MAX_LINKS = 256  # client.py 의 link 번호 범위
+
+class HistoryStore:
+    """토픽별 최근 패킷/통계/상태 보관"""
+
+    def __init__(self, packet_limit=32, metric_limit=1000):
+        self.packet_limit = packet_limit
+        self.metric_limit = metric_limit
+        self.packets = {}  # topic -> deque of 원본 메시지 (text/binary)
+        self.metrics = {}  # "source.packet_type.link" -> deque of [time ms, smoothed_entropy, smoothed_reduced_chi_square]
+        self.states = {}  # link -> 전체 state 메시지 (dict, full=true)
+
+    def add_state(self, data):
+        """state 메시지 (JSON 텍스트) 를 link 의 상태에 합치고 합친 전체 state 메시지 반환, 잘못된 메시지이면 None
+
+        full 이 true 이면 상태를 새로 시작하고, false 이면 바뀐 필드만 덮어쓴다.
+        """
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return None
+        if not isinstance(message, dict) or not isinstance(message.get("fields"), dict):
+            return None
+        link = message.get("link", 0)
+        if not isinstance(link, int) or not 0 <= link < MAX_LINKS:
+            return None
+        state = self.states.get(link)
+        if state is None or message.get("full"):
+            state = self.states[link] = {"topic": "state", "type": "state", "link": link, "full": True, "fields": {}}
+        state["seq"] = message.get("seq")
+        state["timestamp"] = message.get("timestamp")
+        state["fields"].update(message["fields"])
+        return state
+
+    def add_packet(self, topic, data):
+        """중계한 메시지 보관"""
+        if self.packet_limit <= 0:
+            return
+        packets = self.packets.get(topic)
+        if packets is None:
+            if len(self.packets) >= MAX_TOPICS:
+                return
+            packets = self.packets[topic] = deque(maxlen=self.packet_limit)
+        packets.append(data)
+
+    def add_metric(self, metric):
+        """MetricTracker.update() 결과 보관"""
+        if self.metric_limit <= 0:
+            return
+        key = f"{metric['source']}.{metric['packet_type']}.{metric.get('link', 0)}"
+        points = self.metrics.get(key)
+        if points is None:
+            points = self.metrics[key] = deque(maxlen=self.metric_limit)
+        points.append([int(time.time() * 1000), metric["smoothed_entropy"], metric["smoothed_reduced_chi_square"]])
+
+    def snapshot(self):
+        """snapshot 메시지 (text): metrics 시계열과 link 별 최신 state"""
+        return json.dumps({
+            "type": "snapshot",
+            "now": int(time.time() * 1000),
+            "metrics": {key: list(points) for key, points in self.metrics.items()},
+            "states": [self.states[link] for link in sorted(self.states)],
+        })
+
+    def state_messages(self):
+        """link 별 전체 state 메시지 (text) 목록"""
+        return [json.dumps(self.states[link]) for link in sorted(self.states)]
+
+    def packet_messages(self, topics):
+        """구독 토픽의 보관 패킷 메시지 목록 ("*" = 전체)"""
+        return [(topic, data) for topic, packets in self.packets.items()
+                if "*" in topics or topic in topics
+                for data in packets]
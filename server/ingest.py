@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""server.py 안에서 DSM 모니터 대상에 직접 연결 (INGEST_TARGETS)
+
+client.py 를 거치면 프레임마다 DSM TCP -> client.py -> 웹소켓(loopback) -> server.py 로 프로세스 2개와
+웹소켓 송수신을 한 번 더 거친다. 같은 호스트에서는 INGEST_TARGETS="host:port,..." 로 server.py 가
+client.py 의 대상별 재연결 루프(monitor_target), 프레임 읽기(FrameReader), 분류(CMD_TABLE), MAVLink 디코딩을
+같은 이벤트 루프의 task 로 실행하고 만들어진 메시지를 웹소켓 대신 LocalSink 로 받아 바로 중계한다.
+
+client.py 의 MessageBatcher 로 묶으므로 대시보드가 받는 메시지/배치 형식은 client.py 를 쓸 때와 같다.
+WIRE_FORMAT, BATCH_MAX_*, RESTART_DELAY* 는 client.py 설정(환경 변수, client/.env)을 따르며 RECORD_FILE 기록은 하지 않는다.
+원격 설치에서는 지금처럼 client.py 를 쓴다.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'client'))
+
+# client.py 의 load_dotenv() 는 client/.env 를 읽지만 이미 설정된 환경 변수는 덮어쓰지 않는다
+import client  # noqa: E402
+
+class LocalSink:
+    """SharedWebsocket 대신 handle_frame()/MessageBatcher 가 쓰는 수신자: send() 한 메시지를 relay(message) 로 중계"""
+
+    def __init__(self, relay):
+        self.relay = relay
+        self.connected = asyncio.Event()
+        self.connected.set()  # 항상 연결됨 (monitor_target 이 기다리지 않음)
+        self.generation = 1   # 서버와 같은 프로세스이므로 다시 연결되는 일이 없음 (StateTracker)
+        self.messages = 0
+
+    async def send(self, message):
+        self.messages += 1
+        self.relay(message)
+
+async def run_ingest(targets, relay):
+    """대상(client.Target 목록)마다 monitor_target task 실행 (대상별 재연결/backoff 는 client.py 와 같음)"""
+    sink = LocalSink(relay)
+    sender = client.MessageBatcher(sink) if client.BATCH_MAX_COUNT > 1 else sink
+    try:
+        await asyncio.gather(*(client.monitor_target(target, sender) for target in targets))
+    finally:
+        if sender is not sink:
+            await sender.flush()
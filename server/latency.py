@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""구간별 지연 시간 히스토그램 (p50/p95/p99)
+
+    client           DSM 프레임 수신 (client.py monitor_client) -> 서버 수신 (websocket_handler)
+    relay            서버 수신 -> 대시보드 웹소켓 전송 완료 (ClientQueue)
+    browser_receive  DSM 프레임 수신 -> 대시보드 ws.onmessage (대시보드가 보고)
+    render           대시보드 ws.onmessage -> 그 메시지를 처리한 화면 갱신 완료 (대시보드가 보고)
+    end_to_end       DSM 프레임 수신 -> 화면 갱신 완료 (대시보드가 보고)
+
+client/browser_receive/end_to_end 는 다른 프로세스의 timestamp 를 비교하므로 epoch 에 맞춘 시계(now())를 쓴다.
+호스트가 다르면 시간 동기화 오차가 포함되며, 음수 값은 0 으로 세고 negative 로 따로 센다.
+히스토그램은 로그 간격 구간이고 window 초마다 교체하여 최근 1-2 구간의 값만 집계한다.
+"""
+import math
+import time
+
+STAGES = ("client", "relay", "browser_receive", "render", "end_to_end")
+BROWSER_STAGES = ("browser_receive", "render", "end_to_end")
+MIN_MS = 0.01           # 첫 구간 상한 (ms)
+BUCKETS_PER_OCTAVE = 8  # 2배마다 구간 8개 (상대 오차 약 9%)
+BUCKET_COUNT = 26 * BUCKETS_PER_OCTAVE + 1  # 약 670 초까지, 넘으면 마지막 구간
+MAX_REPORT_SAMPLES = 10000  # 대시보드 보고 1개에서 구간별로 받는 최대 값 수
+
+# 단조 시계(time.monotonic)를 시작 시점의 epoch 에 맞춘 시계: 시스템 시간이 바뀌어도 거꾸로 가지 않는다
+CLOCK_OFFSET = time.time() - time.monotonic()
+
+def now():
+    """epoch 기준 현재 시각 (초, 단조 증가)"""
+    return time.monotonic() + CLOCK_OFFSET
+
+def bucket_index(ms):
+    if ms <= MIN_MS:
+        return 0
+    return min(BUCKET_COUNT - 1, 1 + int(math.log2(ms / MIN_MS) * BUCKETS_PER_OCTAVE))
+
+def bucket_upper(index):
+    """구간의 상한 (ms)"""
+    return MIN_MS * 2 ** (index / BUCKETS_PER_OCTAVE)
+
+class LatencyHistogram:
+    """로그 간격 구간 히스토그램 (ms)"""
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.negative = 0
+
+    def add(self, ms):
+        if ms < 0:
+            self.negative += 1
+            ms = 0.0
+        self.counts[bucket_index(ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def merge(self, other):
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.negative += other.negative
+
+    def percentile(self, q):
+        """q (0-1) 분위 값: 해당 구간의 상한 (최대값을 넘지 않음)"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bucket_upper(i), self.max)
+        return self.max
+
+    def summary(self):
+        def ms(value):
+            return None if value is None else round(value, 3)
+        return {
+            "count": self.count,
+            "p50": ms(self.percentile(0.50)),
+            "p95": ms(self.percentile(0.95)),
+            "p99": ms(self.percentile(0.99)),
+            "max": ms(self.max if self.count else None),
+            "mean": ms(self.total / self.count if self.count else None),
+            "negative": self.negative,
+        }
+
+class LatencyStats:
+    """구간별 히스토그램 (현재/이전 window 2개를 교체)"""
+
+    def __init__(self, window=60.0):
+        self.window = window
+        self.current = {stage: LatencyHistogram() for stage in STAGES}
+        self.previous = {stage: LatencyHistogram() for stage in STAGES}
+        self.rotated = time.monotonic()
+        self.reports = 0  # 받은 대시보드 보고 수
+
+    def _rotate(self):
+        elapsed = time.monotonic() - self.rotated
+        if elapsed < self.window:
+            return
+        # 한 window 이상 값이 없었으면 이전 구간도 비움
+        self.previous = self.current if elapsed < 2 * self.window else {stage: LatencyHistogram() for stage in STAGES}
+        self.current = {stage: LatencyHistogram() for stage in STAGES}
+        self.rotated = time.monotonic()
+
+    def observe(self, stage, ms):
+        self._rotate()
+        self.current[stage].add(ms)
+
+    def add_report(self, stages):
+        """대시보드 latency 메시지의 stages ({stage: [ms, ...]}) 추가, 모르는 구간과 숫자가 아닌 값은 무시"""
+        if not isinstance(stages, dict):
+            return
+        self._rotate()
+        self.reports += 1
+        for stage in BROWSER_STAGES:
+            values = stages.get(stage)
+            if not isinstance(values, list):
+                continue
+            histogram = self.current[stage]
+            for value in values[:MAX_REPORT_SAMPLES]:
+                if isinstance(value, (int, float)) and math.isfinite(value):
+                    histogram.add(value)
+
+    def summary(self):
+        """/metrics 응답: 구간별 count, p50/p95/p99, max, mean (ms)"""
+        self._rotate()
+        stages = {}
+        for stage in STAGES:
+            histogram = LatencyHistogram()
+            histogram.merge(self.previous[stage])
+            histogram.merge(self.current[stage])
+            stages[stage] = histogram.summary()
+        return {"window_s": self.window, "reports": self.reports, "stages": stages}
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""서버 로그 채널
+
+메시지마다 print 하는 대신 logging 레벨(LOG_LEVEL)로 출력을 조절하고,
+중계 통계는 LOG_INTERVAL 초마다 요약 한 줄로 남긴다.
+"""
+import logging
+import time
+
+def setup_logging(level="INFO"):
+    logging.basicConfig(
+        level=getattr(logging, str(level).upper(), logging.INFO),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    # 요청마다 남는 aiohttp 접근 로그는 DEBUG 에서만 출력
+    if logging.getLogger().level > logging.DEBUG:
+        logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+    return logging.getLogger("dsm-viz")
+
+class RateLimitedLog:
+    """interval 초마다 최대 limit 개만 출력하고 나머지는 생략한 개수만 남긴다"""
+
+    def __init__(self, logger, limit=5, interval=1.0):
+        self.logger = logger
+        self.limit = limit
+        self.interval = interval
+        self.window_start = time.monotonic()
+        self.count = 0
+        self.suppressed = 0
+
+    def log(self, level, msg, *args):
+        if not self.logger.isEnabledFor(level):
+            return
+        now = time.monotonic()
+        if now - self.window_start >= self.interval:
+            if self.suppressed:
+                self.logger.log(level, "%d similar messages suppressed", self.suppressed)
+            self.window_start = now
+            self.count = 0
+            self.suppressed = 0
+        if self.count < self.limit:
+            self.count += 1
+            self.logger.log(level, msg, *args)
+        else:
+            self.suppressed += 1
+
+class RelayStats:
+    """요약 로그용 중계 카운터 (구간/누적)"""
+
+    def __init__(self):
+        self.frames = 0    # 수신한 웹소켓 메시지 수
+        self.messages = 0  # 중계한 메시지 수 (배치 메시지는 안에 든 메시지 수)
+        self.bytes = 0
+        self.total_frames = 0
+        self.total_messages = 0
+        self.total_bytes = 0
+        self.started = time.monotonic()
+
+    def add(self, nbytes, messages=1):
+        self.frames += 1
+        self.messages += messages
+        self.bytes += nbytes
+
+    def take(self):
+        """구간 값 (frames, messages, bytes, 경과 초) 를 반환하고 초기화"""
+        now = time.monotonic()
+        frames, messages, nbytes, elapsed = self.frames, self.messages, self.bytes, now - self.started
+        self.total_frames += frames
+        self.total_messages += messages
+        self.total_bytes += nbytes
+        self.frames = 0
+        self.messages = 0
+        self.bytes = 0
+        self.started = now
+        return frames, messages, nbytes, elapsed
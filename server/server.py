@@ -3,99 +3,530 @@ import os
 import asyncio
 import websockets
 import json
+import logging
+import multiprocessing
+import signal
+import socket
+import struct
+import time
+from collections import defaultdict
 from pathlib import Path
 from aiohttp import web, WSMsgType
 from aiohttp.web_ws import WebSocketResponse
-from aiohttp.web_fileresponse import FileResponse
 from dotenv import load_dotenv
+from analysis import MetricTracker
+from bus import BusClient, BusHub, BUS_BINARY, BUS_STATS, BUS_TEXT
+from client_queue import ClientQueue
+from history import HistoryStore
+import latency
+from relay_log import setup_logging, RateLimitedLog, RelayStats
+from static_assets import CachedBody, StaticAssets, IMMUTABLE_CACHE, REVALIDATE_CACHE
 
 load_dotenv()
 
 HOST = os.getenv('HOST', '0.0.0.0')
 WEB_PORT = int(os.getenv('WEB_PORT', 8000))
 WEBSOCKET_PORT = int(os.getenv('WEBSOCKET_PORT', 8000))
+RELAY_MODE = os.getenv('RELAY_MODE', 'inspect')  # inspect | passthrough (토픽/상태 해석, 보관, 통계 없이 받은 그대로 모든 대시보드에 중계)
+SERVER_METRICS = os.getenv('SERVER_METRICS', '1') == '1' and RELAY_MODE != 'passthrough'  # 서버에서 엔트로피/카이제곱 계산
+MOVING_AVERAGE_WEIGHT = float(os.getenv('MOVING_AVERAGE_WEIGHT', 0.3))
+METRIC_WINDOW_BYTES = int(os.getenv('METRIC_WINDOW_BYTES', 4096))  # 슬라이딩 윈도우 통계 바이트 수
+CLIENT_QUEUE_SIZE = int(os.getenv('CLIENT_QUEUE_SIZE', 256))  # 클라이언트별 최대 대기 패킷 수 (drop-oldest)
+DASHBOARD_METRIC_POINTS = int(os.getenv('DASHBOARD_METRIC_POINTS', 10000))  # 대시보드 차트 시리즈별 보관 점 수
+DASHBOARD_LOG_LINES = int(os.getenv('DASHBOARD_LOG_LINES', 5000))  # 대시보드 로그 창별 보관 라인 수
+KEEP_LATEST_TOPICS = set(os.getenv('KEEP_LATEST_TOPICS', 'state,metrics').split(','))  # 최신 값만 유지할 토픽
+HISTORY_PACKETS = int(os.getenv('HISTORY_PACKETS', 32))  # 토픽별 보관 패킷 수 (접속 시 스냅샷)
+HISTORY_METRICS = int(os.getenv('HISTORY_METRICS', 1000))  # 방향/패킷 종류별 보관 통계 수
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_INTERVAL = float(os.getenv('LOG_INTERVAL', 10))  # 중계 요약 로그 주기 (초)
+LATENCY_METRICS = os.getenv('LATENCY_METRICS', '1') == '1'  # 구간별 지연 시간 집계 (/metrics, 대시보드 보고)
+LATENCY_WINDOW = float(os.getenv('LATENCY_WINDOW', 60))  # 지연 시간 히스토그램 교체 주기 (초)
+WORKERS = int(os.getenv('WORKERS', 1))  # 워커 프로세스 수 (> 1 이면 SO_REUSEPORT 로 WEB_PORT 를 나누고 버스로 producer 메시지 공유)
+BUS_PATH = os.getenv('BUS_PATH', '') or f"/tmp/dsm-viz-{WEB_PORT}.sock"  # 워커 버스 Unix 소켓 경로
+BUS_STATS_INTERVAL = 1.0  # 워커가 /stats 용 클라이언트 상태를 버스로 보내는 주기 (초)
+INGEST_TARGETS = os.getenv('INGEST_TARGETS', '')  # 서버가 직접 연결할 DSM 모니터 대상 "host:port,..." (ingest.py, 비어 있으면 client.py 사용)
+
+logger = setup_logging(LOG_LEVEL)
+
+# 바이너리 패킷 메시지 헤더 (client.py WIRE_HEADER_STRUCT 와 같은 형식)
+WIRE_KIND_PACKET = 0x01
+WIRE_HEADER_STRUCT = struct.Struct('>BBBBBBId')
+WIRE_SOURCES = ["unknown", "fcc", "gcs", "dsm"]
+WIRE_PACKET_TYPES = ["unknown", "plaintext", "ciphertext", "state"]
+
+# 배치 메시지 (client.py MessageBatcher 와 같은 형식)
+# - text: '\n' 으로 연결한 JSON 메시지들, binary: [kind=0x02, reserved, count(2)] + [length(4)] [패킷 메시지] ...
+# 토픽별로 나누어 같은 형식의 배치로 중계하므로 대시보드도 배치 메시지를 받는다.
+WIRE_KIND_BATCH = 0x02
+WIRE_BATCH_HEADER_STRUCT = struct.Struct('>BBH')
+WIRE_BATCH_LENGTH_STRUCT = struct.Struct('>I')
 
 # 연결된 WebSocket 클라이언트들 저장
 websocket_clients = set()
 
+# 클라이언트별 송신 큐 (ws -> ClientQueue)
+client_queues = {}
+
+# 패킷을 보내는 클라이언트 (client.py, replay.py): 접속 후 {"type": "producer"} 를 보내 알림, 중계 대상에서 제외
+producer_clients = set()
+
+# 토픽별 구독 클라이언트 (fcc.ciphertext, gcs.mavlink, state, metrics, status, ..., "*" = 전체)
+topic_subscribers = defaultdict(set)
+client_topics = {}
+
+# 클라이언트별 보관 패킷을 보낸 토픽 (첫 구독 요청 전에는 없음: 대시보드인지 producer 인지 모름)
+history_topics = {}
+
+# 방향/패킷 종류별 통계 이동 평균 상태
+metric_tracker = MetricTracker(MOVING_AVERAGE_WEIGHT, METRIC_WINDOW_BYTES)
+
+# 늦게 접속한 대시보드에 보낼 최근 패킷/통계/상태
+history = HistoryStore(HISTORY_PACKETS, HISTORY_METRICS)
+
+# 중계 통계와 메시지 단위 로그 (DEBUG, 초당 최대 5개)
+relay_stats = RelayStats()
+received_log = RateLimitedLog(logger, limit=5, interval=1.0)
+# 대시보드가 보낸 잘못된/알 수 없는 제어 메시지 로그 (WARNING, 초당 최대 5개)
+control_log = RateLimitedLog(logger, limit=5, interval=1.0)
+# producer 가 보낸 잘못된 메시지 로그 (WARNING, 초당 최대 5개): 버리고 연결은 유지
+producer_log = RateLimitedLog(logger, limit=5, interval=1.0)
+
+# 정적 파일 (메모리 캐시, ETag, 압축본)
+static_assets = StaticAssets(Path(__file__).parent / 'static')
+
+# 구간별 지연 시간 (client -> relay -> browser -> render)
+latency_stats = latency.LatencyStats(LATENCY_WINDOW) if LATENCY_METRICS else None
+
+# 워커 모드 (WORKERS > 1): 워커 번호, hub 연결, 다른 워커의 클라이언트 상태 (worker -> (수신 시각, clients))
+worker_id = None
+bus = None
+peer_stats = {}
+
+# client.py 는 JSON 메시지의 첫 키로 토픽을 넣어 보낸다: {"topic": "fcc.plaintext", ...}
+TOPIC_PREFIX = '{"topic": "'
+# timestamp 는 마지막 키로 넣는다: {..., "timestamp": 1723700000.123456} (지연 시간 집계에서 끝부분만 읽음)
+TIMESTAMP_KEY = '"timestamp": '
+
+def wire_name(names, code):
+    """바이너리 헤더의 source/packet_type 코드 -> 이름 (모르는 코드는 "unknown", 대시보드 decodeBinaryPacket 과 같음)"""
+    return names[code] if code < len(names) else "unknown"
+
+def binary_record_valid(record):
+    """바이너리 패킷 메시지인지 (헤더 길이와 kind) 확인"""
+    return len(record) >= WIRE_HEADER_STRUCT.size and record[0] == WIRE_KIND_PACKET
+
+def packet_bytes(data):
+    """JSON/바이너리 패킷 메시지에서 (link, source, packet_type, 패킷 바이트) 추출"""
+    if isinstance(data, dict):
+        return (data.get("link", 0), data.get("source"), data.get("packet_type"),
+                bytes.fromhex(''.join(data["data"])))
+    kind, cmd, seq, source, packet_type, link, length, timestamp = WIRE_HEADER_STRUCT.unpack_from(data)
+    if kind != WIRE_KIND_PACKET:
+        return 0, None, None, b''
+    payload = memoryview(data)[WIRE_HEADER_STRUCT.size:WIRE_HEADER_STRUCT.size + length]
+    return link, wire_name(WIRE_SOURCES, source), wire_name(WIRE_PACKET_TYPES, packet_type), payload
+
+def text_topic(text):
+    """JSON 텍스트 앞부분에서 토픽 추출 (json.loads 없이), 없으면 None"""
+    if text.startswith(TOPIC_PREFIX):
+        end = text.find('"', len(TOPIC_PREFIX))
+        if end > 0:
+            return text[len(TOPIC_PREFIX):end]
+    return None
+
+def text_message(line):
+    """JSON 메시지(줄) 디코딩, JSON 객체가 아니면 로그만 남기고 None"""
+    try:
+        data = json.loads(line)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        producer_log.log(logging.WARNING, "invalid text message dropped: len=%d", len(line))
+        return None
+    return data
+
+def message_topic(data):
+    """JSON(dict)/바이너리 메시지의 토픽"""
+    if not isinstance(data, dict):
+        return f"{wire_name(WIRE_SOURCES, data[3])}.{wire_name(WIRE_PACKET_TYPES, data[4])}"
+    if data.get("type") != "packet":
+        return data.get("type", "unknown")
+    return f"{data.get('source')}.{data.get('packet_type')}"
+
+def observe_client_latency(received, timestamp):
+    """client.py 수신 시각(epoch 초) -> 서버 수신까지 (프레임의 첫 메시지 기준, 배치 대기 포함)"""
+    if isinstance(timestamp, (int, float)) and not isinstance(timestamp, bool) and timestamp > 0:
+        latency_stats.observe("client", (received - timestamp) * 1000)
+
+def text_timestamp(line):
+    """JSON 메시지 끝의 timestamp (json.loads 없이), 없거나 숫자가 아니면 None"""
+    start = line.rfind(TIMESTAMP_KEY)
+    if start < 0 or not line.endswith('}'):
+        return None
+    try:
+        return float(line[start + len(TIMESTAMP_KEY):-1])
+    except ValueError:
+        return None
+
+def binary_batch_records(data):
+    """바이너리 배치 메시지 -> 패킷 메시지(bytes) 목록, 잘린 레코드는 버림"""
+    if len(data) < WIRE_BATCH_HEADER_STRUCT.size:
+        return []
+    _, _, count = WIRE_BATCH_HEADER_STRUCT.unpack_from(data)
+    records = []
+    pos = WIRE_BATCH_HEADER_STRUCT.size
+    for _ in range(count):
+        if pos + WIRE_BATCH_LENGTH_STRUCT.size > len(data):
+            break
+        (length,) = WIRE_BATCH_LENGTH_STRUCT.unpack_from(data, pos)
+        pos += WIRE_BATCH_LENGTH_STRUCT.size
+        if length < WIRE_HEADER_STRUCT.size or pos + length > len(data):
+            break
+        records.append(data[pos:pos + length])
+        pos += length
+    return records
+
+def encode_binary_batch(records):
+    """패킷 메시지 목록 -> 바이너리 배치 메시지"""
+    parts = [WIRE_BATCH_HEADER_STRUCT.pack(WIRE_KIND_BATCH, 0, len(records))]
+    for record in records:
+        parts.append(WIRE_BATCH_LENGTH_STRUCT.pack(len(record)))
+        parts.append(record)
+    return b''.join(parts)
+
+def subscribe(ws, topics):
+    """클라이언트를 토픽들에 구독"""
+    for topic in topics:
+        topic_subscribers[topic].add(ws)
+        client_topics[ws].add(topic)
+
+def unsubscribe(ws, topics):
+    """클라이언트의 토픽 구독 해제"""
+    for topic in topics:
+        topic_subscribers[topic].discard(ws)
+        client_topics[ws].discard(topic)
+
+def send_history(ws, topics):
+    """구독한 토픽 중 처음 구독한 토픽의 보관 패킷 전송
+
+    첫 구독 요청이면 server_info 와 스냅샷(통계 시계열, 최신 상태)을 먼저 보낸다.
+    읽지 않는 producer 에 쌓이지 않도록 접속 시에는 아무것도 보내지 않는다.
+    """
+    queue = client_queues[ws]
+    sent = history_topics.get(ws)
+    if sent is None:
+        sent = history_topics[ws] = set()
+        queue.put(json.dumps({"type": "server_info", "metrics": SERVER_METRICS,
+                              "log_lines": DASHBOARD_LOG_LINES,
+                              "latency": LATENCY_METRICS,
+                              "metric_points": DASHBOARD_METRIC_POINTS}))
+        queue.put(history.snapshot())
+    elif "state" in topics or "*" in topics:
+        # 구독하지 않는 동안 놓친 state 변경분 대신 link 별 전체 상태
+        for state in history.state_messages():
+            queue.put(state)
+    if "*" in sent:
+        return
+    for topic, data in history.packet_messages(set(topics) - sent):
+        if topic not in sent:
+            queue.put(data)
+    sent.update(topics)
+
+def mark_producer(ws):
+    """producer 로 알린 클라이언트를 표시하고 모든 구독 해제 (자기 메시지 에코 방지)"""
+    if ws not in producer_clients:
+        producer_clients.add(ws)
+        unsubscribe(ws, list(client_topics[ws]))
+        logger.info("producer connected: producers=%d", len(producer_clients))
+
+def remove_client(ws):
+    """연결이 끊어진 클라이언트를 모든 목록과 구독에서 제거"""
+    websocket_clients.discard(ws)
+    producer_clients.discard(ws)
+    history_topics.pop(ws, None)
+    queue = client_queues.pop(ws, None)
+    if queue:
+        queue.close()
+    for topic in client_topics.pop(ws, ()):
+        topic_subscribers[topic].discard(ws)
+
+def publish_metrics(data):
+    """평문/암호문 패킷의 통계를 계산하여 metrics 메시지로 브로드캐스트"""
+    if isinstance(data, dict) and (data.get("type") != "packet"
+                                   or data.get("packet_type") not in ("plaintext", "ciphertext")):
+        return
+    link, source, packet_type, payload = packet_bytes(data)
+    if packet_type not in ("plaintext", "ciphertext") or source not in ("fcc", "gcs") or not payload:
+        return
+    metric = metric_tracker.update(source, packet_type, payload, link)
+    history.add_metric(metric)
+    broadcast(json.dumps(metric), "metrics", f"metrics.{link}.{source}.{packet_type}")
+
+def broadcast(data, topic, latest_key=None, latest_data=None):
+    """토픽 구독 클라이언트의 송신 큐에 text(str)/binary(bytes) 메시지 추가
+
+    전송은 클라이언트별 writer task 가 하므로 느린 클라이언트가 있어도 블로킹되지 않는다.
+    KEEP_LATEST_TOPICS 토픽은 송신 큐가 밀린 클라이언트에서만 latest_key(기본: 토픽) 별 최신 메시지만 유지한다.
+    latest_data 를 주면 교체할 때 data 대신 남긴다 (state 변경분 대신 합친 전체 상태 dict, 교체할 때만 직렬화).
+    """
+    if topic in KEEP_LATEST_TOPICS and latest_key is None:
+        latest_key = topic
+    elif topic not in KEEP_LATEST_TOPICS:
+        latest_key = None
+    for client in topic_subscribers[topic] | topic_subscribers["*"]:
+        client_queues[client].put(data, latest_key, latest_data)
+
+def relay_text(lines):
+    """JSON 메시지(줄) 목록을 토픽별로 묶어 중계
+
+    같은 토픽 메시지는 줄바꿈으로 연결한 배치 1개로 보낸다 (KEEP_LATEST_TOPICS 토픽도 배치 전체, 교체는 송신 큐가 결정).
+    state 메시지(바뀐 필드)는 받은 그대로 link 별 배치로 보내고, link 별 전체 상태는 스냅샷과
+    밀린 클라이언트의 교체용으로만 합쳐 둔다.
+    """
+    groups = defaultdict(list)
+    states = {}  # link -> (변경분 메시지 목록, 합친 전체 상태)
+    for line in lines:
+        if not line:
+            continue
+        # 토픽이 앞에 붙은 메시지는 디코딩하지 않음
+        topic = text_topic(line)
+        data = None
+        if topic is None:
+            # 잘못된 줄은 버리고 배치의 나머지는 계속 중계 (예외로 producer 연결을 끊지 않음)
+            data = text_message(line)
+            if data is None:
+                continue
+            topic = message_topic(data)
+        groups[topic].append(line)
+        if topic == "state":
+            state = history.add_state(line)
+            if state is not None:
+                states.setdefault(state["link"], ([], state))[0].append(line)
+            continue
+        history.add_packet(topic, line)
+        if SERVER_METRICS and topic.endswith(("plaintext", "ciphertext")):
+            if data is None:
+                data = text_message(line)
+            if data is not None:
+                publish_metrics(data)
+    for topic, messages in groups.items():
+        if topic != "state":
+            broadcast(messages[0] if len(messages) == 1 else '\n'.join(messages), topic)
+    for link, (changes, state) in states.items():
+        broadcast('\n'.join(changes), "state", f"state.{link}", state)
+    return groups
+
+def relay_binary(records):
+    """바이너리 패킷 메시지 목록을 토픽별 배치로 묶어 디코딩 없이 중계"""
+    groups = defaultdict(list)
+    for record in records:
+        topic = message_topic(record)
+        groups[topic].append(record)
+        history.add_packet(topic, record)
+        if SERVER_METRICS:
+            publish_metrics(record)
+    for topic, messages in groups.items():
+        broadcast(messages[0] if len(messages) == 1 else encode_binary_batch(messages), topic)
+    return groups
+
+def relay_passthrough(data):
+    """RELAY_MODE=passthrough: 받은 메시지를 그대로 구독 중인 모든 클라이언트에 전달 -> (메시지 수, 첫 메시지)
+
+    토픽 해석, state 합치기, 보관(스냅샷)을 하지 않으므로 대시보드는 구독 토픽과 관계없이 모든 메시지를 받는다.
+    첫 메시지는 client 구간 지연 시간용 (binary 는 패킷 헤더만, 잘렸거나 패킷 메시지가 아니면 None).
+    """
+    for ws, topics in client_topics.items():
+        if topics:
+            client_queues[ws].put(data)
+    if isinstance(data, str):
+        end = data.find('\n')
+        return data.count('\n') + 1, data if end < 0 else data[:end]
+    if len(data) < WIRE_BATCH_HEADER_STRUCT.size or data[0] != WIRE_KIND_BATCH:
+        return 1, data if binary_record_valid(data) else None
+    _, _, count = WIRE_BATCH_HEADER_STRUCT.unpack_from(data)
+    offset = WIRE_BATCH_HEADER_STRUCT.size + WIRE_BATCH_LENGTH_STRUCT.size
+    first = data[offset:offset + WIRE_HEADER_STRUCT.size]
+    return count, first if count and binary_record_valid(first) else None
+
+def relay_message(data):
+    """producer 웹소켓 메시지 1개 (text/binary, 배치 포함) 중계 -> (토픽 목록, 메시지 수, 첫 메시지 또는 None)"""
+    if RELAY_MODE == 'passthrough':
+        topics = ["*"]
+        count, first = relay_passthrough(data)
+    elif isinstance(data, str):
+        messages = data.split('\n')
+        topics = relay_text(messages)
+        count, first = len(messages), messages[0]
+    else:
+        records = binary_batch_records(data) if data and data[0] == WIRE_KIND_BATCH else [data]
+        messages = [record for record in records if binary_record_valid(record)]
+        if len(messages) < len(records):
+            # 헤더보다 짧거나 패킷 메시지가 아닌 레코드는 버림 (예외로 producer 연결을 끊지 않음)
+            producer_log.log(logging.WARNING, "invalid binary record dropped: len=%d records=%d dropped=%d",
+                             len(data), len(records), len(records) - len(messages))
+        topics = relay_binary(messages)
+        count, first = len(messages), messages[0] if messages else None
+    relay_stats.add(len(data), count)
+    return topics, count, first
+
+def relay_producer(data, received):
+    """producer 메시지 (client.py 웹소켓 또는 in-process ingest) 중계
+
+    워커 모드이면 다른 워커에 hub 를 거쳐 전달하고, 첫 메시지의 timestamp 로 client 구간 지연 시간을 기록한다.
+    """
+    if bus:
+        # 다른 워커의 대시보드에는 hub 를 거쳐 전달
+        if isinstance(data, str):
+            bus.publish(BUS_TEXT, data.encode('utf-8'))
+        else:
+            bus.publish(BUS_BINARY, data)
+    topics, count, first = relay_message(data)
+    if latency_stats and first is not None:
+        if isinstance(data, str):
+            observe_client_latency(received, text_timestamp(first))
+        else:
+            observe_client_latency(received, WIRE_HEADER_STRUCT.unpack_from(first)[7])
+    received_log.log(logging.DEBUG, "received: topics=%s messages=%d len=%d",
+                     ",".join(topics), count, len(data))
+
+def relay_ingest(message):
+    """in-process ingest (ingest.LocalSink) 메시지 중계"""
+    relay_producer(message, latency.now())
+
+def handle_control(ws, text, remote):
+    """producer 가 아닌 클라이언트의 제어 메시지 (producer 알림, 구독 변경, 대시보드 지연 시간 보고)
+
+    잘못된 메시지나 알 수 없는 메시지는 로그만 남기고 무시한다 (연결을 끊거나 producer 로 바꾸지 않음).
+    """
+    try:
+        data = json.loads(text)
+    except ValueError:
+        control_log.log(logging.WARNING, "invalid control message ignored: remote=%s len=%d", remote, len(text))
+        return
+    kind = data.get("type") if isinstance(data, dict) else None
+    if kind == "producer":
+        mark_producer(ws)
+    elif kind in ("subscribe", "unsubscribe"):
+        topics = data.get("topics")
+        if not isinstance(topics, list) or not all(isinstance(topic, str) for topic in topics):
+            control_log.log(logging.WARNING, "invalid %s topics ignored: remote=%s", kind, remote)
+        elif kind == "subscribe":
+            subscribe(ws, topics)
+            send_history(ws, topics)
+        else:
+            unsubscribe(ws, topics)
+    elif kind == "latency":
+        # 대시보드의 수신/렌더링 지연 시간 보고
+        if latency_stats:
+            latency_stats.add_report(data.get("stages"))
+    else:
+        control_log.log(logging.WARNING, "unknown control message ignored: remote=%s type=%r", remote, kind)
+
+def handle_bus_record(kind, body):
+    """다른 워커가 받은 producer 메시지를 이 워커의 대시보드에 중계, 다른 워커의 클라이언트 상태 저장"""
+    if kind == BUS_TEXT:
+        relay_message(body.decode('utf-8'))
+    elif kind == BUS_BINARY:
+        relay_message(body)
+    elif kind == BUS_STATS:
+        stats = json.loads(body)
+        peer_stats[stats["worker"]] = (time.monotonic(), stats["clients"])
+
 async def websocket_handler(request):
     global websocket_clients
     """WebSocket 핸들러"""
     ws = WebSocketResponse()
     await ws.prepare(request)
 
+    # 구독 요청 전에는 아무것도 보내지 않음 (대시보드는 접속하면 탭 토픽을 구독한다)
     websocket_clients.add(ws)
-    print(f"Client connected. Total clients: {len(websocket_clients)}")
+    client_queues[ws] = ClientQueue(ws, CLIENT_QUEUE_SIZE, request.remote or "", latency_stats)
+    client_topics[ws] = set()
+    logger.info("client connected: remote=%s clients=%d", request.remote, len(websocket_clients))
 
     try:
         async for msg in ws:
+            # 서버 수신 시각 (client 구간의 끝, relay 구간은 ClientQueue.put() 부터)
+            received = latency.now()
             if msg.type == WSMsgType.TEXT:
-                data = json.loads(msg.data)
-                print(f"Received: {data}")
-
-                # 모든 연결된 클라이언트에게 브로드캐스트
-                disconnected_clients = set()
-                for client in websocket_clients:
-                    try:
-                        await client.send_str(msg.data)
-                    except Exception:
-                        disconnected_clients.add(client)
-
-                # 끊어진 클라이언트 제거
-                websocket_clients -= disconnected_clients
+                # producer 의 text 메시지는 모두 데이터 (배치 포함), 다른 클라이언트는 제어 메시지만 보냄
+                if ws in producer_clients:
+                    relay_producer(msg.data, received)
+                else:
+                    handle_control(ws, msg.data, request.remote)
+
+            elif msg.type == WSMsgType.BINARY:
+                # 바이너리 패킷/배치 메시지는 디코딩 없이 토픽별로 중계
+                if ws in producer_clients:
+                    relay_producer(msg.data, received)
+                else:
+                    control_log.log(logging.WARNING, "binary message from non-producer ignored: remote=%s",
+                                    request.remote)
 
             elif msg.type == WSMsgType.ERROR:
-                print(f'WebSocket error: {ws.exception()}')
+                logger.warning("websocket error: remote=%s error=%s", request.remote, ws.exception())
                 break
     except Exception as e:
-        print(f"WebSocket handler error: {e}")
+        logger.warning("websocket handler error: remote=%s error=%s", request.remote, e)
     finally:
-        websocket_clients.discard(ws)
-        print(f"Client disconnected. Total clients: {len(websocket_clients)}")
+        remove_client(ws)
+        logger.info("client disconnected: remote=%s clients=%d", request.remote, len(websocket_clients))
 
     return ws
 
+def local_client_stats():
+    """이 프로세스의 클라이언트별 송신 큐 상태"""
+    clients = []
+    for ws, queue in client_queues.items():
+        stats = queue.stats()
+        stats["producer"] = ws in producer_clients
+        stats["topics"] = sorted(client_topics.get(ws, ()))
+        if worker_id is not None:
+            stats["worker"] = worker_id
+        clients.append(stats)
+    return clients
+
+async def stats_handler(request):
+    """클라이언트별 송신 큐 상태 (대기 수, 지연, 전송/버림 수)
+
+    워커 모드에서는 다른 워커의 클라이언트도 포함한다 (버스로 BUS_STATS_INTERVAL 초마다 받은 값).
+    """
+    clients = local_client_stats()
+    now = time.monotonic()
+    for worker in sorted(peer_stats):
+        updated, peer_clients = peer_stats[worker]
+        if now - updated < 5 * BUS_STATS_INTERVAL:
+            clients += peer_clients
+    return web.json_response({"clients": clients})
+
+async def metrics_handler(request):
+    """구간별 지연 시간 p50/p95/p99 (ms, 최근 LATENCY_WINDOW-2*LATENCY_WINDOW 초)"""
+    if latency_stats is None:
+        return web.json_response({"error": "LATENCY_METRICS=0"}, status=404)
+    return web.json_response(latency_stats.summary())
+
 async def static_handler(request):
-    """정적 파일 핸들러"""
-    filename = request.match_info['filename']
-    file_path = Path(__file__).parent / 'static' / filename
+    """정적 파일 핸들러 (ETag, 압축본 선택, ?v=<버전> 주소는 immutable 캐시)
 
-    if not file_path.exists():
+    파일이 바뀌었으면 get() 이 다시 읽고 압축하므로 이벤트 루프 밖(기본 executor)에서 호출한다.
+    """
+    asset = await asyncio.get_running_loop().run_in_executor(None, static_assets.get, request.match_info['filename'])
+    if asset is None:
         return web.Response(status=404, text="File not found")
+    immutable = request.query.get('v') == asset.version
+    return asset.response(request, IMMUTABLE_CACHE if immutable else REVALIDATE_CACHE)
 
-    return FileResponse(file_path)
-
-async def index_handler(request):
-    html_content = """
+# 대시보드 페이지: /static/... 주소는 create_app() 에서 ?v=<내용 해시> 를 붙여 미리 압축해 둔다
+# class 를 추가/변경하면 build_static.py 를 다시 실행하여 static/tailwind.min.css 를 만든다
+INDEX_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
     <title>패킷 모니터링 시각화</title>
     <meta charset="utf-8">
     <meta name="viewport" content="width=device-width, initial-scale=1">
-    <script src="/static/tailwind.min.js"></script>
+    <link rel="stylesheet" href="/static/tailwind.min.css">
     <script src="/static/d3.v7.min.js"></script>
-    <script>
-        tailwind.config = {
-            theme: {
-                extend: {
-                    colors: {
-                        'light-bg': '#f8fafc',
-                        'light-text': '#1e293b',
-                        'light-card': '#ffffff',
-                        'light-border': '#e2e8f0',
-                        'light-accent': '#3b82f6',
-                        'light-success': '#059669',
-                        'light-warning': '#d97706',
-                        'light-error': '#dc2626'
-                    },
-                    fontFamily: {
-                        'mono': ['Courier New', 'monospace']
-                    }
-                }
-            }
-        }
-    </script>
 </head>
 <body class="font-mono bg-light-bg text-light-text p-5">
 <!-- logo -->
@@ -123,6 +554,10 @@ async def index_handler(request):
              <button id="gcs-graph-tab" class="flex-1 py-2 px-4 text-sm font-medium text-center rounded-md transition-colors duration-200 text-gray-600 hover:text-light-accent hover:bg-gray-50" onclick="switchTab('gcs-graph')">
                 Visualization: GCS -> FCC 
             </button>
+            <!-- 여러 DSM 대상(client.py TARGETS)을 모니터링할 때 표시할 link, 두 번째 link 가 보이면 나타남 -->
+            <select id="link-select" class="hidden py-2 px-2 text-sm border border-light-border rounded-md bg-white" onchange="switchLink(Number(this.value))">
+                <option value="0">Link 0</option>
+            </select>
         </nav>
     </div>
 
@@ -162,19 +597,19 @@ async def index_handler(request):
                 <div class="space-y-2">
                     <div class="flex justify-between">
                         <span class="text-gray-600">TX Packets:</span>
-                        <span id="tx-packets" class="text-light-accent">0</span>
+                        <span><span id="tx-packets" class="text-light-accent">0</span> <span id="tx-packets-rate" class="text-gray-600"></span></span>
                     </div>
                     <div class="flex justify-between">
                         <span class="text-gray-600">RX Packets:</span>
-                        <span id="rx-packets" class="text-light-accent">0</span>
+                        <span><span id="rx-packets" class="text-light-accent">0</span> <span id="rx-packets-rate" class="text-gray-600"></span></span>
                     </div>
                     <div class="flex justify-between">
                         <span class="text-gray-600">TX Bytes:</span>
-                        <span id="tx-bytes" class="text-light-accent">0</span>
+                        <span><span id="tx-bytes" class="text-light-accent">0</span> <span id="tx-bytes-rate" class="text-gray-600"></span></span>
                     </div>
                     <div class="flex justify-between">
                         <span class="text-gray-600">RX Bytes:</span>
-                        <span id="rx-bytes" class="text-light-accent">0</span>
+                        <span><span id="rx-bytes" class="text-light-accent">0</span> <span id="rx-bytes-rate" class="text-gray-600"></span></span>
                     </div>
                 </div>
             </div>
@@ -182,7 +617,7 @@ async def index_handler(request):
             <!-- Recent Activity Log -->
             <div class="col-span-2 bg-light-card border border-light-border p-4 rounded-lg shadow-sm">
                 <h3 class="text-light-text font-bold mb-3 text-center">Recent Activity</h3>
-                <textarea id="active-log" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border p-2 overflow-y-auto whitespace-pre-wrap resize-none focus:outline-none focus:border-light-accent" readonly></textarea>
+                <div id="active-log" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border p-2 overflow-auto relative"></div>
             </div>
         </div>
     </div>
@@ -190,20 +625,21 @@ async def index_handler(request):
     <div id="fcc-content" class="tab-content hidden flex gap-5 h-[80vh]">
         <div class="flex-1 flex flex-col">
             <div class="text-light-text font-bold mb-1 text-center bg-light-card border border-light-border p-2 rounded-t-lg">Ciphertext</div>
-            <textarea id="fcc-ciphertext" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-y-auto whitespace-pre-wrap resize-none focus:outline-none focus:border-light-accent rounded-b-lg" readonly></textarea>
+            <div id="fcc-ciphertext" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-auto relative rounded-b-lg"></div>
         </div>
         <div class="flex-1 flex flex-col">
             <div class="text-light-text font-bold mb-1 text-center bg-light-card border border-light-border p-2 rounded-t-lg">Plaintext</div>
-            <textarea id="fcc-plaintext" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-y-auto whitespace-pre-wrap resize-none focus:outline-none focus:border-light-accent rounded-b-lg" readonly></textarea>
+            <div id="fcc-plaintext" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-auto relative rounded-b-lg"></div>
         </div>
         <div class="flex-1 flex flex-col">
             <div class="text-light-text font-bold mb-1 text-center bg-light-card border border-light-border
             p-2 rounded-t-lg">MAVLink</div>
-            <textarea id="fcc-mavlink" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-y-auto whitespace-pre-wrap resize-none focus:outline-none focus:border-light-accent rounded-b-lg" readonly></textarea>
+            <div id="fcc-mavlink" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-auto relative rounded-b-lg"></div>
         </div>
     </div>
 
     <div id="fcc-graph-content" class="tab-content hidden flex flex-col gap-5 h-[80vh] overflow-y-auto">
+        <div id="fcc-window-stats" class="bg-light-card border border-light-border p-4 rounded-lg shadow-sm text-sm hidden"></div>
         <div class="bg-light-card border border-light-border p-4 rounded-lg shadow-sm">
             <h3 class="text-light-text font-bold mb-3 text-center">Packet Entropy Analysis - FCC → GCS</h3>
             <div id="fcc-entropy-chart" class="w-full h-48"></div>
@@ -215,6 +651,7 @@ async def index_handler(request):
     </div>
 
     <div id="gcs-graph-content" class="tab-content hidden flex flex-col gap-5 h-[80vh] overflow-y-auto">
+        <div id="gcs-window-stats" class="bg-light-card border border-light-border p-4 rounded-lg shadow-sm text-sm hidden"></div>
         <div class="bg-light-card border border-light-border p-4 rounded-lg shadow-sm">
             <h3 class="text-light-text font-bold mb-3 text-center">Packet Entropy Analysis - GCS → FCC</h3>
             <div id="gcs-entropy-chart" class="w-full h-48"></div>
@@ -229,18 +666,22 @@ async def index_handler(request):
     <div id="gcs-content" class="tab-content hidden flex gap-5 h-[80vh]">
         <div class="flex-1 flex flex-col">
             <div class="text-light-text font-bold mb-1 text-center bg-light-card border border-light-border p-2 rounded-t-lg">MAVLink</div>
-            <textarea id="gcs-mavlink" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-y-auto whitespace-pre-wrap resize-none focus:outline-none focus:border-light-accent rounded-b-lg" readonly></textarea>
+            <div id="gcs-mavlink" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-auto relative rounded-b-lg"></div>
         </div>
         <div class="flex-1 flex flex-col">
             <div class="text-light-text font-bold mb-1 text-center bg-light-card border border-light-border p-2 rounded-t-lg">Plaintext</div>
-            <textarea id="gcs-plaintext" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-y-auto whitespace-pre-wrap resize-none focus:outline-none focus:border-light-accent rounded-b-lg" readonly></textarea>
+            <div id="gcs-plaintext" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-auto relative rounded-b-lg"></div>
         </div>
         <div class="flex-1 flex flex-col">
             <div class="text-light-text font-bold mb-1 text-center bg-light-card border border-light-border p-2 rounded-t-lg">Ciphertext</div>
-            <textarea id="gcs-ciphertext" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-y-auto whitespace-pre-wrap resize-none focus:outline-none focus:border-light-accent rounded-b-lg" readonly></textarea>
+            <div id="gcs-ciphertext" class="w-full h-full bg-white text-light-text font-mono text-xs border border-light-border border-t-0 p-2 overflow-auto relative rounded-b-lg"></div>
         </div>
     </div>
 
+    <!-- 렌더링 상태 (FPS / 대기 메시지 수) -->
+    <div id="latency-overlay" class="hidden fixed bottom-9 right-2 bg-light-card border border-light-border rounded px-2 py-1 text-xs text-gray-600 shadow-sm opacity-80 pointer-events-none font-mono whitespace-pre"></div>
+    <div id="render-overlay" class="fixed bottom-2 right-2 bg-light-card border border-light-border rounded px-2 py-1 text-xs text-gray-600 shadow-sm opacity-80 pointer-events-none"></div>
+
     <script>
         // Tab switching functionality
         function switchTab(tabName) {
@@ -265,6 +706,89 @@ async def index_handler(request):
             const selectedTab = document.getElementById(tabName + '-tab');
             selectedTab.classList.remove('text-gray-600', 'hover:text-light-accent', 'hover:bg-gray-50');
             selectedTab.classList.add('bg-light-accent', 'text-white');
+
+            // 보고 있는 탭의 스트림만 구독
+            currentTab = tabName;
+            updateSubscription();
+
+            // 숨겨져 있는 동안 쌓인 로그/차트를 다음 프레임에 반영
+            for (const view of logViews.values()) dirtyLogs.add(view);
+            scheduleRender();
+        }
+
+        // 탭별 구독 토픽
+        let currentTab = 'state';
+        let subscribedTopics = new Set();
+
+        function tabTopics(tabName) {
+            const topics = ['status'];
+            if (tabName === 'state') {
+                topics.push('state');
+            } else if (tabName === 'fcc' || tabName === 'gcs') {
+                topics.push(`${tabName}.ciphertext`, `${tabName}.plaintext`, `${tabName}.mavlink`);
+                if (tabName === 'fcc') topics.push('unknown.unknown');
+            } else if (tabName === 'fcc-graph' || tabName === 'gcs-graph') {
+                const source = tabName.split('-')[0];
+                if (serverMetrics) {
+                    topics.push('metrics');
+                } else {
+                    topics.push(`${source}.ciphertext`, `${source}.plaintext`);
+                }
+            }
+            return topics;
+        }
+
+        function updateSubscription() {
+            if (ws.readyState !== WebSocket.OPEN) return;
+            const topics = new Set(tabTopics(currentTab));
+            const removed = [...subscribedTopics].filter(t => !topics.has(t));
+            const added = [...topics].filter(t => !subscribedTopics.has(t));
+            if (removed.length > 0) {
+                ws.send(JSON.stringify({ type: 'unsubscribe', topics: removed }));
+            }
+            if (added.length > 0) {
+                ws.send(JSON.stringify({ type: 'subscribe', topics: added }));
+            }
+            subscribedTopics = topics;
+        }
+
+        // 화면에 표시할 link (client.py TARGETS 순서의 번호), 다른 link 의 패킷/통계/상태는 표시하지 않음
+        let activeLink = 0;
+        const knownLinks = new Set([0]);
+        const linkSelect = document.getElementById('link-select');
+
+        // 메시지의 link 를 선택 목록에 추가하고 표시할 link 인지 반환
+        function acceptLink(data) {
+            const link = data.link || 0;
+            if (!knownLinks.has(link)) {
+                knownLinks.add(link);
+                const option = document.createElement('option');
+                option.value = String(link);
+                option.textContent = `Link ${link}`;
+                const next = [...linkSelect.options].find(o => Number(o.value) > link);
+                linkSelect.insertBefore(option, next || null);
+                linkSelect.classList.remove('hidden');
+            }
+            return link === activeLink;
+        }
+
+        function switchLink(link) {
+            activeLink = link;
+            linkSelect.value = String(link);
+            // 차트는 새 link 의 값부터 다시 그림
+            for (const metrics of metricData) {
+                metrics.plaintext.clear();
+                metrics.ciphertext.clear();
+            }
+            windowStats.fcc = {};
+            windowStats.gcs = {};
+            statsWorker.postMessage({ kind: 'reset' });
+            renderState({ ...DSM_STATE_DEFAULTS, ...dsmStates.get(link) });
+            dirtyCharts.add('fcc');
+            dirtyCharts.add('gcs');
+            for (const element of [fccCiphertext, fccPlaintext, fccMavlink, gcsCiphertext, gcsPlaintext, gcsMavlink]) {
+                addMessage(element, `Link ${link} 표시`, 'status');
+            }
         }
 
         // Initialize tab elements
@@ -275,59 +799,453 @@ async def index_handler(request):
         const gcsCiphertext = document.getElementById('gcs-ciphertext');
         const gcsPlaintext = document.getElementById('gcs-plaintext');
         const gcsMavlink = document.getElementById('gcs-mavlink');
+        const activeLog = document.getElementById('active-log');
+
+        // DSM 상태 필드 -> 표시 요소 (client/dsm_state.py STATE_FIELDS, RATE_FIELDS)
+        const DSM_TEXT_FIELDS = ['state', 'tls_ver', 'kem', 'sig', 'ciphersuite'];
+        const DSM_STATE_ELEMENTS = Object.entries({
+            state: 'dsm-status', tls_ver: 'dsm-tls-version', kem: 'dsm-kem', sig: 'dsm-sig', ciphersuite: 'dsm-ciphersuite',
+            tx_packets: 'tx-packets', rx_packets: 'rx-packets', tx_bytes: 'tx-bytes', rx_bytes: 'rx-bytes',
+            tx_packets_rate: 'tx-packets-rate', rx_packets_rate: 'rx-packets-rate',
+            tx_bytes_rate: 'tx-bytes-rate', rx_bytes_rate: 'rx-bytes-rate',
+        }).map(([field, id]) => [field, document.getElementById(id)]);
+        // 상태를 받지 못한 link 를 선택했을 때 표시할 값
+        const DSM_STATE_DEFAULTS = {
+            state: 'Disconnected', tls_ver: '', kem: '', sig: '', ciphersuite: '',
+            tx_packets: 0, rx_packets: 0, tx_bytes: 0, rx_bytes: 0,
+            tx_packets_rate: null, rx_packets_rate: null, tx_bytes_rate: null, rx_bytes_rate: null,
+        };
+        const dsmStates = new Map();  // link -> 최신 상태 필드
+        const renderedState = {};     // 필드 -> 화면에 표시 중인 텍스트
+
+        function renderState(fields) {
+            // 표시 텍스트가 바뀐 요소만 갱신
+            for (const [field, element] of DSM_STATE_ELEMENTS) {
+                if (!(field in fields)) continue;
+                const value = fields[field];
+                const text = !field.endsWith('_rate') ? String(value) : value === null ? '' : `(${value}/s)`;
+                if (renderedState[field] === text) continue;
+                renderedState[field] = text;
+                element.textContent = text;
+                if (field === 'state') {
+                    element.classList.toggle('text-light-success', text === 'connected');
+                    element.classList.toggle('text-light-error', text !== 'connected');
+                }
+            }
+        }
 
         const ws = new WebSocket(`ws://${window.location.host}/ws`);
+        ws.binaryType = 'arraybuffer';
+
+        // 바이너리 패킷 메시지 (client.py WIRE_HEADER_STRUCT 와 같은 형식)
+        // [kind, cmd, seq, source, packet_type, link, length(4), timestamp(8)] + 원본 패킷
+        const WIRE_KIND_PACKET = 0x01;
+        const WIRE_HEADER_LEN = 18;
+        const WIRE_SOURCES = ['unknown', 'fcc', 'gcs', 'dsm'];
+        const WIRE_PACKET_TYPES = ['unknown', 'plaintext', 'ciphertext', 'state'];
+        // 배치 메시지 (client.py MessageBatcher): text 는 '\\n' 으로 연결한 JSON,
+        // binary 는 [kind=0x02, reserved, count(2)] + 레코드마다 [length(4)] [바이너리 패킷 메시지]
+        const WIRE_KIND_BATCH = 0x02;
+        const WIRE_BATCH_HEADER_LEN = 4;
+        const HEX_TABLE = Array.from({length: 256}, (_, i) => i.toString(16).padStart(2, '0'));
+
+        function decodeBinaryPacket(buffer) {
+            const view = new DataView(buffer);
+            if (view.byteLength < WIRE_HEADER_LEN || view.getUint8(0) !== WIRE_KIND_PACKET) {
+                return null;
+            }
+            const length = view.getUint32(6);
+            // 잘렸거나 길이가 잘못된 레코드는 버림 (RangeError 로 같은 프레임의 다른 메시지까지 잃지 않도록)
+            if (WIRE_HEADER_LEN + length > view.byteLength) {
+                return null;
+            }
+            return {
+                type: 'packet',
+                cmd: view.getUint8(1),
+                seq: view.getUint8(2),
+                source: WIRE_SOURCES[view.getUint8(3)] || 'unknown',
+                packet_type: WIRE_PACKET_TYPES[view.getUint8(4)] || 'unknown',
+                link: view.getUint8(5),
+                length: length,
+                timestamp: view.getFloat64(10),
+                bytes: new Uint8Array(buffer, WIRE_HEADER_LEN, length)
+            };
+        }
+
+        // 바이너리 배치 메시지 -> 레코드별 ArrayBuffer (worker 로 transfer 할 수 있도록 복사)
+        function decodeBinaryBatch(buffer) {
+            const view = new DataView(buffer);
+            if (view.byteLength < WIRE_BATCH_HEADER_LEN) return [];
+            const count = view.getUint16(2);
+            const records = [];
+            let pos = WIRE_BATCH_HEADER_LEN;
+            for (let i = 0; i < count && pos + 4 <= buffer.byteLength; i++) {
+                const length = view.getUint32(pos);
+                pos += 4;
+                if (pos + length > buffer.byteLength) break;
+                records.push(buffer.slice(pos, pos + length));
+                pos += length;
+            }
+            return records;
+        }
+
+        // 웹소켓 메시지 1개 -> 메시지 객체 목록 (배치 메시지는 여러 개)
+        function decodeMessages(raw) {
+            if (raw instanceof ArrayBuffer) {
+                if (raw.byteLength > 0 && new Uint8Array(raw, 0, 1)[0] === WIRE_KIND_BATCH) {
+                    return decodeBinaryBatch(raw).map(decodeBinaryPacket).filter(data => data);
+                }
+                const data = decodeBinaryPacket(raw);
+                return data ? [data] : [];
+            }
+            if (raw.indexOf('\\n') < 0) return [JSON.parse(raw)];
+            return raw.split('\\n').filter(line => line).map(line => JSON.parse(line));
+        }
+
+        // 출력용 hex 텍스트 (JSON 모드의 배열 출력과 같은 형식)
+        function packetText(data) {
+            if (!data.bytes) return data.data;
+            const hex = new Array(data.bytes.length);
+            for (let i = 0; i < data.bytes.length; i++) {
+                hex[i] = HEX_TABLE[data.bytes[i]];
+            }
+            return hex.join(',');
+        }
 
         const movingAverageWeight = 0.3;
 
-        let gcsSmoothedEntropy = 0;
-        let gcsSmoothedChiSquare = 0;
+        // 서버가 metrics 메시지를 보내면 (server_info.metrics) 브라우저에서 통계를 계산하지 않음
+        let serverMetrics = false;
+
+        function isMetricSeries(source, packetType) {
+            return (source === 'fcc' || source === 'gcs') &&
+                (packetType === 'plaintext' || packetType === 'ciphertext');
+        }
+
+        // 로컬 통계(엔트로피/카이제곱, 이동 평균)와 MAVLink JSON 출력은 Web Worker 에서 처리
+        const statsWorker = new Worker('/static/stats-worker.js');
+        statsWorker.postMessage({ kind: 'config', movingAverageWeight: movingAverageWeight });
+        statsWorker.onmessage = function(event) {
+            const result = event.data;
+            if (result.kind === 'stats') {
+                addMetricPoint(result.source, result.packetType, result.entropy, result.chiSquare, result.time);
+            } else if (result.kind === 'mavlink') {
+                addMessage(result.source === 'fcc' ? fccMavlink : gcsMavlink, result.text, 'packet-data');
+            }
+        };
+
+        // 패킷 바이트를 worker 로 전달 (바이너리 메시지는 ArrayBuffer 를 transfer, JSON 메시지는 hex 배열)
+        function postPacketStats(data) {
+            const msg = { kind: 'stats', source: data.source, packetType: data.packet_type, time: Date.now() };
+            if (data.bytes) {
+                msg.buffer = data.bytes.buffer;
+                msg.offset = data.bytes.byteOffset;
+                msg.length = data.bytes.length;
+                statsWorker.postMessage(msg, [msg.buffer]);
+            } else if (data.data) {
+                msg.hex = data.data;
+                statsWorker.postMessage(msg);
+            }
+        }
+
+
+        // 로그 창별 보관 라인 수 (server_info.log_lines 로 변경)
+        let logCapacity = 5000;
+        const LOG_ROW_HEIGHT = 16;  // text-xs 한 줄 높이 (px)
+
+        // 가상화 로그 창: 고정 크기 링 버퍼에 라인을 보관하고 화면에 보이는 줄만 DOM 으로 그린다.
+        // 위로 스크롤하면 일시정지(자동 스크롤 중지)되고, 새 라인은 계속 버퍼에 쌓인다.
+        class LogView {
+            constructor(element, capacity) {
+                this.element = element;
+                this.lines = new Array(capacity);
+                this.start = 0;       // 가장 오래된 라인 위치
+                this.count = 0;
+                this.total = 0;       // 지금까지 추가된 라인 수
+                this.follow = true;   // 맨 아래를 따라감 (false = 일시정지)
+                this.shifted = 0;     // 일시정지 중 버퍼에서 밀려난 라인 수 (스크롤 위치 보정)
+                this.pausedAt = 0;
+
+                this.bar = document.createElement('div');
+                this.bar.className = 'sticky top-0 z-10 hidden bg-light-warning text-white px-2 cursor-pointer';
+                this.bar.addEventListener('click', () => this.resume());
+                this.spacer = document.createElement('div');
+                this.spacer.style.width = 'max-content';
+                this.spacer.style.minWidth = '100%';
+                this.rows = document.createElement('div');
+                this.spacer.appendChild(this.rows);
+                element.appendChild(this.bar);
+                element.appendChild(this.spacer);
+                this.rowPool = [];
+
+                // 코드로 맨 아래/보정 위치로 옮긴 경우에도 atBottom 으로 판단하므로 상태가 바뀌지 않음
+                element.addEventListener('scroll', () => {
+                    const atBottom = element.scrollTop + element.clientHeight >= element.scrollHeight - LOG_ROW_HEIGHT;
+                    if (atBottom !== this.follow) {
+                        this.follow = atBottom;
+                        this.pausedAt = this.total;
+                    }
+                    dirtyLogs.add(this);
+                    scheduleRender();
+                });
+            }
 
-        let gcsSmoothedEntropy2 = 0;
-        let gcsSmoothedChiSquare2 = 0;
+            append(line) {
+                const capacity = this.lines.length;
+                if (this.count < capacity) {
+                    this.lines[(this.start + this.count) % capacity] = line;
+                    this.count++;
+                } else {
+                    this.lines[this.start] = line;
+                    this.start = (this.start + 1) % capacity;
+                    if (!this.follow) this.shifted++;
+                }
+                this.total++;
+            }
 
-        let fccSmoothedEntropy = 0;
-        let fccSmoothedChiSquare = 0;
+            line(i) {
+                return this.lines[(this.start + i) % this.lines.length];
+            }
 
-        let fccSmoothedEntropy2 = 0;
-        let fccSmoothedChiSquare2 = 0;
+            resize(capacity) {
+                const keep = Math.min(this.count, capacity);
+                const lines = new Array(capacity);
+                for (let i = 0; i < keep; i++) {
+                    lines[i] = this.line(this.count - keep + i);
+                }
+                this.lines = lines;
+                this.start = 0;
+                this.count = keep;
+            }
 
+            resume() {
+                this.follow = true;
+                dirtyLogs.add(this);
+                scheduleRender();
+            }
 
-        // 최대 라인 수 제한 (성능 최적화)
-        const MAX_LINES = 100;
+            render() {
+                const element = this.element;
+                this.spacer.style.height = `${this.count * LOG_ROW_HEIGHT}px`;
+                if (this.follow) {
+                    this.shifted = 0;
+                    element.scrollTop = element.scrollHeight;
+                } else if (this.shifted > 0) {
+                    // 일시정지 중에는 보던 라인이 그대로 보이도록 밀려난 만큼 위로 보정
+                    element.scrollTop = Math.max(0, element.scrollTop - this.shifted * LOG_ROW_HEIGHT);
+                    this.shifted = 0;
+                }
+                this.bar.classList.toggle('hidden', this.follow);
+                if (!this.follow) {
+                    this.bar.textContent = `일시정지 - 새 라인 ${this.total - this.pausedAt}개 (클릭하면 계속)`;
+                }
 
-        function addMessage(textarea, message, className = '') {
+                // 보이는 줄만 DOM 에 배치
+                const first = Math.min(Math.floor(element.scrollTop / LOG_ROW_HEIGHT), Math.max(this.count - 1, 0));
+                const visible = Math.min(Math.ceil(element.clientHeight / LOG_ROW_HEIGHT) + 1, this.count - first);
+                while (this.rowPool.length < visible) {
+                    const row = document.createElement('div');
+                    row.className = 'whitespace-pre';
+                    row.style.height = row.style.lineHeight = `${LOG_ROW_HEIGHT}px`;
+                    this.rows.appendChild(row);
+                    this.rowPool.push(row);
+                }
+                this.rows.style.transform = `translateY(${first * LOG_ROW_HEIGHT}px)`;
+                for (let i = 0; i < this.rowPool.length; i++) {
+                    const row = this.rowPool[i];
+                    const text = i < visible ? this.line(first + i) : '';
+                    if (row.textContent !== text) row.textContent = text;
+                }
+            }
+        }
+
+        const logViews = new Map();  // element -> LogView
+        const dirtyLogs = new Set();
+
+        function logView(element) {
+            let view = logViews.get(element);
+            if (!view) {
+                view = new LogView(element, logCapacity);
+                logViews.set(element, view);
+            }
+            return view;
+        }
+
+        function addMessage(element, message, className = '') {
             const timestamp = new Date().toLocaleTimeString();
-            const line = `[${timestamp}] ${message}\\n`;
+            const prefix = className === 'status' ? '[STATUS] ' :
+                          className === 'packet-header' ? '[PACKET] ' : '';
+            const view = logView(element);
+            // 여러 줄 메시지(MAVLink JSON)는 줄마다 한 행
+            const lines = `${prefix}[${timestamp}] ${message}`.split('\\n');
+            for (const line of lines) {
+                view.append(line);
+            }
+            dirtyLogs.add(view);
+            scheduleRender();
+        }
 
-            let content = '';
-            if (className) {
-                const prefix = className === 'status' ? '[STATUS] ' :
-                              className === 'packet-header' ? '[PACKET] ' : '';
-                content = prefix + line;
-            } else {
-                content = line;
+        // 화면에 보이는 요소인지 (숨겨진 탭은 렌더링 생략)
+        function isVisible(element) {
+            return element.offsetParent !== null;
+        }
+
+        function flushLogs() {
+            for (const view of dirtyLogs) {
+                if (!isVisible(view.element)) continue;
+                view.render();
+                dirtyLogs.delete(view);
+            }
+        }
+
+        // 렌더 스케줄러: 수신 메시지를 모아 requestAnimationFrame 마다 한 번에 처리
+        const MAX_PENDING_MESSAGES = 2000;  // 탭이 백그라운드여서 rAF 가 멈춘 경우 데이터만 먼저 처리
+        let pendingMessages = [];
+        let pendingReceived = [];  // pendingMessages 별 수신 시각 (performance.now())
+        let renderScheduled = false;
+        const dirtyCharts = new Set();
+        const renderStats = { frames: 0, messages: 0, maxQueue: 0, maxFrameMs: 0, last: performance.now() };
+
+        function scheduleRender() {
+            if (!renderScheduled) {
+                renderScheduled = true;
+                requestAnimationFrame(renderFrame);
+            }
+        }
+
+        function processMessages() {
+            const messages = pendingMessages;
+            const received = pendingReceived;
+            pendingMessages = [];
+            pendingReceived = [];
+            for (let i = 0; i < messages.length; i++) {
+                const decoded = decodeMessages(messages[i]);
+                if (latencyReports) sampleLatency(decoded, received[i]);
+                for (const data of decoded) handleMessage(data);
+            }
+            renderStats.messages += messages.length;
+        }
+
+        // 구간별 지연 시간 (server latency.py): 웹소켓 메시지마다 첫 메시지의 timestamp(client.py 수신 시각) 기준
+        // 수신(ws.onmessage), 화면 갱신(renderFrame 완료) 시각을 모아 LATENCY_REPORT_MS 마다 서버에 보고
+        const LATENCY_REPORT_MS = 2000;
+        const LATENCY_MAX_SAMPLES = 1000;  // 보고 1개의 구간별 최대 값 수
+        const clockOrigin = performance.timeOrigin || (Date.now() - performance.now());  // performance.now() -> epoch ms
+        let latencyReports = false;  // server_info.latency
+        let connectedAt = Infinity;  // 웹소켓 연결 시각 (epoch ms), 이전에 수신된 메시지(접속 시 스냅샷)는 제외
+        let unrenderedSamples = [];  // [ingest, received] (epoch ms), 화면 갱신 후 latencySamples 로 옮김
+        const latencySamples = { browser_receive: [], render: [], end_to_end: [] };
+
+        function sampleLatency(decoded, received) {
+            const data = decoded.find(message => message.timestamp);
+            if (!data) return;
+            const ingest = data.timestamp * 1000;
+            if (ingest < connectedAt || latencySamples.end_to_end.length + unrenderedSamples.length >= LATENCY_MAX_SAMPLES) return;
+            unrenderedSamples.push([ingest, clockOrigin + received]);
+        }
+
+        function recordRenderLatency() {
+            const rendered = clockOrigin + performance.now();
+            const round = value => Math.round(value * 100) / 100;
+            for (const [ingest, received] of unrenderedSamples) {
+                latencySamples.browser_receive.push(round(received - ingest));
+                latencySamples.render.push(round(rendered - received));
+                latencySamples.end_to_end.push(round(rendered - ingest));
+            }
+            unrenderedSamples = [];
+        }
+
+        function reportLatency() {
+            if (!latencySamples.end_to_end.length || ws.readyState !== WebSocket.OPEN) return;
+            ws.send(JSON.stringify({ type: 'latency', stages: latencySamples }));
+            for (const values of Object.values(latencySamples)) values.length = 0;
+        }
+        setInterval(reportLatency, LATENCY_REPORT_MS);
+
+        // 지연 시간 오버레이 (?latency=1): 서버 /metrics 의 구간별 p50/p95/p99
+        const latencyOverlay = document.getElementById('latency-overlay');
+        async function updateLatencyOverlay() {
+            try {
+                const response = await fetch('/metrics');
+                const metrics = await response.json();
+                const lines = Object.entries(metrics.stages || {})
+                    .filter(([, stats]) => stats.count)
+                    .map(([stage, stats]) => `${stage.padEnd(15)} p50 ${stats.p50} p95 ${stats.p95} p99 ${stats.p99} ms`);
+                latencyOverlay.textContent = lines.length ? lines.join('\\n') : 'latency: no samples';
+            } catch (error) {
+                latencyOverlay.textContent = 'latency: ' + error;
             }
+        }
+        if (new URLSearchParams(window.location.search).get('latency') === '1') {
+            latencyOverlay.classList.remove('hidden');
+            setInterval(updateLatencyOverlay, LATENCY_REPORT_MS);
+        }
 
-            // 현재 내용에 새 라인 추가
-            textarea.value += content;
+        // 서버 슬라이딩 윈도우 통계 (metrics.window_*) [source][packet_type]
+        const windowStats = { fcc: {}, gcs: {} };
+
+        function updateWindowStats(source) {
+            const element = document.getElementById(`${source}-window-stats`);
+            const parts = [];
+            for (const packetType of ['plaintext', 'ciphertext']) {
+                const stats = windowStats[source][packetType];
+                if (!stats) continue;
+                parts.push(`${packetType}: H=${stats.window_entropy.toFixed(3)} bits/byte, ` +
+                    `χ²=${stats.window_chi_square.toFixed(1)}, p=${stats.window_p_value.toFixed(4)} ` +
+                    `(last ${stats.window_bytes} bytes)`);
+            }
+            element.classList.toggle('hidden', parts.length === 0);
+            element.textContent = 'Sliding window - ' + parts.join(' | ');
+        }
 
-            // 라인 수 체크 및 오래된 라인 제거 (성능 최적화)
-            const lines = textarea.value.split('\\n');
-            if (lines.length > MAX_LINES) {
-                const linesToRemove = lines.length - MAX_LINES;
-                textarea.value = lines.slice(linesToRemove).join('\\n');
+        function flushCharts() {
+            for (const source of dirtyCharts) {
+                if (!isVisible(document.getElementById(`${source}-entropy-chart`))) continue;
+                updateEntropyChart(source);
+                updateChiSquareChart(source);
+                updateWindowStats(source);
+                dirtyCharts.delete(source);
             }
+        }
+
+        function renderFrame(now) {
+            renderScheduled = false;
+            const started = performance.now();
+            renderStats.maxQueue = Math.max(renderStats.maxQueue, pendingMessages.length);
+            processMessages();
+            flushLogs();
+            flushCharts();
+            if (unrenderedSamples.length) recordRenderLatency();
+            renderStats.frames++;
+            renderStats.maxFrameMs = Math.max(renderStats.maxFrameMs, performance.now() - started);
+        }
 
-            // 자동 스크롤 최적화 (사용자가 스크롤을 올리지 않은 경우에만)
-            //const isAtBottom = textarea.scrollTop >= textarea.scrollHeight - textarea.clientHeight - 10;
-            //if (isAtBottom) {
-                //textarea.scrollTop = textarea.scrollHeight;
-            //}
+        // FPS / 큐 상태 오버레이 (1초마다 갱신)
+        const renderOverlay = document.getElementById('render-overlay');
+        function updateOverlay() {
+            const now = performance.now();
+            const seconds = (now - renderStats.last) / 1000;
+            renderOverlay.textContent =
+                `render ${(renderStats.frames / seconds).toFixed(0)} fps | ` +
+                `${(renderStats.messages / seconds).toFixed(0)} msg/s | ` +
+                `queue ${renderStats.maxQueue} | ` +
+                `frame ${renderStats.maxFrameMs.toFixed(1)} ms`;
+            renderOverlay.classList.toggle('text-light-error', renderStats.maxFrameMs > 16 || renderStats.maxQueue > 500);
+            renderStats.frames = 0;
+            renderStats.messages = 0;
+            renderStats.maxQueue = 0;
+            renderStats.maxFrameMs = 0;
+            renderStats.last = now;
         }
+        setInterval(updateOverlay, 1000);
 
         ws.onopen = function(event) {
-            // 모든 textarea에 연결 상태 메시지 추가
+            connectedAt = clockOrigin + performance.now();
+            // 현재 탭 토픽 구독 (첫 구독 요청에 서버가 server_info, 스냅샷, 최근 패킷을 보냄)
+            subscribedTopics = new Set();
+            updateSubscription();
+
+            // 모든 로그 창에 연결 상태 메시지 추가
             addMessage(fccCiphertext, 'WebSocket 연결됨', 'status');
             addMessage(fccPlaintext, 'WebSocket 연결됨', 'status');
             addMessage(fccMavlink, 'WebSocket 연결됨', 'status');
@@ -337,191 +1255,115 @@ async def index_handler(request):
         };
 
         ws.onmessage = function(event) {
-            const data = JSON.parse(event.data);
+            pendingMessages.push(event.data);
+            pendingReceived.push(performance.now());
+            if (pendingMessages.length >= MAX_PENDING_MESSAGES) {
+                processMessages();
+            }
+            scheduleRender();
+        };
+
+        function handleMessage(data) {
+            if (data.type === 'snapshot') {
+                // 접속 시 서버가 보내는 최근 통계 시계열과 최신 DSM 상태
+                // 서버 시간 기준 timestamp 를 브라우저 시간으로 변환
+                const offset = Date.now() - (data.now || Date.now());
+                for (const [key, points] of Object.entries(data.metrics || {})) {
+                    const [source, packetType, link] = key.split('.');
+                    if (!acceptLink({ link: Number(link) }) || !isMetricSeries(source, packetType)) continue;
+                    for (const [time, entropy, chiSquare] of points) {
+                        addMetricPoint(source, packetType, entropy, chiSquare, time + offset);
+                    }
+                }
+                for (const state of data.states || []) handleMessage(state);
+                return;
+            }
+
+            if (data.type === 'server_info') {
+                serverMetrics = !!data.metrics;
+                latencyReports = !!data.latency;
+                if (data.metric_points && data.metric_points !== metricCapacity) {
+                    metricCapacity = data.metric_points;
+                    for (const metrics of metricData) {
+                        metrics.plaintext.resize(metricCapacity);
+                        metrics.ciphertext.resize(metricCapacity);
+                    }
+                }
+                if (data.log_lines && data.log_lines !== logCapacity) {
+                    logCapacity = data.log_lines;
+                    for (const view of logViews.values()) view.resize(logCapacity);
+                }
+                updateSubscription();
+                return;
+            }
+
+            if (data.type === 'metrics') {
+                // 서버에서 계산한 패킷 통계 (이동 평균 적용됨)
+                if (!acceptLink(data)) return;
+                addMetricPoint(data.source, data.packet_type, data.smoothed_entropy, data.smoothed_reduced_chi_square);
+                if (data.window_bytes !== undefined && windowStats[data.source]) {
+                    windowStats[data.source][data.packet_type] = data;
+                }
+                return;
+            }
 
             if (data.type === 'status') {
-                // 모든 textarea에 상태 메시지 추가
-                addMessage(fccCiphertext, data.message, 'status');
-                addMessage(fccPlaintext, data.message, 'status');
-                addMessage(fccMavlink, data.message, 'status');
-                addMessage(gcsCiphertext, data.message, 'status');
-                addMessage(gcsPlaintext, data.message, 'status');
-                addMessage(gcsMavlink, data.message, 'status');
+                // 상태 메시지는 모든 link 것을 표시 (link 가 여러 개이면 link 번호를 붙임)
+                acceptLink(data);
+                const message = knownLinks.size > 1 ? `[Link ${data.link || 0}] ${data.message}` : data.message;
+                // 모든 로그 창에 상태 메시지 추가
+                addMessage(fccCiphertext, message, 'status');
+                addMessage(fccPlaintext, message, 'status');
+                addMessage(fccMavlink, message, 'status');
+                addMessage(gcsCiphertext, message, 'status');
+                addMessage(gcsPlaintext, message, 'status');
+                addMessage(gcsMavlink, message, 'status');
                 return;
             } 
 
+            if (data.type === 'state') {
+                // DSM 상태: client.py 가 보낸 변경분 (full=false 이면 이전 상태에 덮어씀, 스냅샷/재구독/밀린 경우는 full=true 전체 상태)
+                const link = data.link || 0;
+                const previous = dsmStates.get(link) || {};
+                const fields = data.full ? data.fields : { ...previous, ...data.fields };
+                dsmStates.set(link, fields);
+                if (!acceptLink(data)) return;
+                // 상태/TLS 정보가 바뀌었을 때만 Recent Activity 에 기록 (카운터는 매번 바뀜)
+                const changes = DSM_TEXT_FIELDS.filter(field => field in fields && fields[field] !== previous[field]);
+                if (changes.length) {
+                    addMessage(activeLog, '[DSM] ' + changes.map(field => `${field}=${fields[field]}`).join(' '), 'status');
+                }
+                renderState(fields);
+                return;
+            }
+
             if (data.type === 'packet') {
-                // 패킷의 소스(FCC/GCS)와 타입에 따라 적절한 textarea에 출력
+                if (!acceptLink(data)) return;
+                // 패킷의 소스(FCC/GCS)와 타입에 따라 적절한 로그 창에 출력
                 const source = data.source || 'fcc'; // 기본값은 fcc
 
-                if (data.packet_type === 'state') {
-                    // data.data type print
-                    // 상태 정보는 active-log에 출력
-                    const activeLog = document.getElementById('active-log');
-                    addMessage(activeLog, `[${source.toUpperCase()}] ${data.data}`, 'status');
-                    let cleanedState = {};
-                    if (typeof data.data === 'string') {
-                        // prepare string for JSON parsing
-                        cleanedState = data.data.trim().replace(/^b['"]/, '').replace(/['"]$/, '');
-
-                    } else  {
-                        // data.data[0] is already a object
-                        cleanedState = data.data[0];
-                    }
-                    JSON.parse(cleanedState, (key, value) => {
-                        // console.log(`Key: ${key}, Value: ${value}`);
-                        if (key === 'state') {
-                            document.getElementById('dsm-status').innerText = value;
-                        }
-                        if (key === 'tls_ver') {
-                            document.getElementById('dsm-tls-version').innerText = value;
-                        }
-                        if (key === 'kem') {
-                            document.getElementById('dsm-kem').innerText = value;
-                        }
-                        if (key === 'sig') {
-                            document.getElementById('dsm-sig').innerText = value;
-                        }
-                        if (key === 'ciphersuite') {
-                            document.getElementById('dsm-ciphersuite').innerText = value;
-                        }
-                        if (key === 'tx_packets') {
-                            document.getElementById('tx-packets').innerText = value;
-                        }
-                        if (key === 'rx_packets') {
-                            document.getElementById('rx-packets').innerText = value;
-                        }
-                        if (key === 'tx_bytes') {
-                            document.getElementById('tx-bytes').innerText = value;
-                        }
-                        if (key === 'rx_bytes') {
-                            document.getElementById('rx-bytes').innerText = value;
-                        }
-                    });
-                    return;
-                }
-                if (data.packet_type === 'ciphertext') {
-                    const targetTextarea = source === 'fcc' ? fccCiphertext : gcsCiphertext;
+                if (data.packet_type === 'ciphertext' || data.packet_type === 'plaintext') {
+                    const isCipher = data.packet_type === 'ciphertext';
+                    const targetTextarea = source === 'fcc' ?
+                        (isCipher ? fccCiphertext : fccPlaintext) :
+                        (isCipher ? gcsCiphertext : gcsPlaintext);
                     // addMessage(targetTextarea, `CMD=${data.cmd} SEQ=${data.seq} LEN=${data.length}`, 'packet-header');
-                    addMessage(targetTextarea, data.data, 'packet-data');
-
-                    // Calculate and store entropy for packets
-                    if (source === 'fcc') {
-                        const entropy = calculateEntropy(data.data);
-                        fccSmoothedEntropy = fccSmoothedEntropy * (1.0 - movingAverageWeight) + entropy * movingAverageWeight; // Simple moving average
-                        console.log(`Entropy: ${entropy}`);
-                        //entropyData.ciphertext.push(entropy);
-                        entropyData.ciphertext.push(fccSmoothedEntropy);
-                        entropyData.timestamps.push(new Date());
-
-                        // Calculate and store chi-square for packets
-                        //const chiSquare = calculateChiSquare(data.data);
-                        const chiSquare = calculateReducedChiSquare(data.data);
-                        fccSmoothedChiSquare = fccSmoothedChiSquare * (1.0 - movingAverageWeight) + chiSquare * movingAverageWeight; // Simple moving average
-                        console.log(`Ciphertext Chi-Square: ${chiSquare}`);
-                        //chiSquareData.ciphertext.push(chiSquare);
-                        chiSquareData.ciphertext.push(fccSmoothedChiSquare);
-                        chiSquareData.timestamps.push(new Date());
-
-                        // Limit data points for performance
-                        if (entropyData.ciphertext.length > maxDataPoints) {
-                            entropyData.ciphertext.shift();
-                            entropyData.timestamps.shift();
-                            chiSquareData.ciphertext.shift();
-                            chiSquareData.timestamps.shift();
-                        }
-                    } else if (source === 'gcs') {
-                        if (data.data === null || data.data.length === 0) return;
-                        const entropy = calculateEntropy(data.data);
-                        gcsSmoothedEntropy = gcsSmoothedEntropy * (1.0 - movingAverageWeight) + entropy * movingAverageWeight; // Simple moving average
-                        gcsEntropyData.ciphertext.push(gcsSmoothedEntropy);
-                        gcsEntropyData.timestamps.push(new Date());
-
-                        // Calculate and store chi-square for packets
-                        //const chiSquare = calculateChiSquare(data.data);
-                        const chiSquare = calculateReducedChiSquare(data.data);
-                        console.log(`Ciphertext Chi-Square: ${chiSquare}`);
-                        gcsSmoothedChiSquare = gcsSmoothedChiSquare * (1.0 - movingAverageWeight) + chiSquare * movingAverageWeight; // Simple moving average
-                        gcsChiSquareData.ciphertext.push(gcsSmoothedChiSquare);
-                        gcsChiSquareData.timestamps.push(new Date());
-
-                        // Limit data points for performance
-                        if (gcsEntropyData.ciphertext.length > maxDataPoints) {
-                            gcsEntropyData.ciphertext.shift();
-                            gcsEntropyData.timestamps.shift();
-                            gcsChiSquareData.ciphertext.shift();
-                            gcsChiSquareData.timestamps.shift();
-                        }
-                    }
-                    updateEntropyChart(source);
-                    updateChiSquareChart(source);
-                } else if (data.packet_type === 'plaintext') {
-                    const targetTextarea = source === 'fcc' ? fccPlaintext : gcsPlaintext;
-                    //addMessage(targetTextarea, `CMD=${data.cmd} SEQ=${data.seq} LEN=${data.length}`, 'packet-header');
-                    addMessage(targetTextarea, data.data, 'packet-data');
-
-                    // Calculate and store entropy for packets
-                    if (source === 'fcc') {
-                        const entropy = calculateEntropy(data.data);
-                        fccSmoothedEntropy2 = fccSmoothedEntropy2 * (1.0 - movingAverageWeight) + entropy * movingAverageWeight; // Simple moving average
-                        //entropyData.plaintext.push(entropy);
-                        entropyData.plaintext.push(fccSmoothedEntropy2);
-
-                        // Calculate and store chi-square for packets
-                        //const chiSquare = calculateChiSquare(data.data);
-                        const chiSquare = calculateReducedChiSquare(data.data);
-                        console.log(`Plaintext Chi-Square: ${chiSquare}`);
-                        fccSmoothedChiSquare2 = fccSmoothedChiSquare2 * (1.0 - movingAverageWeight) + chiSquare * movingAverageWeight;
-                        //chiSquareData.plaintext.push(chiSquare);
-                        chiSquareData.plaintext.push(fccSmoothedChiSquare2);
-
-                        // Limit data points for performance
-                        if (entropyData.plaintext.length > maxDataPoints) {
-                            entropyData.plaintext.shift();
-                            chiSquareData.plaintext.shift();
-                            if (entropyData.plaintext.length < entropyData.ciphertext.length) {
-                                entropyData.ciphertext.shift();
-                                chiSquareData.ciphertext.shift();
-                            }
-                        }
-                    } else if (source === 'gcs') {
-                        const entropy = calculateEntropy(data.data);
-                        gcsSmoothedEntropy2 = gcsSmoothedEntropy2 * (1.0 - movingAverageWeight) + entropy * movingAverageWeight;
-                        //gcsEntropyData.plaintext.push(entropy);
-                        gcsEntropyData.plaintext.push(gcsSmoothedEntropy2);
-
-                        // Calculate and store chi-square for packets
-                        //const chiSquare = calculateChiSquare(data.data);
-                        const chiSquare = calculateReducedChiSquare(data.data);
-                        console.log(`Plaintext Chi-Square: ${chiSquare}`);
-                        gcsSmoothedChiSquare2 = gcsSmoothedChiSquare2 * (1.0 - movingAverageWeight) + chiSquare * movingAverageWeight;
-                        //gcsChiSquareData.plaintext.push(chiSquare);
-                        gcsChiSquareData.plaintext.push(gcsSmoothedChiSquare2);
-
-                        // Limit data points for performance
-                        if (gcsEntropyData.plaintext.length > maxDataPoints) {
-                            gcsEntropyData.plaintext.shift();
-                            gcsChiSquareData.plaintext.shift();
-                            if (gcsEntropyData.plaintext.length < gcsEntropyData.ciphertext.length) {
-                                gcsEntropyData.ciphertext.shift();
-                                gcsChiSquareData.ciphertext.shift();
-                            }
-                        }
+                    addMessage(targetTextarea, packetText(data), 'packet-data');
 
+                    if (!serverMetrics && isMetricSeries(source, data.packet_type)) {
+                        // 출력 후 마지막에 전달 (바이너리 메시지 버퍼는 transfer 되어 더 이상 사용할 수 없음)
+                        postPacketStats(data);
                     }
-                    updateEntropyChart(source);
-                    updateChiSquareChart(source);
                 } else if (data.packet_type === 'mavlink') {
-                    const targetTextarea = source === 'fcc' ? fccMavlink : gcsMavlink;
-                    //addMessage(targetTextarea, `CMD=${data.cmd} SEQ=${data.seq} LEN=${data.length}`, 'packet-header');
-                    addMessage(targetTextarea, JSON.stringify(data.data, null, 2), 'packet-data');
+                    // 들여쓰기 출력은 worker 에서 만들어 돌려줌 (statsWorker.onmessage)
+                    statsWorker.postMessage({ kind: 'mavlink', source: source, messages: data.data });
                 } else {
                     // 기본적으로 FCC ciphertext에 출력
                     addMessage(fccCiphertext, `CMD=${data.cmd} SEQ=${data.seq} LEN=${data.length}`, 'packet-header');
-                    addMessage(fccCiphertext, data.data, 'packet-data');
+                    addMessage(fccCiphertext, packetText(data), 'packet-data');
                 }
             }
-        };
+        }
 
         ws.onclose = function(event) {
             addMessage(fccCiphertext, 'WebSocket 연결 종료', 'status');
@@ -542,101 +1384,138 @@ async def index_handler(request):
         };
 
         // Entropy calculation and visualization
-        let entropyData = {
-            plaintext: [],
-            ciphertext: [],
-            timestamps: []
-        };
-
-        let gcsEntropyData = {
-            plaintext: [],
-            ciphertext: [],
-            timestamps: []
-        };
-
-        let chiSquareData = {
-            plaintext: [],
-            ciphertext: [],
-            timestamps: []
-        };
-
-        let gcsChiSquareData = {
-            plaintext: [],
-            ciphertext: [],
-            timestamps: []
-        };
-
-        let maxDataPoints = 50;
+        // 통계 시계열 창 크기 (server_info.metric_points 로 변경)
+        let metricCapacity = 10000;
+
+        // 고정 크기 원형 버퍼 시계열 (시간/값 Float64Array). push 는 O(1), 가득 차면 가장 오래된 점을 덮어씀
+        class MetricSeries {
+            constructor(capacity) {
+                this.times = new Float64Array(capacity);
+                this.values = new Float64Array(capacity);
+                this.start = 0;
+                this.count = 0;
+            }
 
-        // Chart state management object
-        let chartStates = {
-            'fcc-entropy-chart': { initialized: false, svg: null, scales: null, lines: null },
-            'gcs-entropy-chart': { initialized: false, svg: null, scales: null, lines: null },
-            'fcc-chisquare-chart': { initialized: false, svg: null, scales: null, lines: null },
-            'gcs-chisquare-chart': { initialized: false, svg: null, scales: null, lines: null }
-        };
+            push(time, value) {
+                const capacity = this.values.length;
+                const i = (this.start + this.count) % capacity;
+                this.times[i] = time;
+                this.values[i] = value;
+                if (this.count < capacity) {
+                    this.count++;
+                } else {
+                    this.start = (this.start + 1) % capacity;
+                }
+            }
 
-        function calculateEntropy(data) {
-            if (!data || data.length === 0) return 0;
+            time(i) {
+                return this.times[(this.start + i) % this.times.length];
+            }
 
-            // Convert string to bytes if needed
-            const bytes = typeof data === 'string' ?
-                new TextEncoder().encode(data) : data;
+            value(i) {
+                return this.values[(this.start + i) % this.values.length];
+            }
 
-            // Count frequency of each byte value
-            const frequencies = new Array(256).fill(0);
-            for (let i = 0; i < bytes.length; i++) {
-                frequencies[bytes[i]]++;
+            clear() {
+                this.start = 0;
+                this.count = 0;
             }
 
-            // Calculate entropy using Shannon formula
-            let entropy = 0.0;
-            const len = bytes.length;
-            for (let i = 0; i < 256; i++) {
-                if (frequencies[i] > 0) {
-                    const prob = frequencies[i] / len;
-                    entropy -= prob * Math.log2(prob);
+            resize(capacity) {
+                const keep = Math.min(this.count, capacity);
+                const times = new Float64Array(capacity);
+                const values = new Float64Array(capacity);
+                for (let i = 0; i < keep; i++) {
+                    times[i] = this.time(this.count - keep + i);
+                    values[i] = this.value(this.count - keep + i);
                 }
+                this.times = times;
+                this.values = values;
+                this.start = 0;
+                this.count = keep;
             }
 
-            return entropy;
+            // [t0, t1] 구간을 buckets 개(차트 픽셀 폭)로 나누어 구간별 min/max 점만 반환: [[time, value], ...]
+            decimate(t0, t1, buckets) {
+                const points = [];
+                const times = this.times;
+                const values = this.values;
+                const capacity = values.length;
+                const start = this.start;
+                const count = this.count;
+                if (count <= buckets * 2) {
+                    for (let n = 0, i = start; n < count; n++, i = i + 1 === capacity ? 0 : i + 1) {
+                        points.push([times[i], values[i]]);
+                    }
+                    return points;
+                }
+                const scale = buckets / Math.max(t1 - t0, 1);
+                let bucket = -1;
+                let minN = 0;
+                let maxN = 0;
+                let minValue = 0;
+                let maxValue = 0;
+                // n === count 에서 마지막 구간을 내보냄
+                for (let n = 0, i = start; n <= count; n++, i = i + 1 === capacity ? 0 : i + 1) {
+                    const b = n < count ? Math.min(Math.floor((times[i] - t0) * scale), buckets - 1) : -1;
+                    if (b !== bucket) {
+                        if (bucket >= 0) {
+                            const first = (start + Math.min(minN, maxN)) % capacity;
+                            const last = (start + Math.max(minN, maxN)) % capacity;
+                            points.push([times[first], values[first]]);
+                            if (last !== first) points.push([times[last], values[last]]);
+                        }
+                        bucket = b;
+                        minN = maxN = n;
+                        minValue = maxValue = values[i];
+                        continue;
+                    }
+                    const value = values[i];
+                    if (value < minValue) {
+                        minValue = value;
+                        minN = n;
+                    }
+                    if (value > maxValue) {
+                        maxValue = value;
+                        maxN = n;
+                    }
+                }
+                return points;
+            }
         }
 
-        function calculateChiSquare(data) {
-            if (!data || data.length === 0) return 0;
-
-            // Convert string to bytes if needed
-            const bytes = typeof data === 'string' ?
-                new TextEncoder().encode(data) : data;
-
-            if (bytes.length === 0) return 0;
+        function newMetricData() {
+            return {
+                plaintext: new MetricSeries(metricCapacity),
+                ciphertext: new MetricSeries(metricCapacity)
+            };
+        }
 
-            // Count frequency of each byte value (0-255)
-            const observed = new Array(256).fill(0);
-            for (let i = 0; i < bytes.length; i++) {
-                observed[bytes[i]]++;
-            }
+        const entropyData = newMetricData();
+        const gcsEntropyData = newMetricData();
+        const chiSquareData = newMetricData();
+        const gcsChiSquareData = newMetricData();
+        const metricData = [entropyData, gcsEntropyData, chiSquareData, gcsChiSquareData];
 
-            // Expected frequency for uniform distribution
-            const expected = bytes.length / 256;
+        // Chart state management object
+        let chartStates = {
+            'fcc-entropy-chart': { initialized: false, svg: null, scales: null, lines: null },
+            'gcs-entropy-chart': { initialized: false, svg: null, scales: null, lines: null },
+            'fcc-chisquare-chart': { initialized: false, svg: null, scales: null, lines: null },
+            'gcs-chisquare-chart': { initialized: false, svg: null, scales: null, lines: null }
+        };
 
-            // Calculate chi-square statistic
-            let chiSquare = 0.0;
-            for (let i = 0; i < 256; i++) {
-                if (expected > 0) {
-                    const diff = observed[i] - expected;
-                    chiSquare += (diff * diff) / expected;
-                }
-            }
+        // 차트 데이터에 통계 값 추가 (평문/암호문 시리즈는 시간 축으로 정렬되므로 따로 자르지 않음)
+        function addMetricPoint(source, packetType, entropy, chiSquare, time = Date.now()) {
+            const eData = source === 'fcc' ? entropyData : gcsEntropyData;
+            const cData = source === 'fcc' ? chiSquareData : gcsChiSquareData;
 
-            return chiSquare;
-        }
+            eData[packetType].push(time, entropy);
+            cData[packetType].push(time, chiSquare);
 
-        function calculateReducedChiSquare(data) {
-            if (!data || data.length === 0) return 0;
-            const reduced_data = data.filter(x => x !== "00");
-            const n = reduced_data.length;
-            return calculateChiSquare(reduced_data) / n;
+            // 차트는 renderFrame 에서 프레임당 한 번 갱신
+            dirtyCharts.add(source);
+            scheduleRender();
         }
 
         // Optimized chart initialization function - creates SVG structure once
@@ -657,8 +1536,8 @@ async def index_handler(request):
                 .attr("transform", `translate(${margin.left},${margin.top})`);
 
             // Create scales
-            const xScale = d3.scaleLinear()
-                .domain([0, maxDataPoints - 1])
+            const xScale = d3.scaleTime()
+                .domain([Date.now() - 60000, Date.now()])
                 .range([0, width]);
 
             const yScale = d3.scaleLinear()
@@ -667,13 +1546,13 @@ async def index_handler(request):
 
             // Create line generators
             const plainLine = d3.line()
-                .x((d, i) => xScale(i))
-                .y(d => yScale(d))
+                .x(d => xScale(d[0]))
+                .y(d => yScale(d[1]))
                 .curve(d3.curveMonotoneX);
 
             const cipherLine = d3.line()
-                .x((d, i) => xScale(i))
-                .y(d => yScale(d))
+                .x(d => xScale(d[0]))
+                .y(d => yScale(d[1]))
                 .curve(d3.curveMonotoneX);
 
             // Add axes groups
@@ -700,7 +1579,7 @@ async def index_handler(request):
                 .attr("transform", `translate(${width / 2}, ${height + margin.bottom})`)
                 .style("text-anchor", "middle")
                 .style("font-size", "12px")
-                .text("Packet Number");
+                .text("Time");
 
             // Add line paths (initially empty)
             g.append("path")
@@ -786,7 +1665,7 @@ async def index_handler(request):
 
             // Hide/show "no data" message
             const noDataText = state.g.select(".no-data-text");
-            if (data.plaintext.length === 0 && data.ciphertext.length === 0) {
+            if (data.plaintext.count === 0 && data.ciphertext.count === 0) {
                 noDataText.style("display", "block");
                 state.g.select(".plaintext-line").attr("d", null);
                 state.g.select(".ciphertext-line").attr("d", null);
@@ -795,44 +1674,40 @@ async def index_handler(request):
                 noDataText.style("display", "none");
             }
 
-            // Update scales
-            const maxDataLength = Math.max(data.plaintext.length, data.ciphertext.length);
-            if (maxDataLength > 0) {
-                state.xScale.domain([0, Math.max(maxDataLength - 1, 1)]);
-            }
+            // Update scales (두 시리즈를 같은 시간 축에 표시)
+            const series = [data.plaintext, data.ciphertext].filter(s => s.count > 0);
+            const t0 = Math.min(...series.map(s => s.time(0)));
+            const t1 = Math.max(...series.map(s => s.time(s.count - 1)));
+            state.xScale.domain([t0, Math.max(t1, t0 + 1)]);
+
+            // 픽셀 폭 단위로 줄인 점만 그림
+            const buckets = Math.max(1, Math.floor(state.width));
+            const plainPoints = data.plaintext.decimate(t0, t1, buckets);
+            const cipherPoints = data.ciphertext.decimate(t0, t1, buckets);
 
             const maxValue = Math.max(
-                d3.max(data.plaintext) || 0,
-                d3.max(data.ciphertext) || 0,
+                d3.max(plainPoints, d => d[1]) || 0,
+                d3.max(cipherPoints, d => d[1]) || 0,
                 state.defaultMaxValue
             );
             state.yScale.domain([0, maxValue]);
 
-            // Update line generators with new scales
-            state.plainLine
-                .x((d, i) => state.xScale(i))
-                .y(d => state.yScale(d));
-
-            state.cipherLine
-                .x((d, i) => state.xScale(i))
-                .y(d => state.yScale(d));
-
             // Update axes
             state.xAxisGroup.call(d3.axisBottom(state.xScale));
             state.yAxisGroup.call(d3.axisLeft(state.yScale));
 
             // Update line paths
-            if (data.plaintext.length > 0) {
+            if (plainPoints.length > 0) {
                 state.g.select(".plaintext-line")
-                    .datum(data.plaintext)
+                    .datum(plainPoints)
                     .attr("d", state.plainLine);
             } else {
                 state.g.select(".plaintext-line").attr("d", null);
             }
 
-            if (data.ciphertext.length > 0) {
+            if (cipherPoints.length > 0) {
                 state.g.select(".ciphertext-line")
-                    .datum(data.ciphertext)
+                    .datum(cipherPoints)
                     .attr("d", state.cipherLine);
             } else {
                 state.g.select(".ciphertext-line").attr("d", null);
@@ -903,35 +1778,163 @@ async def index_handler(request):
 </body>
 </html>
     """
-    return web.Response(text=html_content, content_type='text/html')
+
+async def index_handler(request):
+    """미리 만들어 둔 index 페이지 (압축본, ETag, 매번 재검증)"""
+    return request.app['index_page'].response(request, REVALIDATE_CACHE)
+
+async def log_relay_summary():
+    """LOG_INTERVAL 초마다 중계 요약 로그 (frames, bytes, clients, 버린 메시지 수)"""
+    while True:
+        await asyncio.sleep(LOG_INTERVAL)
+        frames, messages, nbytes, elapsed = relay_stats.take()
+        dropped = sum(queue.dropped for queue in client_queues.values())
+        logger.info("relay: frames=%d (%.0f/s) messages=%d (%.0f/s) bytes=%d (%.0f/s) "
+                    "clients=%d producers=%d dropped_total=%d",
+                    frames, frames / elapsed, messages, messages / elapsed, nbytes, nbytes / elapsed,
+                    len(websocket_clients) - len(producer_clients), len(producer_clients), dropped)
+        if latency_stats:
+            stages = latency_stats.summary()["stages"]
+            parts = [f"{stage}={summary['p50']}/{summary['p99']}" for stage, summary in stages.items() if summary["count"]]
+            if parts:
+                logger.info("latency p50/p99 ms: %s", " ".join(parts))
+
+async def publish_worker_stats():
+    """BUS_STATS_INTERVAL 초마다 이 워커의 클라이언트 상태를 다른 워커에 보냄 (/stats)"""
+    while True:
+        await asyncio.sleep(BUS_STATS_INTERVAL)
+        bus.publish(BUS_STATS, json.dumps({"worker": worker_id, "clients": local_client_stats()}).encode('utf-8'))
+
+def start_ingest(app):
+    """INGEST_TARGETS 대상에 직접 연결하는 task 시작 (client 모듈은 이때 import, 워커 모드에서는 워커 0 만)"""
+    try:
+        import ingest
+        targets = ingest.client.parse_targets(INGEST_TARGETS)
+    except (ImportError, ValueError) as e:
+        logger.error("INGEST_TARGETS=%s disabled: %s", INGEST_TARGETS, e)
+        return
+    logger.info("In-process ingest from %s", ", ".join(str(target) for target in targets))
+    app['ingest'] = asyncio.create_task(ingest.run_ingest(targets, relay_ingest))
+
+async def start_background_tasks(app):
+    app['log_relay_summary'] = asyncio.create_task(log_relay_summary())
+    if bus:
+        app['publish_worker_stats'] = asyncio.create_task(publish_worker_stats())
+    if INGEST_TARGETS and worker_id in (None, 0):
+        start_ingest(app)
+
+async def cleanup_background_tasks(app):
+    app['log_relay_summary'].cancel()
+    for name in ('publish_worker_stats', 'ingest'):
+        if name in app:
+            app[name].cancel()
 
 def create_app():
     app = web.Application()
+    # 정적 파일 읽기/압축은 요청을 받기 전에 끝냄 (첫 요청이 이벤트 루프에서 압축하지 않도록)
+    static_assets.preload()
+    app['index_page'] = CachedBody(static_assets.versioned(INDEX_HTML).encode('utf-8'), 'text/html')
+    app.on_startup.append(start_background_tasks)
+    app.on_cleanup.append(cleanup_background_tasks)
     app.router.add_get('/', index_handler)
     app.router.add_get('/ws', websocket_handler)
+    app.router.add_get('/stats', stats_handler)
+    app.router.add_get('/metrics', metrics_handler)
     app.router.add_get('/static/{filename}', static_handler)
     return app
 
-async def main():
-    print(f"Starting visualizing server on {HOST}:{WEB_PORT}")
+async def main(worker=None):
+    """서버 실행, worker 가 있으면 WORKERS 모드의 워커 (SO_REUSEPORT, hub 연결이 끊기면 종료)"""
+    global logger, worker_id, bus
+    if worker is not None:
+        worker_id = worker
+        logger = logging.getLogger(f"dsm-viz.worker{worker}")
+        bus = BusClient(BUS_PATH, handle_bus_record)
+        await bus.connect()
+    logger.info("Starting visualizing server on %s:%d (relay mode: %s)", HOST, WEB_PORT, RELAY_MODE)
 
     app = create_app()
     runner = web.AppRunner(app)
     await runner.setup()
 
-    site = web.TCPSite(runner, HOST, WEB_PORT)
+    site = web.TCPSite(runner, HOST, WEB_PORT, reuse_port=bus is not None)
     await site.start()
 
-    print(f"Web server running on http://{HOST}:{WEB_PORT}")
-    print(f"WebSocket server running on ws://{HOST}:{WEB_PORT}/ws")
-    print("Press Ctrl+C to stop")
+    logger.info("Web server running on http://%s:%d", HOST, WEB_PORT)
+    logger.info("WebSocket server running on ws://%s:%d/ws", HOST, WEB_PORT)
+    if bus is None:
+        print("Press Ctrl+C to stop")
 
     try:
-        await asyncio.Future()  # run forever
+        if bus:
+            await bus.run()
+            logger.warning("bus hub closed, stopping worker")
+        else:
+            await asyncio.Future()  # run forever
     except KeyboardInterrupt:
-        print("\nStopping server...")
+        logger.info("Stopping server...")
     finally:
         await runner.cleanup()
 
+def run_worker(worker):
+    try:
+        asyncio.run(main(worker))
+    except KeyboardInterrupt:
+        pass
+
+async def run_hub(workers):
+    """버스 hub 실행, SIGTERM 을 받으면 0, 워커가 하나라도 종료되면 1 반환"""
+    hub = BusHub(BUS_PATH)
+    await hub.start()
+    stop = asyncio.Event()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    logger.info("Bus hub on %s, workers=%d", BUS_PATH, len(workers))
+    print("Press Ctrl+C to stop")
+    logged = time.monotonic()
+    try:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), 1.0)
+            except asyncio.TimeoutError:
+                pass
+            dead = [w for w in workers if not w.is_alive()]
+            if dead:
+                logger.error("worker exited: %s, stopping server",
+                             ", ".join(f"{w.name} (exitcode {w.exitcode})" for w in dead))
+                return 1
+            if time.monotonic() - logged >= LOG_INTERVAL:
+                logged = time.monotonic()
+                logger.info("bus: records=%d dropped=%d workers=%d", hub.records, hub.dropped, len(hub.peers))
+        return 0
+    finally:
+        await hub.close()
+
+def run_workers(count):
+    """WORKERS 모드: 워커 count 개가 SO_REUSEPORT 로 WEB_PORT 를 나누어 받고 이 프로세스는 버스 hub 실행
+
+    producer 메시지를 받은 워커가 버스에 한 번 보내면 모든 워커가 각자 중계하므로 (통계/상태/스냅샷 포함)
+    대시보드별 큐/전송 비용이 워커(코어)에 나뉜다. 중계 전 처리(inspect 모드의 통계 계산)는 워커마다 한다.
+    """
+    # 이벤트 루프를 만들기 전에 fork
+    ctx = multiprocessing.get_context('fork')
+    workers = [ctx.Process(target=run_worker, args=(i,), name=f"worker-{i}", daemon=True) for i in range(count)]
+    for worker in workers:
+        worker.start()
+    try:
+        return asyncio.run(run_hub(workers))
+    except KeyboardInterrupt:
+        logger.info("Stopping server...")
+        return 0
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+        for worker in workers:
+            worker.join()
+
 if __name__ == "__main__":
+    if WORKERS > 1 and hasattr(socket, 'SO_REUSEPORT'):
+        raise SystemExit(run_workers(WORKERS))
+    if WORKERS > 1:
+        logger.warning("WORKERS=%d requires SO_REUSEPORT, running a single process", WORKERS)
     asyncio.run(main())
@@ -0,0 +1,120 @@
+// 대시보드 통계/MAVLink 출력 Web Worker
+//
+// 메인 스레드(server.py 대시보드)는 패킷 바이트와 MAVLink 메시지를 보내고 작은 결과만 받는다.
+//   {kind: 'stats', source, packetType, time, buffer, offset, length}  바이너리 패킷 (buffer 는 transfer)
+//   {kind: 'stats', source, packetType, time, hex}                     JSON 패킷 (hex 문자열 배열)
+//     -> {kind: 'stats', source, packetType, time, entropy, chiSquare} 이동 평균 적용 값
+//   {kind: 'mavlink', source, messages}  -> {kind: 'mavlink', source, text}
+//   {kind: 'config', movingAverageWeight}
+//   {kind: 'reset'}  이동 평균 초기화 (대시보드에서 표시할 link 를 바꿀 때)
+
+let movingAverageWeight = 0.3;
+
+// 이동 평균 상태 [source][packetType]
+const smoothedMetrics = {
+    fcc: { plaintext: { entropy: 0, chiSquare: 0 }, ciphertext: { entropy: 0, chiSquare: 0 } },
+    gcs: { plaintext: { entropy: 0, chiSquare: 0 }, ciphertext: { entropy: 0, chiSquare: 0 } }
+};
+
+const counts = new Uint32Array(256);
+
+// hex 문자열 -> 바이트 값 (parseInt 없이)
+const HEX_VALUES = new Map(Array.from({length: 256}, (_, i) => [i.toString(16).padStart(2, '0'), i]));
+
+function countBytes(bytes) {
+    counts.fill(0);
+    for (let i = 0; i < bytes.length; i++) {
+        counts[bytes[i]]++;
+    }
+}
+
+function countHex(hex) {
+    counts.fill(0);
+    for (let i = 0; i < hex.length; i++) {
+        counts[HEX_VALUES.get(hex[i]) ?? parseInt(hex[i], 16)]++;
+    }
+}
+
+// Shannon 엔트로피 (bits/byte)
+function calculateEntropy(n) {
+    let entropy = 0.0;
+    for (let i = 0; i < 256; i++) {
+        if (counts[i] > 0) {
+            const prob = counts[i] / n;
+            entropy -= prob * Math.log2(prob);
+        }
+    }
+    return entropy;
+}
+
+// 0x00 바이트를 제외한 카이제곱 / 바이트 수 (analysis.reduced_chi_square 와 같은 값)
+function calculateReducedChiSquare(n) {
+    const reduced = n - counts[0];
+    if (reduced === 0) return 0;
+    const expected = reduced / 256;
+    let chiSquare = expected;  // 0x00 자리: (0 - expected)^2 / expected
+    for (let i = 1; i < 256; i++) {
+        const diff = counts[i] - expected;
+        chiSquare += (diff * diff) / expected;
+    }
+    return chiSquare / reduced;
+}
+
+function packetStats(msg) {
+    let n;
+    if (msg.buffer) {
+        const bytes = new Uint8Array(msg.buffer, msg.offset, msg.length);
+        countBytes(bytes);
+        n = bytes.length;
+    } else {
+        countHex(msg.hex);
+        n = msg.hex.length;
+    }
+    if (n === 0) return null;
+
+    const smoothed = smoothedMetrics[msg.source][msg.packetType];
+    const w = movingAverageWeight;
+    smoothed.entropy = smoothed.entropy * (1.0 - w) + calculateEntropy(n) * w;
+    smoothed.chiSquare = smoothed.chiSquare * (1.0 - w) + calculateReducedChiSquare(n) * w;
+    return {
+        kind: 'stats',
+        source: msg.source,
+        packetType: msg.packetType,
+        time: msg.time,
+        entropy: smoothed.entropy,
+        chiSquare: smoothed.chiSquare
+    };
+}
+
+// client.py 는 메시지마다 msg.to_json() 문자열을 보내므로 객체로 풀어서 들여쓰기
+function mavlinkText(messages) {
+    const parsed = messages.map(m => {
+        if (typeof m !== 'string') return m;
+        try {
+            return JSON.parse(m);
+        } catch (e) {
+            return m;
+        }
+    });
+    return JSON.stringify(parsed, null, 2);
+}
+
+self.onmessage = function(event) {
+    const msg = event.data;
+    if (msg.kind === 'stats') {
+        if (!smoothedMetrics[msg.source] || !smoothedMetrics[msg.source][msg.packetType]) return;
+        const result = packetStats(msg);
+        if (result) self.postMessage(result);
+    } else if (msg.kind === 'mavlink') {
+        self.postMessage({ kind: 'mavlink', source: msg.source, text: mavlinkText(msg.messages) });
+    } else if (msg.kind === 'config') {
+        movingAverageWeight = msg.movingAverageWeight;
+    } else if (msg.kind === 'reset') {
+        for (const source of Object.values(smoothedMetrics)) {
+            for (const smoothed of Object.values(source)) {
+                smoothed.entropy = 0;
+                smoothed.chiSquare = 0;
+            }
+        }
+    }
+};
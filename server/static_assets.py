@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""정적 파일 메모리 캐시와 조건부/압축 응답
+
+static/ 의 파일은 서버 시작 시 preload() 로 모두 읽어 ETag(내용 해시)와 압축본을 한 번만 만든다.
+실행 중 바뀐 파일은 요청 시 다시 읽으며, server.py 는 이때 get() 을 executor 에서 호출하여
+파일 읽기와 압축(brotli quality 11 등)이 이벤트 루프의 중계를 멈추지 않게 한다.
+build_static.py 가 만든 <파일>.br / <파일>.gz 가 원본보다 새로우면 그대로 쓰고, 없으면 메모리에서 압축한다.
+brotli 패키지는 선택 사항이다 (없으면 미리 만든 .br 만 사용, 나머지는 gzip).
+
+index 페이지의 /static/... 주소에는 ?v=<버전> 을 붙이므로, 그 주소로 온 요청은 1년 immutable 캐시로 응답하고
+버전 없는 요청과 index 페이지는 매번 ETag 로 재검증(no-cache, 304)한다.
+"""
+import gzip
+import hashlib
+import mimetypes
+import re
+from pathlib import Path
+
+from aiohttp import web
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+MIN_COMPRESS_SIZE = 256  # 이보다 작은 파일은 압축하지 않음 (bytes)
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}  # 선호 순서
+STATIC_URL = re.compile(r'/static/([\w.\-]+)')
+
+def compressible(content_type, body):
+    return content_type.startswith(COMPRESSIBLE_TYPES) and len(body) >= MIN_COMPRESS_SIZE
+
+def compress(body, encoding):
+    """build_static.py 와 같은 설정의 압축 (gzip 은 mtime 0 으로 같은 입력이면 같은 결과)"""
+    if encoding == "br":
+        return brotli.compress(body, quality=11)
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+def accepted_encodings(header):
+    """Accept-Encoding 헤더 -> 받을 수 있는 인코딩 set (q=0 은 제외)"""
+    encodings = set()
+    for item in header.split(','):
+        name, _, params = item.strip().partition(';')
+        q = params.strip()
+        if q.startswith('q='):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        encodings.add(name.strip().lower())
+    return encodings
+
+class CachedBody:
+    """응답 본문 1개의 인코딩별 bytes, 버전(내용 해시), 조건부 응답"""
+
+    def __init__(self, body, content_type, encoded=None):
+        self.content_type = content_type
+        self.version = hashlib.sha256(body).hexdigest()[:16]
+        self.bodies = {"identity": body}
+        if compressible(content_type, body):
+            for encoding in ENCODING_SUFFIXES:
+                if encoded and encoding in encoded:
+                    self.bodies[encoding] = encoded[encoding]
+                elif encoding == "gzip" or brotli is not None:
+                    self.bodies[encoding] = compress(body, encoding)
+
+    def etag(self, encoding):
+        # 인코딩마다 내용이 다르므로 ETag 도 다름
+        return f'"{self.version}"' if encoding == "identity" else f'"{self.version}-{encoding}"'
+
+    def choose(self, accept_encoding):
+        accepted = accepted_encodings(accept_encoding)
+        for encoding in ENCODING_SUFFIXES:
+            if encoding in self.bodies and encoding in accepted:
+                return encoding
+        return "identity"
+
+    def response(self, request, cache_control):
+        encoding = self.choose(request.headers.get('Accept-Encoding', ''))
+        etag = self.etag(encoding)
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if len(self.bodies) > 1:
+            headers["Vary"] = "Accept-Encoding"
+        if_none_match = request.headers.get('If-None-Match', '')
+        if if_none_match.strip() == '*' or etag in (tag.strip().removeprefix('W/') for tag in if_none_match.split(',')):
+            return web.Response(status=304, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        charset = 'utf-8' if self.content_type.startswith(COMPRESSIBLE_TYPES) else None
+        return web.Response(body=self.bodies[encoding], content_type=self.content_type, charset=charset,
+                            headers=headers)
+
+class StaticAssets:
+    """static/ 파일 캐시 (파일이 바뀌면 (mtime, 크기) 로 감지하여 다시 읽음)"""
+
+    def __init__(self, root):
+        self.root = Path(root).resolve()
+        self.cache = {}  # 파일 이름 -> ((mtime_ns, size), CachedBody)
+
+    def get(self, name):
+        """파일 이름 -> CachedBody, static/ 밖이거나 없거나 압축본 파일이면 None"""
+        path = (self.root / name).resolve()
+        if path.parent != self.root or not path.is_file() or path.suffix in ('.br', '.gz'):
+            return None
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self.cache.get(name)
+        if cached and cached[0] == key:
+            return cached[1]
+        encoded = {}
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            sidecar = path.with_name(path.name + suffix)
+            if sidecar.is_file() and sidecar.stat().st_mtime_ns >= stat.st_mtime_ns:
+                encoded[encoding] = sidecar.read_bytes()
+        content_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        asset = CachedBody(path.read_bytes(), content_type, encoded)
+        self.cache[name] = (key, asset)
+        return asset
+
+    def preload(self):
+        """static/ 의 모든 파일을 미리 읽고 압축 (시작 시 1회), 읽은 파일 수 반환"""
+        return sum(self.get(path.name) is not None for path in sorted(self.root.iterdir()))
+
+    def url(self, name):
+        """버전을 붙인 주소 (/static/<name>?v=<버전>), 파일이 없으면 원래 주소"""
+        asset = self.get(name)
+        return f"/static/{name}?v={asset.version}" if asset else f"/static/{name}"
+
+    def versioned(self, html):
+        """페이지의 /static/... 주소에 버전을 붙임"""
+        return STATIC_URL.sub(lambda m: self.url(m.group(1)), html)